@@ -1,16 +1,23 @@
 #!/bin/bash
 
 # Nova System Rebuild Script
-# This script performs a complete rebuild of the Nova system:
-# 1. Removes all Nova system directories and files
-# 2. Cleans all data through CLI
-# 3. Processes notes
-# 4. Builds vectors
+# This script performs a rebuild of the Nova system:
+# 1. Cleans processing data and vectors (with --full only)
+# 2. Processes notes
+# 3. Converts attachments, reusing cached conversions of unchanged files
+# 4. Builds vectors (incrementally unless --full)
 # 5. Verifies health
 # 6. Reports stats
+#
+# Usage: rebuild.sh [--full]
 
 set -e  # Exit on any error
 
+FULL_REBUILD=false
+if [ "$1" == "--full" ]; then
+    FULL_REBUILD=true
+fi
+
 # Load environment configuration
 if [ -f .env.local ]; then
     source .env.local
@@ -41,21 +48,31 @@ fi
 echo "🔄 Starting Nova system rebuild..."
 
 echo "🧹 Cleaning system..."
-echo "Cleaning vectors..."
-uv run python -m nova.cli clean-vectors --force || handle_error "vector cleaning" $?
-
-echo "Cleaning processing directory..."
-uv run python -m nova.cli clean-processing --force || handle_error "processing directory cleaning" $?
+if [ "$FULL_REBUILD" = true ]; then
+    echo "Cleaning vectors..."
+    uv run python -m nova.cli clean-vectors --force || handle_error "vector cleaning" $?
+    # Processed notes are otherwise kept, so the output sync only transfers changes
+    echo "Cleaning processing directory..."
+    uv run python -m nova.cli clean-processing --force || handle_error "processing directory cleaning" $?
+    VECTOR_ARGS=""
+else
+    # Only re-embed notes that were added or changed since the last run
+    VECTOR_ARGS="--incremental"
+fi
 
 echo "📝 Processing notes..."
 uv run python -m nova.cli process-notes \
     --input-dir "${NOVA_INPUT}" || handle_error "note processing" $?
 
+echo "📎 Converting attachments..."
+uv run python -m nova.cli convert-attachments \
+    --input-dir "${NOVA_INPUT}" || handle_error "attachment conversion" $?
+
 # Check progress after note processing
 uv run python -m nova.cli monitor health || true
 
 echo "🔄 Processing vectors..."
-uv run python -m nova.cli process-vectors || handle_error "vector processing" $?
+uv run python -m nova.cli process-vectors $VECTOR_ARGS || handle_error "vector processing" $?
 
 # Check progress after vector processing
 uv run python -m nova.cli monitor health || true
@@ -5,5 +5,13 @@ This module provides functionality for parsing Bear.app note exports.
 
 from .parser import BearNote, BearParser, BearParserError
 from .processing import BearNoteProcessing
+from .sync import ExportSync, SyncStats
 
-__all__ = ["BearParser", "BearNote", "BearParserError", "BearNoteProcessing"]
+__all__ = [
+    "BearNote",
+    "BearNoteProcessing",
+    "BearParser",
+    "BearParserError",
+    "ExportSync",
+    "SyncStats",
+]
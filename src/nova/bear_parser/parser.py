@@ -3,7 +3,9 @@
 import json
 import logging
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from functools import wraps
@@ -292,7 +294,14 @@ class BearDocument(BaseModel):
 
 
 class BearNote:
-    """Bear note representation."""
+    """Bear note representation.
+
+    Notes are plain slotted objects so that indexing, which only needs the
+    content and source path, never pays for the pydantic BearDocument tree.
+    Use to_docling when the Docling schema is actually needed.
+    """
+
+    __slots__ = ("attachments", "content", "date", "input_format", "source_path", "tags", "title")
 
     def __init__(
         self,
@@ -302,6 +311,7 @@ class BearNote:
         tags: list[str] | None = None,
         attachments: list[str] | None = None,
         input_format: InputFormat = InputFormat.TEXT,
+        source_path: Path | None = None,
     ) -> None:
         """Initialize note.
 
@@ -312,6 +322,7 @@ class BearNote:
             tags: Optional list of tags
             attachments: Optional list of attachments
             input_format: Input format (text or markdown)
+            source_path: Optional path of the note file
         """
         self.title = title
         self.content = content
@@ -319,16 +330,20 @@ class BearNote:
         self.tags = tags or []
         self.attachments = attachments or []
         self.input_format = input_format
+        self.source_path = source_path
 
     def to_docling(self) -> BearDocument:
         """Convert to Docling document."""
-        return BearDocument(
+        document = BearDocument(
             title=self.title,
             content=self.content,
             date=self.date.isoformat(),
             tags=self.tags,
             input_format=self.input_format,
         )
+        if self.source_path:
+            document.origin = str(self.source_path)
+        return document
 
     def __str__(self) -> str:
         """Get string representation.
@@ -347,16 +362,40 @@ class BearNote:
         return self.__str__()
 
 
+def _parse_note_in_worker(input_dir: Path, note_file: Path) -> BearNote:
+    """Parse a note file in a worker process.
+
+    Args:
+        input_dir: Parser input directory
+        note_file: Path to the note file
+
+    Returns:
+        Parsed note
+    """
+    return BearParser(input_dir)._parse_note_file(note_file)
+
+
 class BearParser:
     """Parser for Bear notes."""
 
-    def __init__(self, input_dir: str | Path) -> None:
+    # Files submitted ahead of the one being yielded, per worker
+    PREFETCH_PER_WORKER = 4
+
+    def __init__(
+        self, input_dir: str | Path, workers: int = 1, use_processes: bool = False
+    ) -> None:
         """Initialize parser.
 
         Args:
             input_dir: Input directory path
+            workers: Number of files to read and parse in parallel
+            use_processes: Whether to parse in worker processes instead of threads
         """
+        if workers < 1:
+            raise ValueError(f"Worker count must be positive, got {workers}")
         self.input_dir = Path(input_dir)
+        self.workers = workers
+        self.use_processes = use_processes
         self._notes: list[BearNote] = []  # Initialize as empty list
         self._initialized = False
 
@@ -404,57 +443,143 @@ class BearParser:
 
         return name, None
 
-    def parse_directory(self) -> None:
-        """Parse all notes in the input directory."""
-        if self._initialized:
-            return
+    def _list_note_files(self) -> list[Path]:
+        """List note files in the input directory.
 
-        logger.info("Parsing directory: %s", self.input_dir)
+        Returns:
+            List of .txt and .md note files
 
+        Raises:
+            BearParserError: If the input path is not a directory
+        """
         if not self.input_dir.exists():
             logger.warning("Input directory does not exist: %s", self.input_dir)
-            self._initialized = True
-            return
+            return []
 
         if not self.input_dir.is_dir():
             logger.error("Input path is not a directory: %s", self.input_dir)
             raise BearParserError(f"Input path is not a directory: {self.input_dir}")
 
-        # Look for both .txt and .md files
+        # Look for both .txt and .md files, in a stable order
         note_files = list(self.input_dir.glob("*.txt"))
         note_files.extend(self.input_dir.glob("*.md"))
+        return sorted(note_files)
+
+    def _parse_note_file(self, note_file: Path) -> BearNote:
+        """Parse a single note file.
+
+        Args:
+            note_file: Path to the note file
+
+        Returns:
+            Parsed note
+        """
+        logger.debug("Processing note: %s", note_file)
+        content = note_file.read_text()
+        title, date = self._parse_title_and_date(note_file.name)
+        tags = self._extract_tags(content)
+
+        # Use appropriate input format based on file extension
+        input_format = (
+            InputFormat.MARKDOWN if note_file.suffix.lower() == ".md" else InputFormat.TEXT
+        )
+
+        note = BearNote(
+            title=title,
+            content=content,
+            date=date,
+            tags=tags,
+            input_format=input_format,
+            source_path=note_file,
+        )
+        logger.debug("Successfully processed note: %s", note)
+        return note
+
+    def _parse_note_files(self, note_files: list[Path]) -> Iterator[BearNote]:
+        """Parse note files, in parallel if the parser has several workers.
 
+        Args:
+            note_files: Note files to parse
+
+        Yields:
+            Parsed notes in the order of ``note_files``; files that fail to
+            parse are logged and skipped
+        """
+        if self.workers == 1:
+            for note_file in note_files:
+                try:
+                    yield self._parse_note_file(note_file)
+                except Exception as e:
+                    logger.error("Failed to process note %s: %s", note_file, e)
+                    # Continue processing other notes instead of failing completely
+                    continue
+            return
+
+        executor: Executor
+        if self.use_processes:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="bear_parser"
+            )
+
+        def submit(note_file: Path) -> Future[BearNote]:
+            if self.use_processes:
+                return executor.submit(_parse_note_in_worker, self.input_dir, note_file)
+            return executor.submit(self._parse_note_file, note_file)
+
+        # Keep a bounded window of files in flight and yield them in order
+        files = iter(note_files)
+        pending: deque[tuple[Path, Future[BearNote]]] = deque()
+        try:
+            for note_file in files:
+                pending.append((note_file, submit(note_file)))
+                if len(pending) >= self.workers * self.PREFETCH_PER_WORKER:
+                    break
+            while pending:
+                note_file, future = pending.popleft()
+                next_file = next(files, None)
+                if next_file is not None:
+                    pending.append((next_file, submit(next_file)))
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logger.error("Failed to process note %s: %s", note_file, e)
+                    # Continue processing other notes instead of failing completely
+                    continue
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_notes(self, file_filter: Callable[[Path], bool] | None = None) -> Iterator[BearNote]:
+        """Parse notes in the input directory lazily.
+
+        Unlike parse_directory, parsed notes are not kept on the parser.
+
+        Args:
+            file_filter: Optional predicate; files it rejects are not read
+
+        Yields:
+            Parsed notes
+        """
+        note_files = self._list_note_files()
+        if file_filter is not None:
+            note_files = [note_file for note_file in note_files if file_filter(note_file)]
+        yield from self._parse_note_files(note_files)
+
+    def parse_directory(self) -> None:
+        """Parse all notes in the input directory."""
+        if self._initialized:
+            return
+
+        logger.info("Parsing directory: %s", self.input_dir)
+
+        note_files = self._list_note_files()
         if not note_files:
             logger.info("No notes found in directory: %s", self.input_dir)
             self._initialized = True
             return
 
-        for note_file in note_files:
-            try:
-                logger.debug("Processing note: %s", note_file)
-                content = note_file.read_text()
-                title, date = self._parse_title_and_date(note_file.name)
-                tags = self._extract_tags(content)
-
-                # Use appropriate input format based on file extension
-                input_format = (
-                    InputFormat.MARKDOWN if note_file.suffix.lower() == ".md" else InputFormat.TEXT
-                )
-
-                note = BearNote(
-                    title=title,
-                    content=content,
-                    date=date,
-                    tags=tags,
-                    input_format=input_format,
-                )
-                self._notes.append(note)
-                logger.debug("Successfully processed note: %s", note)
-
-            except Exception as e:
-                logger.error("Failed to process note %s: %s", note_file, e)
-                # Continue processing other notes instead of failing completely
-                continue
+        self._notes.extend(self._parse_note_files(note_files))
 
         logger.info("Successfully parsed %d notes", len(self._notes))
         self._initialized = True
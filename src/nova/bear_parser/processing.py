@@ -1,10 +1,11 @@
 """Bear note processing module."""
 
 import logging
-import shutil
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
-from .parser import BearDocument, BearParser
+from .parser import BearDocument, BearNote, BearParser
+from .sync import ExportSync, SyncStats
 
 logger = logging.getLogger(__name__)
 
@@ -12,16 +13,30 @@ logger = logging.getLogger(__name__)
 class BearNoteProcessing:
     """Unified Bear note processing class."""
 
-    def __init__(self, input_dir: str | Path, output_dir: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        input_dir: str | Path,
+        output_dir: str | Path | None = None,
+        workers: int = 1,
+        use_processes: bool = False,
+        checksum: bool = False,
+    ) -> None:
         """Initialize Bear note processor.
 
         Args:
             input_dir: Input directory containing Bear notes
             output_dir: Optional output directory for processed notes
+            workers: Number of note files to read and parse in parallel
+            use_processes: Whether to parse in worker processes instead of threads
+            checksum: Whether the output sync also compares content hashes
         """
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir) if output_dir else None
-        self.parser = BearParser(input_dir=self.input_dir)
+        self.checksum = checksum
+        self.sync_stats: SyncStats | None = None
+        self.parser = BearParser(
+            input_dir=self.input_dir, workers=workers, use_processes=use_processes
+        )
 
     def process_bear_notes(self) -> list[BearDocument]:
         """Process all Bear notes in the input directory.
@@ -45,43 +60,66 @@ class BearNoteProcessing:
         logger.info("Successfully processed %d notes", len(documents))
         return documents
 
+    def iter_notes(self, file_filter: Callable[[Path], bool] | None = None) -> Iterator[BearNote]:
+        """Parse Bear notes in the input directory one at a time.
+
+        This is the fast path for indexing: notes are yielded as parsed,
+        without building BearDocument instances or copying files to the
+        output directory.
+
+        Args:
+            file_filter: Optional predicate; note files it rejects are not read
+
+        Yields:
+            Parsed BearNote instances
+
+        Raises:
+            BearParserError: If the input path is not a directory
+        """
+        logger.info("Streaming Bear notes from %s", self.input_dir)
+        yield from self.parser.iter_notes(file_filter)
+
+    def _list_export_files(self) -> list[Path]:
+        """List the note and attachment files of the export.
+
+        Returns:
+            Top-level note files and every file in attachment directories
+        """
+        files: list[Path] = []
+        for ext in [".md", ".txt"]:
+            files.extend(self.input_dir.glob(f"*{ext}"))
+        for attachment_dir in self.input_dir.glob("*"):
+            if attachment_dir.is_dir():
+                files.extend(path for path in attachment_dir.rglob("*") if path.is_file())
+        return sorted(files)
+
     def _copy_files_to_output(self) -> None:
-        """Copy note files to output directory."""
+        """Synchronize note files and attachments to the output directory.
+
+        Only new and changed files are transferred, and files removed from
+        the export since the last run are removed from the output directory.
+        """
         if not self.output_dir:
             return
 
         try:
-            # Create output directory
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Copy markdown and text files
-            for ext in [".md", ".txt"]:
-                for file_path in self.input_dir.glob(f"*{ext}"):
-                    try:
-                        # Create relative path in output directory
-                        rel_path = file_path.relative_to(self.input_dir)
-                        output_path = self.output_dir / rel_path
-                        output_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(file_path, output_path)
-                        logger.debug("Copied %s to %s", file_path, output_path)
-                    except Exception as e:
-                        logger.error("Failed to copy file %s: %s", file_path, e)
-                        continue
-
-            # Copy attachments if present
-            for attachment_dir in self.input_dir.glob("*"):
-                if attachment_dir.is_dir():
-                    try:
-                        # Copy entire attachment directory
-                        output_attachment_dir = self.output_dir / attachment_dir.name
-                        shutil.copytree(attachment_dir, output_attachment_dir, dirs_exist_ok=True)
-                        logger.debug(
-                            "Copied attachments from %s to %s",
-                            attachment_dir,
-                            output_attachment_dir,
-                        )
-                    except Exception as e:
-                        logger.error("Failed to copy attachments from %s: %s", attachment_dir, e)
-                        continue
+            sync = ExportSync(self.input_dir, self.output_dir, checksum=self.checksum)
+            stats = sync.sync(self._list_export_files())
         except Exception as e:
-            logger.error("Failed to create output directory %s: %s", self.output_dir, e)
+            logger.error("Failed to sync notes to output directory %s: %s", self.output_dir, e)
+            return
+
+        self.sync_stats = stats
+        logger.info(
+            "Synced notes to %s: %d copied (%d bytes), %d linked (%d bytes), "
+            "%d unchanged (%d bytes), %d removed, %d failed",
+            self.output_dir,
+            stats.copied,
+            stats.bytes_copied,
+            stats.linked,
+            stats.bytes_linked,
+            stats.skipped,
+            stats.bytes_skipped,
+            stats.removed,
+            stats.failed,
+        )
@@ -0,0 +1,292 @@
+"""Incremental synchronization of a Bear export into an output directory.
+
+Copying the whole export, attachments included, on every run dominates
+processing time once the export is large. ``ExportSync`` instead mirrors
+only what changed: files whose size and mtime (and optionally content hash)
+match the last synchronized state are skipped, new and changed files are
+copied, and files that disappeared from the export are removed from the
+output directory. Copies go through ``copy_file_range`` where available, so
+copy-on-write filesystems can clone the data instead of duplicating it.
+Hardlinking is opt-in: it is faster still, but the output then shares
+inodes with the export, so writing to an output file changes the export.
+
+The synchronized state is kept in a manifest inside the output directory,
+so only files this class created are ever deleted there.
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Errors of copy_file_range that mean the filesystems do not support it
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+)
+
+
+@dataclass
+class SyncEntry:
+    """Synchronized state of a single file."""
+
+    size: int
+    mtime_ns: int
+    sha256: str | None = None
+
+
+@dataclass
+class SyncStats:
+    """Outcome of a synchronization run."""
+
+    copied: int = 0
+    linked: int = 0
+    skipped: int = 0
+    removed: int = 0
+    failed: int = 0
+    bytes_copied: int = 0
+    bytes_linked: int = 0
+    bytes_skipped: int = 0
+
+
+def _file_digest(path: Path) -> str:
+    """Hash the content of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest of the file content
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class ExportSync:
+    """Mirrors a set of files from a source directory into a target directory."""
+
+    MANIFEST_NAME = ".nova_sync.json"
+    VERSION = 1
+
+    def __init__(
+        self,
+        source_dir: str | Path,
+        target_dir: str | Path,
+        checksum: bool = False,
+        hardlinks: bool = False,
+    ) -> None:
+        """Initialize the synchronizer.
+
+        Args:
+            source_dir: Directory the files are synchronized from
+            target_dir: Directory the files are synchronized to
+            checksum: Whether to compare content hashes in addition to size and mtime
+            hardlinks: Whether to hardlink files instead of copying them where possible.
+                Hardlinked output files share their inode with the source, so
+                modifying one in place modifies the other.
+        """
+        self.source_dir = Path(source_dir)
+        self.target_dir = Path(target_dir)
+        self.checksum = checksum
+        self.hardlinks = hardlinks
+        self._copy_file_range = hasattr(os, "copy_file_range")
+        self.manifest_path = self.target_dir / self.MANIFEST_NAME
+
+    def _load_manifest(self) -> dict[str, SyncEntry]:
+        """Load the synchronized state, starting empty if it is missing or invalid."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if data.get("version") != self.VERSION:
+                logger.warning(
+                    "Ignoring sync manifest with unsupported version: %s", self.manifest_path
+                )
+                return {}
+            return {path: SyncEntry(**entry) for path, entry in data["files"].items()}
+        except Exception as e:
+            logger.warning("Ignoring unreadable sync manifest %s: %s", self.manifest_path, e)
+            return {}
+
+    def _save_manifest(self, entries: dict[str, SyncEntry]) -> None:
+        """Write the synchronized state atomically."""
+        data = {
+            "version": self.VERSION,
+            "files": {path: asdict(entry) for path, entry in entries.items()},
+        }
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def _is_current(
+        self,
+        target: Path,
+        source_stat: os.stat_result,
+        source_digest: str | None,
+        previous: SyncEntry | None,
+    ) -> bool:
+        """Check whether a target file is already up to date.
+
+        Args:
+            target: Target file
+            source_stat: Stat of the source file
+            source_digest: Content hash of the source file in checksum mode
+            previous: State recorded when the file was last synchronized
+
+        Returns:
+            Whether the target can be skipped
+        """
+        try:
+            target_stat = target.stat()
+        except FileNotFoundError:
+            return False
+        if target_stat.st_size != source_stat.st_size:
+            return False
+
+        # Prefer the recorded source state: target timestamps may be coarser
+        # than the source's on a different filesystem
+        if previous is not None:
+            unchanged = (previous.size, previous.mtime_ns) == (
+                source_stat.st_size,
+                source_stat.st_mtime_ns,
+            )
+        else:
+            unchanged = target_stat.st_mtime_ns == source_stat.st_mtime_ns
+        if source_digest is None:
+            return unchanged
+        if previous is not None and previous.sha256 is not None:
+            return previous.sha256 == source_digest
+        return _file_digest(target) == source_digest
+
+    def _transfer(self, source: Path, target: Path) -> bool:
+        """Hardlink or copy a file, replacing any existing target.
+
+        Args:
+            source: Source file
+            target: Target file
+
+        Returns:
+            Whether the file was hardlinked rather than copied
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Never write through an existing target: it may be a hardlink to the source
+        target.unlink(missing_ok=True)
+        if self.hardlinks:
+            try:
+                os.link(source, target)
+                return True
+            except OSError as e:
+                # Typically a cross-device target or a filesystem without hardlinks
+                logger.debug("Hardlinks unavailable for %s, copying instead: %s", target, e)
+                self.hardlinks = False
+        self._copy(source, target)
+        return False
+
+    def _copy(self, source: Path, target: Path) -> None:
+        """Copy a file and its metadata.
+
+        ``copy_file_range`` copies inside the kernel and lets copy-on-write
+        filesystems such as Btrfs and XFS share the data blocks. Where it is
+        unavailable or unsupported between the two filesystems, the copy falls
+        back to ``shutil.copy2``.
+
+        Args:
+            source: Source file
+            target: Target file, which must not exist
+        """
+        if self._copy_file_range:
+            try:
+                with source.open("rb") as src, target.open("xb") as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if not copied:
+                            break
+                        remaining -= copied
+                shutil.copystat(source, target)
+                return
+            except OSError as e:
+                target.unlink(missing_ok=True)
+                if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                    raise
+                logger.debug("copy_file_range unavailable for %s, copying instead: %s", target, e)
+                self._copy_file_range = False
+        shutil.copy2(source, target)
+
+    def _remove_stale(self, stale: Iterable[str], stats: SyncStats) -> None:
+        """Remove previously synchronized files that no longer exist at the source.
+
+        Args:
+            stale: Relative paths of the files to remove
+            stats: Statistics to update
+        """
+        for rel_path in stale:
+            target = self.target_dir / rel_path
+            try:
+                target.unlink(missing_ok=True)
+                stats.removed += 1
+                logger.debug("Removed %s", target)
+                # Drop directories left empty, such as a deleted note's attachments
+                parent = target.parent
+                while parent != self.target_dir and not any(parent.iterdir()):
+                    parent.rmdir()
+                    parent = parent.parent
+            except OSError as e:
+                stats.failed += 1
+                logger.error("Failed to remove %s: %s", target, e)
+
+    def sync(self, files: Iterable[Path]) -> SyncStats:
+        """Synchronize files into the target directory.
+
+        Args:
+            files: Source files to mirror; paths must be inside the source directory
+
+        Returns:
+            Synchronization statistics
+        """
+        stats = SyncStats()
+        self.target_dir.mkdir(parents=True, exist_ok=True)
+        previous = self._load_manifest()
+        entries: dict[str, SyncEntry] = {}
+
+        for source in files:
+            rel_path = source.relative_to(self.source_dir).as_posix()
+            target = self.target_dir / rel_path
+            try:
+                source_stat = source.stat()
+                digest = _file_digest(source) if self.checksum else None
+                if self._is_current(target, source_stat, digest, previous.get(rel_path)):
+                    stats.skipped += 1
+                    stats.bytes_skipped += source_stat.st_size
+                elif self._transfer(source, target):
+                    stats.linked += 1
+                    stats.bytes_linked += source_stat.st_size
+                    logger.debug("Linked %s to %s", source, target)
+                else:
+                    stats.copied += 1
+                    stats.bytes_copied += source_stat.st_size
+                    logger.debug("Copied %s to %s", source, target)
+                entries[rel_path] = SyncEntry(
+                    size=source_stat.st_size,
+                    mtime_ns=source_stat.st_mtime_ns,
+                    sha256=digest,
+                )
+            except Exception as e:
+                stats.failed += 1
+                logger.error("Failed to copy file %s: %s", source, e)
+                # Keep the old state so a failed file is neither lost nor removed
+                if rel_path in previous:
+                    entries[rel_path] = previous[rel_path]
+
+        self._remove_stale(sorted(set(previous) - set(entries)), stats)
+        try:
+            self._save_manifest(entries)
+        except OSError as e:
+            logger.error("Failed to save sync manifest %s: %s", self.manifest_path, e)
+        return stats
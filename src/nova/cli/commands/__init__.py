@@ -2,6 +2,7 @@
 
 from nova.cli.commands.clean_processing import CleanProcessingCommand
 from nova.cli.commands.clean_vectors import CleanVectorsCommand
+from nova.cli.commands.convert_attachments import ConvertAttachmentsCommand
 from nova.cli.commands.monitor.command import MonitorCommand
 from nova.cli.commands.process import ProcessNotesCommand
 from nova.cli.commands.process_vectors import ProcessVectorsCommand
@@ -10,6 +11,7 @@ from nova.cli.commands.search import SearchCommand
 __all__ = [
     "CleanProcessingCommand",
     "CleanVectorsCommand",
+    "ConvertAttachmentsCommand",
     "MonitorCommand",
     "ProcessNotesCommand",
     "ProcessVectorsCommand",
@@ -2,7 +2,7 @@
 
 import logging
 import time
-import uuid
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -11,7 +11,10 @@ import click
 from nova.cli.utils.command import NovaCommand
 from nova.monitoring.session import SessionMonitor
 from nova.vector_store.chunking import Chunk, ChunkingEngine
-from nova.vector_store.store import VectorStore
+from nova.vector_store.manifest import IndexManifest, ManifestUpdate
+from nova.vector_store.parallel_chunking import ParallelChunker
+from nova.vector_store.pipeline import bounded_stage
+from nova.vector_store.store import BatchTiming, VectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,10 @@ logger = logging.getLogger(__name__)
 class BaseVectorCommand(NovaCommand):
     """Base class for vector processing commands."""
 
+    # Bounded queue sizes between the read -> chunk -> embed/upsert stages
+    READ_QUEUE_SIZE = 32
+    CHUNK_QUEUE_SIZE = 1024
+
     def __init__(
         self,
         vector_store: VectorStore | None = None,
@@ -38,6 +45,7 @@ class BaseVectorCommand(NovaCommand):
         logger.info(f"Monitor initialized: {self.monitor}")
         self.chunking_engine = ChunkingEngine()
         logger.info("Chunking engine initialized")
+        self.manifest_update: ManifestUpdate | None = None
 
     def create_command(self) -> click.Command:
         """Create the click command.
@@ -59,14 +67,46 @@ class BaseVectorCommand(NovaCommand):
             help="Output directory for vector store",
             required=False,
         )
-        def command(input_dir: str, output_dir: str | None = None) -> None:
+        @click.option(
+            "--batch-size",
+            type=click.IntRange(min=1),
+            default=VectorStore.DEFAULT_BATCH_SIZE,
+            help="Number of chunks to embed and insert per batch",
+        )
+        @click.option(
+            "--incremental",
+            is_flag=True,
+            help="Only re-index files that were added or changed since the last run",
+            default=False,
+        )
+        @click.option(
+            "--prune",
+            is_flag=True,
+            help="Remove chunks of files deleted from the input directory",
+            default=False,
+        )
+        def command(
+            input_dir: str,
+            output_dir: str | None = None,
+            batch_size: int = VectorStore.DEFAULT_BATCH_SIZE,
+            incremental: bool = False,
+            prune: bool = False,
+        ) -> None:
             """Process text files into vector chunks.
 
             Args:
                 input_dir: Input directory path
                 output_dir: Output directory path (optional)
+                batch_size: Number of chunks per ingest batch
+                incremental: Whether to skip unchanged files
+                prune: Whether to remove chunks of deleted files
             """
-            kwargs = {"input_dir": input_dir}
+            kwargs: dict[str, Any] = {
+                "input_dir": input_dir,
+                "batch_size": batch_size,
+                "incremental": incremental,
+                "prune": prune,
+            }
             if output_dir:
                 kwargs["output_dir"] = output_dir
             self.run(**kwargs)
@@ -90,6 +130,10 @@ class BaseVectorCommand(NovaCommand):
             **kwargs: Command arguments
                 input_dir: Input directory path
                 output_dir: Output directory path (optional)
+                batch_size: Number of chunks per ingest batch (optional)
+                incremental: Whether to skip unchanged files (optional)
+                prune: Whether to remove chunks of files deleted from the input
+                    directory (optional, implied by incremental)
         """
         input_dir = kwargs.get("input_dir")
         output_dir = kwargs.get("output_dir")
@@ -111,50 +155,89 @@ class BaseVectorCommand(NovaCommand):
             self.vector_store = VectorStore(base_path=str(output_path))
             logger.info(f"Vector store created: {self.vector_store}")
 
+        # Track indexed files in the store's manifest so stale chunks can be replaced
+        incremental = bool(kwargs.get("incremental", False))
+        if self.vector_store and self.vector_store.persistent:
+            manifest = IndexManifest(self.vector_store.base_path)
+            self.manifest_update = ManifestUpdate(
+                manifest,
+                incremental=incremental,
+                root=input_path,
+                prune=bool(kwargs.get("prune")) or incremental,
+            )
+        else:
+            self.manifest_update = None
+            if incremental:
+                logger.warning("Incremental mode requires a persistent vector store, ignoring")
+                incremental = False
+
         # Process vectors
         try:
             logger.info(f"Processing directory: {input_path}")
-            chunks = self._process_directory(input_path)
-            logger.info(f"Directory processed, got {len(chunks)} chunks")
-
-            if not chunks:
-                logger.warning(f"No chunks were created from {input_path}")
-                click.echo(f"WARNING: No chunks were created from {input_path}", err=True)
-                return
-
-            # Add chunks to vector store
-            total_chunks = len(chunks)
-            logger.info(f"Starting to add {total_chunks} chunks to vector store")
-            self.monitor.track_rebuild_progress(total_chunks)
+            batch_size = kwargs.get("batch_size") or VectorStore.DEFAULT_BATCH_SIZE
+
+            # Reading and chunking run in background stages, so embedding starts
+            # with the first file while later files are still being read
+            chunks = bounded_stage(
+                self._process_directory(input_path, **kwargs),
+                maxsize=self.CHUNK_QUEUE_SIZE,
+                name="chunk",
+            )
+
+            # The total is not known up front; it grows as chunks stream in
+            self.monitor.track_rebuild_progress(0)
             start_time = time.time()
-
-            for i, chunk in enumerate(chunks, 1):
-                try:
-                    if self.vector_store:
-                        # Generate a unique ID for each chunk
-                        chunk.chunk_id = str(uuid.uuid4())
-                        logger.info(f"Processing chunk {i}/{total_chunks} with ID {chunk.chunk_id}")
-                        logger.debug(f"Chunk content length: {len(chunk.text)}")
-                        logger.debug(f"Chunk metadata: {chunk.to_metadata()}")
-
-                        # Use chunk's built-in metadata method
-                        self.vector_store.add_chunk(chunk)
-                        logger.info(f"Successfully added chunk {i} to vector store")
-                    else:
-                        logger.warning("No vector store available to add chunks")
-
-                    processing_time = time.time() - start_time
+            chunks_processed = 0
+
+            if self.vector_store:
+
+                def on_batch(timing: BatchTiming) -> None:
+                    nonlocal chunks_processed
+                    if self.manifest_update:
+                        self.manifest_update.record_batch(timing["size"], failed="error" in timing)
+                    if "error" in timing:
+                        error_msg = (
+                            f"Error adding batch {timing['batch']} to vector store: "
+                            f"{timing['error']}"
+                        )
+                        self.monitor.record_rebuild_error(error_msg)
+                    chunks_processed += timing["size"]
                     self.monitor.update_rebuild_progress(
-                        chunks_processed=i, processing_time=processing_time
+                        chunks_processed=chunks_processed,
+                        processing_time=time.time() - start_time,
+                        total_chunks=chunks_processed,
+                    )
+
+                timings = self.vector_store.add_chunks(
+                    chunks, batch_size=batch_size, on_batch=on_batch
+                )
+                embed_time = sum(t["embed_time"] for t in timings)
+                insert_time = sum(t["insert_time"] for t in timings)
+                skipped = sum(t["skipped"] for t in timings)
+                logger.info(
+                    f"Added {chunks_processed} chunks ({skipped} unchanged) in {len(timings)} "
+                    f"batches (embed {embed_time:.2f}s, insert {insert_time:.2f}s)"
+                )
+            else:
+                logger.warning("No vector store available to add chunks")
+                chunks_processed = sum(1 for _ in chunks)
+
+            if self.vector_store and self.manifest_update:
+                stale_ids = self.manifest_update.finish()
+                self.vector_store.delete_chunks(stale_ids)
+                self.manifest_update.manifest.save()
+                if incremental:
+                    logger.info(
+                        f"Incremental update: {self.manifest_update.skipped} unchanged files "
+                        f"skipped, {len(stale_ids)} stale chunks removed"
                     )
-                    logger.debug(f"Chunk {i} processed in {processing_time:.2f}s")
 
-                except Exception as e:
-                    error_msg = f"Error adding chunk {i} to vector store: {e!s}"
-                    logger.error(error_msg, exc_info=True)
-                    self.monitor.record_rebuild_error(error_msg)
-                    if hasattr(chunk, "source"):
-                        logger.error(f"Error occurred while processing {chunk.source}")
+            if not chunks_processed and incremental:
+                logger.info(f"No changes to index in {input_path}")
+            elif not chunks_processed:
+                logger.warning(f"No chunks were created from {input_path}")
+                click.echo(f"WARNING: No chunks were created from {input_path}", err=True)
+                return
 
             # Complete rebuild
             logger.info("Completing rebuild process")
@@ -168,18 +251,72 @@ class BaseVectorCommand(NovaCommand):
             self.monitor.record_rebuild_error(error_msg)
             raise click.UsageError(error_msg)
 
-    def _process_directory(self, directory: Path) -> list[Chunk]:
+    def _process_directory(self, directory: Path, **kwargs: Any) -> Iterator[Chunk]:
         """Process all files in a directory.
 
         This method should be implemented by subclasses to handle specific file types.
+        Chunks should be produced lazily so that ingestion can start before the
+        whole directory has been read.
 
         Args:
             directory: Directory containing files to process
+            **kwargs: Command arguments
 
         Returns:
-            List of chunks created from files
+            Iterator over chunks created from files
 
         Raises:
             NotImplementedError: If not implemented by subclass
         """
         raise NotImplementedError("Subclasses must implement _process_directory")
+
+    def _should_read(self, path: Path) -> bool:
+        """Check whether a source file needs to be read in this run.
+
+        Args:
+            path: Source file path
+
+        Returns:
+            False if the file is unchanged since it was last indexed
+        """
+        return self.manifest_update is None or self.manifest_update.should_read(path)
+
+    def _chunk_documents(
+        self, documents: Iterable[tuple[str, Path | None]], workers: int = 1
+    ) -> Iterator[Chunk]:
+        """Chunk documents as they arrive.
+
+        Args:
+            documents: Tuples of (document text, source path)
+            workers: Number of processes to chunk documents in
+
+        Yields:
+            Chunks created from the documents
+        """
+
+        def changed() -> Iterator[tuple[str, Path | None]]:
+            for text, source in documents:
+                if self.manifest_update and not self.manifest_update.should_index(text, source):
+                    logger.debug(f"Skipping unchanged file {source}")
+                    continue
+                yield text, source
+
+        chunker = ParallelChunker(self.chunking_engine, workers=workers)
+        for result in chunker.chunk_many(changed()):
+            source = result.source
+            if result.error is not None:
+                error_msg = f"Error processing file {source}: {result.error}"
+                logger.error(error_msg)
+                self.monitor.record_rebuild_error(error_msg)
+                if self.manifest_update:
+                    self.manifest_update.mark_failed(source)
+                continue
+
+            file_chunks = result.chunks
+            if not file_chunks:
+                error_msg = f"No chunks created from file {source}"
+                logger.warning(error_msg)
+                self.monitor.record_rebuild_error(error_msg)
+            if self.manifest_update:
+                self.manifest_update.track_chunks(source, (chunk.chunk_id for chunk in file_chunks))
+            yield from file_chunks
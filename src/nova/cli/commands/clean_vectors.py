@@ -4,7 +4,6 @@ import logging
 import shutil
 from typing import Any
 
-import chromadb
 import click
 
 from nova.cli.utils.command import NovaCommand
@@ -51,6 +50,8 @@ class CleanVectorsCommand(NovaCommand):
 
             # Clean up ChromaDB collection
             try:
+                import chromadb
+
                 # Reset the client to ensure clean state
                 client = chromadb.PersistentClient(path=str(vector_dir / "chroma"))
                 client.reset()
@@ -66,8 +67,14 @@ class CleanVectorsCommand(NovaCommand):
             except Exception as e:
                 self.log_info(f"Error cleaning up ChromaDB: {e}")
 
-            # Delete vector store directory
-            shutil.rmtree(vector_dir)
+            # Delete the vector store, keeping the embedding cache for the rebuild
+            for path in vector_dir.iterdir():
+                if path.name == VectorStore.EMBEDDING_CACHE_DIR:
+                    continue
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
             self.log_info("Vector store deleted successfully")
 
         except PermissionError as e:
@@ -0,0 +1,108 @@
+"""Convert attachments command."""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import click
+
+from nova.cli.utils.command import NovaCommand
+
+logger = logging.getLogger(__name__)
+
+
+class ConvertAttachmentsCommand(NovaCommand):
+    """Command for converting Bear note attachments to markdown."""
+
+    name = "convert-attachments"
+    help = "Convert note attachments (PDFs, images, HTML, SVG) to markdown"
+
+    def run(self, **kwargs: Any) -> None:
+        """Run the convert attachments command.
+
+        Args:
+            **kwargs: Command arguments
+        """
+        # Imported here so that other commands do not load the PDF and image libraries
+        from nova.docling.attachments import (
+            AttachmentConverter,
+            ConversionCache,
+            find_attachments,
+            markdown_output_paths,
+        )
+
+        input_dir = Path(kwargs["input_dir"]) if kwargs.get("input_dir") else None
+        input_dir = input_dir or self.config.paths.input_dir
+        output_dir = Path(kwargs["output_dir"]) if kwargs.get("output_dir") else None
+        output_dir = output_dir or self.config.paths.processing_dir / "attachments"
+
+        if not input_dir.exists():
+            raise click.UsageError(f"Input directory not found: {input_dir}")
+
+        cache = None
+        if not kwargs.get("no_cache"):
+            cache = ConversionCache(self.config.paths.vector_store_dir.parent / "cache")
+        converter = AttachmentConverter(workers=kwargs.get("workers"), cache=cache)
+
+        files = find_attachments(input_dir)
+        output_paths = markdown_output_paths(files, input_dir, output_dir)
+        self.log_info(
+            f"Converting {len(files)} attachments from {input_dir} with {converter.workers} workers"
+        )
+        for result in converter.convert_many(files):
+            if result.document is None:
+                continue
+            output_path = output_paths[result.path]
+            try:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_text(result.document.content, encoding="utf-8")
+            except OSError as e:
+                self.log_error(f"Failed to write {output_path}: {e}")
+
+        stats = converter.get_stats()
+        self.log_success(
+            f"Converted {stats['converted']} attachments, reused {stats['cached']} "
+            f"cached conversions, {stats['failed']} failed; output in {output_dir}"
+        )
+
+    def create_command(self) -> click.Command:
+        """Create the convert attachments command.
+
+        Returns:
+            The click command instance
+        """
+
+        @click.command(name=self.name, help=self.help)
+        @click.option(
+            "--input-dir",
+            type=click.Path(path_type=Path),
+            required=False,
+            help="Input directory path (default: from config)",
+        )
+        @click.option(
+            "--output-dir",
+            type=click.Path(path_type=Path),
+            default=None,
+            help="Output directory path (default: .nova/processing/attachments)",
+        )
+        @click.option(
+            "--workers",
+            type=click.IntRange(min=1),
+            default=None,
+            help="Number of attachments to convert in parallel (default: CPU count)",
+        )
+        @click.option(
+            "--no-cache",
+            is_flag=True,
+            default=False,
+            help="Convert every attachment, ignoring cached conversions",
+        )
+        def command(**kwargs: Any) -> None:
+            """Convert note attachments.
+
+            Args:
+                **kwargs: Command arguments
+            """
+            self.run(**kwargs)
+
+        return command
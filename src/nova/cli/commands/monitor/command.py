@@ -162,8 +162,18 @@ class MonitorCommand(NovaCommand):
             is_flag=True,
             help="Show detailed statistics and health information",
         )
-        def health(watch: bool, no_color: bool, format: str, verbose: bool) -> None:
+        @click.option(
+            "--full-scan",
+            is_flag=True,
+            help="Verify the maintained statistics against a full scan of the vector store",
+        )
+        def health(
+            watch: bool, no_color: bool, format: str, verbose: bool, full_scan: bool
+        ) -> None:
             """Show system health status and statistics."""
+            if full_scan:
+                # Repair the maintained statistics once; every later read uses them
+                self.system_monitor.check_health(full_scan=True)
             if watch:
                 with Live(
                     self._get_health_panel(verbose=verbose),
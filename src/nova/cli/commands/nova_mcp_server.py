@@ -4,8 +4,10 @@ This server provides Nova's core functionality through MCP. It exposes
 tools for searching vectors and monitoring system health.
 """
 
+import asyncio
 import atexit
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -18,6 +20,8 @@ from rich.logging import RichHandler
 from nova.monitoring.logs import LogManager
 from nova.monitoring.persistent import PersistentMonitor
 from nova.monitoring.session import SessionMonitor
+from nova.vector_store.batching import SearchBatcher
+from nova.vector_store.executor import BoundedExecutor, ExecutorSaturatedError
 from nova.vector_store.store import VectorStore
 
 # Set up logging
@@ -52,6 +56,24 @@ session_monitor = SessionMonitor(vector_store=vector_store)
 persistent_monitor = PersistentMonitor(base_path)
 log_manager = LogManager(str(base_path))
 
+# Blocking work runs in bounded worker pools so the event loop stays responsive.
+# Health checks get their own pool so they are not starved by searches.
+search_pool = BoundedExecutor(
+    max_workers=int(os.environ.get("NOVA_MCP_WORKERS", "4")),
+    max_queue=int(os.environ.get("NOVA_MCP_QUEUE_DEPTH", "32")),
+    thread_name_prefix="nova_mcp_search",
+)
+health_pool = BoundedExecutor(max_workers=1, max_queue=8, thread_name_prefix="nova_mcp_health")
+
+# Concurrent searches arriving within a few milliseconds share one embed and one query.
+# Waiting searches do not hold a worker, so batches can be larger than the pool.
+search_batcher = SearchBatcher(
+    vector_store,
+    max_wait=float(os.environ.get("NOVA_MCP_BATCH_WAIT_MS", "5")) / 1000,
+    max_batch=int(os.environ.get("NOVA_MCP_BATCH_SIZE", "32")),
+    executor=search_pool,
+)
+
 
 # Register cleanup on exit
 @atexit.register
@@ -71,6 +93,9 @@ def cleanup() -> None:
     except Exception as e:
         logger.error("Failed to save session metrics: %s", str(e))
 
+    search_pool.shutdown(wait=False)
+    health_pool.shutdown(wait=False)
+
 
 def main() -> None:
     """Run the MCP server."""
@@ -99,7 +124,9 @@ async def search(request: SearchRequest) -> dict[str, Any]:
     """Search the vector store for relevant notes."""
     try:
         start_time = datetime.now()
-        results = vector_store.search(request.query, limit=request.limit)
+        results = await asyncio.wrap_future(
+            search_batcher.submit(request.query, limit=request.limit)
+        )
         end_time = datetime.now()
         processing_time = (end_time - start_time).total_seconds()
 
@@ -114,28 +141,44 @@ async def search(request: SearchRequest) -> dict[str, Any]:
             "processing_time": processing_time,
         }
 
+    except ExecutorSaturatedError as e:
+        logger.warning("Search rejected: %s", str(e))
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"}) from e
     except Exception as e:
         logger.error("Search failed: %s", str(e))
         session_monitor.record_rebuild_error(str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _collect_health() -> dict[str, Any]:
+    """Collect system health status."""
+    # Get session metrics
+    session_stats = session_monitor.get_session_stats()
+
+    # Get log stats
+    log_stats = log_manager.get_stats()
+
+    return {
+        "status": "healthy",
+        "session": session_stats,
+        "logs": log_stats,
+        "workers": {
+            "search": search_pool.get_stats(),
+            "health": health_pool.get_stats(),
+        },
+        "search_batching": search_batcher.get_stats(),
+    }
+
+
 @app.get("/health")
 async def health() -> dict[str, Any]:
     """Get system health status."""
     try:
-        # Get session metrics
-        session_stats = session_monitor.get_session_stats()
-
-        # Get log stats
-        log_stats = log_manager.get_stats()
-
-        return {
-            "status": "healthy",
-            "session": session_stats,
-            "logs": log_stats,
-        }
+        return await health_pool.run(_collect_health)
 
+    except ExecutorSaturatedError as e:
+        logger.warning("Health check rejected: %s", str(e))
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"}) from e
     except Exception as e:
         logger.error("Health check failed: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -58,7 +58,12 @@ class ProcessNotesCommand(NovaCommand):
 
         try:
             # Process notes using BearNoteProcessing
-            processor = BearNoteProcessing(input_dir=input_dir, output_dir=output_dir)
+            processor = BearNoteProcessing(
+                input_dir=input_dir,
+                output_dir=output_dir,
+                workers=kwargs.get("parse_workers") or 1,
+                checksum=bool(kwargs.get("checksum")),
+            )
             documents = processor.process_bear_notes()
 
             # Update monitoring
@@ -100,6 +105,18 @@ class ProcessNotesCommand(NovaCommand):
             default=None,
             help="Output directory path (default: .nova/processing)",
         )
+        @click.option(
+            "--parse-workers",
+            type=click.IntRange(min=1),
+            default=1,
+            help="Number of note files to read and parse in parallel",
+        )
+        @click.option(
+            "--checksum",
+            is_flag=True,
+            default=False,
+            help="Compare file hashes, not just size and mtime, when syncing the output",
+        )
         def command(**kwargs: Any) -> None:
             """Process notes from input directory.
 
@@ -1,13 +1,21 @@
 """Process vectors command."""
 
+import hashlib
+import itertools
 import logging
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 import click
 
 from nova.bear_parser.processing import BearNoteProcessing
 from nova.cli.commands.base_vector_command import BaseVectorCommand
+from nova.docling.encoding import read_text
 from nova.vector_store.chunking import Chunk
+from nova.vector_store.pipeline import bounded_stage
+from nova.vector_store.store import VectorStore
+from nova.vector_store.token_chunking import TokenChunkingEngine, TokenCounter, TokenStats
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +26,9 @@ class ProcessVectorsCommand(BaseVectorCommand):
     name = "process-vectors"
     help = "Process text files or Bear notes into vector chunks"
 
+    # Chunks tokenized together when measuring how well they fit the token limit
+    TOKEN_STATS_BATCH_SIZE = 256
+
     def create_command(self) -> click.Command:
         """Create the click command.
 
@@ -44,8 +55,73 @@ class ProcessVectorsCommand(BaseVectorCommand):
             help="Process input directory as Bear notes",
             default=False,
         )
+        @click.option(
+            "--batch-size",
+            type=click.IntRange(min=1),
+            default=VectorStore.DEFAULT_BATCH_SIZE,
+            help="Number of chunks to embed and insert per batch",
+        )
+        @click.option(
+            "--incremental",
+            is_flag=True,
+            help="Only re-index files that were added or changed since the last run",
+            default=False,
+        )
+        @click.option(
+            "--prune",
+            is_flag=True,
+            help="Remove chunks of files deleted from the input directory",
+            default=False,
+        )
+        @click.option(
+            "--parse-workers",
+            type=click.IntRange(min=1),
+            default=1,
+            help="Number of Bear note files to read and parse in parallel",
+        )
+        @click.option(
+            "--chunk-workers",
+            type=click.IntRange(min=1),
+            default=1,
+            help="Number of processes to chunk documents in",
+        )
+        @click.option(
+            "--token-chunking",
+            is_flag=True,
+            help="Size chunks by the embedding model's tokens instead of characters",
+            default=False,
+        )
+        @click.option(
+            "--chunk-overlap",
+            type=click.IntRange(min=0),
+            default=0,
+            help="Number of tokens consecutive chunks of a section share (with --token-chunking)",
+        )
+        @click.option(
+            "--pdfs",
+            is_flag=True,
+            help="Also index PDF files, chunking their pages as they are extracted",
+            default=False,
+        )
+        @click.option(
+            "--pdf-workers",
+            type=click.IntRange(min=1),
+            default=1,
+            help="Number of processes to extract PDF pages in (with --pdfs)",
+        )
         def command(
-            input_dir: str, output_dir: str | None = None, bear_notes: bool = False
+            input_dir: str,
+            output_dir: str | None = None,
+            bear_notes: bool = False,
+            batch_size: int = VectorStore.DEFAULT_BATCH_SIZE,
+            incremental: bool = False,
+            prune: bool = False,
+            parse_workers: int = 1,
+            chunk_workers: int = 1,
+            token_chunking: bool = False,
+            chunk_overlap: int = 0,
+            pdfs: bool = False,
+            pdf_workers: int = 1,
         ) -> None:
             """Process text files into vector chunks.
 
@@ -53,20 +129,60 @@ class ProcessVectorsCommand(BaseVectorCommand):
                 input_dir: Input directory containing text files
                 output_dir: Optional output directory for vector store
                 bear_notes: Whether to process input directory as Bear notes
+                batch_size: Number of chunks to embed and insert per batch
+                incremental: Whether to only re-index added or changed files
+                prune: Whether to remove chunks of deleted files; implied by incremental
+                parse_workers: Number of Bear note files to parse in parallel
+                chunk_workers: Number of processes to chunk documents in
+                token_chunking: Whether to size chunks by the model's tokens
+                chunk_overlap: Number of tokens consecutive chunks share
+                pdfs: Whether to also index PDF files
+                pdf_workers: Number of processes to extract PDF pages in
             """
-            self.run(input_dir=input_dir, output_dir=output_dir, bear_notes=bear_notes)
+            self.run(
+                input_dir=input_dir,
+                output_dir=output_dir,
+                bear_notes=bear_notes,
+                batch_size=batch_size,
+                incremental=incremental,
+                prune=prune,
+                parse_workers=parse_workers,
+                chunk_workers=chunk_workers,
+                token_chunking=token_chunking,
+                chunk_overlap=chunk_overlap,
+                pdfs=pdfs,
+                pdf_workers=pdf_workers,
+            )
 
         return command
 
-    def _process_directory(self, directory: Path, bear_notes: bool = False) -> list[Chunk]:
+    def _process_directory(
+        self,
+        directory: Path,
+        bear_notes: bool = False,
+        parse_workers: int = 1,
+        chunk_workers: int = 1,
+        token_chunking: bool = False,
+        chunk_overlap: int = 0,
+        pdfs: bool = False,
+        pdf_workers: int = 1,
+        **kwargs: Any,
+    ) -> Iterator[Chunk]:
         """Process files in a directory.
 
         Args:
             directory: Directory containing files to process
             bear_notes: Whether to process as Bear notes
+            parse_workers: Number of Bear note files to parse in parallel
+            chunk_workers: Number of processes to chunk documents in
+            token_chunking: Whether to size chunks by the embedding model's tokens
+            chunk_overlap: Number of tokens consecutive chunks of a section share
+            pdfs: Whether to also index PDF files in a markdown directory
+            pdf_workers: Number of processes to extract PDF pages in
+            **kwargs: Additional command arguments (unused)
 
         Returns:
-            List of chunks created from files
+            Iterator over chunks created from files
 
         Raises:
             Exception: If there is an error processing any file
@@ -74,90 +190,201 @@ class ProcessVectorsCommand(BaseVectorCommand):
         if not directory.exists():
             raise click.UsageError(f"Directory not found: {directory}")
 
+        counter = None
+        if token_chunking:
+            # Loads the embedding model for its tokenizer, so only do it when asked
+            if self.vector_store:
+                embedding_engine = self.vector_store.embedding_engine
+            else:
+                from nova.vector_store.embedding import EmbeddingEngine
+
+                embedding_engine = EmbeddingEngine()
+            counter = embedding_engine.token_counter()
+            try:
+                self.chunking_engine = TokenChunkingEngine(counter, overlap=chunk_overlap)
+            except ValueError as e:
+                raise click.UsageError(str(e)) from e
+            logger.info(f"Chunking by tokens (limit {counter.max_tokens}, overlap {chunk_overlap})")
+
         if bear_notes:
-            return self._process_bear_notes(directory)
+            chunks = self._process_bear_notes(directory, parse_workers, chunk_workers)
         else:
-            return self._process_markdown_files(directory)
+            chunks = self._process_markdown_files(directory, chunk_workers)
+            if pdfs:
+                chunks = itertools.chain(chunks, self._process_pdf_files(directory, pdf_workers))
+        return self._measure_tokens(chunks, counter) if counter else chunks
 
-    def _process_bear_notes(self, directory: Path) -> list[Chunk]:
+    def _measure_tokens(self, chunks: Iterable[Chunk], counter: TokenCounter) -> Iterator[Chunk]:
+        """Pass chunks through, logging how well they fit the token limit once done.
+
+        Args:
+            chunks: Chunks to measure
+            counter: Counter of the embedding model's tokens
+
+        Yields:
+            The chunks, unchanged
+        """
+        stats: list[TokenStats] = []
+        batch: list[Chunk] = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) >= self.TOKEN_STATS_BATCH_SIZE:
+                stats.append(TokenStats.measure(batch, counter))
+                yield from batch
+                batch = []
+        stats.append(TokenStats.measure(batch, counter))
+        yield from batch
+        logger.info(f"Token chunking: {TokenStats.combine(stats)}")
+
+    def _process_bear_notes(
+        self, directory: Path, workers: int = 1, chunk_workers: int = 1
+    ) -> Iterator[Chunk]:
         """Process Bear notes in a directory.
 
+        Notes are read in a background stage while earlier notes are chunked.
+
         Args:
             directory: Directory containing Bear notes
+            workers: Number of note files to parse in parallel
+            chunk_workers: Number of processes to chunk notes in
+
+        Returns:
+            Iterator over chunks created from Bear notes
+        """
+        return self._chunk_documents(
+            bounded_stage(
+                self._read_bear_notes(directory, workers),
+                maxsize=self.READ_QUEUE_SIZE,
+                name="read",
+            ),
+            workers=chunk_workers,
+        )
+
+    def _process_markdown_files(self, directory: Path, chunk_workers: int = 1) -> Iterator[Chunk]:
+        """Process markdown files in a directory.
+
+        Files are read in a background stage while earlier files are chunked.
+
+        Args:
+            directory: Directory containing markdown files
+            chunk_workers: Number of processes to chunk files in
 
         Returns:
-            List of chunks created from Bear notes
+            Iterator over chunks created from markdown files
+        """
+        return self._chunk_documents(
+            bounded_stage(
+                self._read_markdown_files(directory), maxsize=self.READ_QUEUE_SIZE, name="read"
+            ),
+            workers=chunk_workers,
+        )
+
+    def _process_pdf_files(self, directory: Path, workers: int = 1) -> Iterator[Chunk]:
+        """Process PDF files in a directory.
+
+        Pages are chunked as they are extracted, so a large PDF is never held
+        in memory whole.
+
+        Args:
+            directory: Directory containing PDF files
+            workers: Number of processes to extract the pages of each file in
+
+        Yields:
+            Chunks created from PDF files
         """
-        # Use BearNoteProcessing to get documents
-        processor = BearNoteProcessing(input_dir=directory)
-        documents = processor.process_bear_notes()
+        # Imported here so that markdown-only runs do not load the PDF libraries
+        from nova.docling.document_converter import DocumentConverter
+        from nova.docling.pdf_stream import PdfStreamOptions
 
-        # Process each document into chunks
-        chunks: list[Chunk] = []
-        for doc in documents:
+        converter = DocumentConverter(pdf_options=PdfStreamOptions(workers=workers))
+        for file_path in sorted(directory.glob("**/*.pdf")):
+            if not self._should_read(file_path):
+                continue
             try:
-                # Create chunks using chunking engine
-                file_chunks = self.chunking_engine.chunk_document(
-                    text=doc.content, source=Path(doc.origin) if doc.origin else None
-                )
-                chunks.extend(file_chunks)
+                with file_path.open("rb") as f:
+                    digest = hashlib.file_digest(f, "sha256").hexdigest()
+            except OSError as e:
+                error_msg = f"Error reading file {file_path}: {e!s}"
+                logger.error(error_msg)
+                self.monitor.record_rebuild_error(error_msg)
+                continue
+
+            # The text is only known once extracted, so PDFs are compared by content hash
+            if self.manifest_update and not self.manifest_update.should_index(digest, file_path):
+                logger.debug(f"Skipping unchanged file {file_path}")
+                continue
+
+            pages = (page.markdown for page in converter.stream_pdf(file_path))
+            count = 0
+            try:
+                for chunk in self.chunking_engine.chunk_pages(pages, source=file_path):
+                    if self.manifest_update:
+                        self.manifest_update.track_chunks(file_path, [chunk.chunk_id])
+                    count += 1
+                    yield chunk
             except Exception as e:
-                error_msg = f"Error processing document {doc.name}: {e!s}"
+                error_msg = f"Error processing file {file_path}: {e}"
                 logger.error(error_msg)
                 self.monitor.record_rebuild_error(error_msg)
+                if self.manifest_update:
+                    self.manifest_update.mark_failed(file_path)
                 continue
+            if not count:
+                error_msg = f"No chunks created from file {file_path}"
+                logger.warning(error_msg)
+                self.monitor.record_rebuild_error(error_msg)
 
-        return chunks
+    def _read_bear_notes(
+        self, directory: Path, workers: int = 1
+    ) -> Iterator[tuple[str, Path | None]]:
+        """Read Bear notes in a directory.
 
-    def _process_markdown_files(self, directory: Path) -> list[Chunk]:
-        """Process markdown files in a directory.
+        Args:
+            directory: Directory containing Bear notes
+            workers: Number of note files to parse in parallel
+
+        Yields:
+            Tuples of (note content, source path)
+        """
+        # Only content and path are chunked, so skip building BearDocuments
+        processor = BearNoteProcessing(input_dir=directory, workers=workers)
+        for note in processor.iter_notes(file_filter=self._should_read):
+            yield note.content, note.source_path
+
+    def _read_markdown_files(self, directory: Path) -> Iterator[tuple[str, Path | None]]:
+        """Read markdown files in a directory.
 
         Args:
             directory: Directory containing markdown files
 
-        Returns:
-            List of chunks created from markdown files
+        Yields:
+            Tuples of (file content, file path)
         """
-        chunks: list[Chunk] = []
         for file_path in directory.glob("**/*.md"):
-            try:
-                # Read the file content
-                try:
-                    text = file_path.read_text(encoding="utf-8")
-                except UnicodeDecodeError:
-                    # If UTF-8 fails, try Latin-1
-                    try:
-                        text = file_path.read_text(encoding="latin-1")
-                        logger.warning(f"File {file_path} contains non-UTF-8 characters")
-                    except Exception as e:
-                        error_msg = f"Error reading file {file_path}: {e!s}"
-                        logger.error(error_msg)
-                        self.monitor.record_rebuild_error(error_msg)
-                        continue
-                except Exception as e:
-                    error_msg = f"Error reading file {file_path}: {e!s}"
-                    logger.error(error_msg)
-                    self.monitor.record_rebuild_error(error_msg)
-                    continue
-
-                # Check for null bytes
-                if "\x00" in text:
-                    error_msg = f"File {file_path} contains null bytes"
-                    logger.error(error_msg)
-                    self.monitor.record_rebuild_error(error_msg)
-                    continue
-
-                # Process the file content
-                file_chunks = self.chunking_engine.chunk_document(text, source=file_path)
-                if not file_chunks:
-                    error_msg = f"No chunks created from file {file_path}"
-                    logger.warning(error_msg)
-                    self.monitor.record_rebuild_error(error_msg)
-                chunks.extend(file_chunks)
+            if not self._should_read(file_path):
+                continue
 
+            # Read the file content
+            try:
+                decoded = read_text(file_path)
             except Exception as e:
-                error_msg = f"Error processing file {file_path}: {e!s}"
+                error_msg = f"Error reading file {file_path}: {e!s}"
+                logger.error(error_msg)
+                self.monitor.record_rebuild_error(error_msg)
+                continue
+
+            text = decoded.text
+            if decoded.encoding not in ("utf-8", "utf-8-sig"):
+                logger.warning(
+                    f"File {file_path} is not UTF-8, decoded as {decoded.encoding} "
+                    f"(detection took {decoded.detection_time * 1000:.2f}ms)"
+                )
+
+            # Check for null bytes
+            if "\x00" in text:
+                error_msg = f"File {file_path} contains null bytes"
                 logger.error(error_msg)
                 self.monitor.record_rebuild_error(error_msg)
+                continue
 
-        return chunks
+            yield text, file_path
@@ -15,6 +15,7 @@ from rich.logging import RichHandler
 from nova.cli.commands import (
     CleanProcessingCommand,
     CleanVectorsCommand,
+    ConvertAttachmentsCommand,
     MonitorCommand,
     ProcessNotesCommand,
     ProcessVectorsCommand,
@@ -115,6 +116,7 @@ class NovaCLI:
         command_classes = [
             CleanProcessingCommand,
             CleanVectorsCommand,
+            ConvertAttachmentsCommand,
             MonitorCommand,
             ProcessNotesCommand,
             ProcessVectorsCommand,
@@ -1,5 +1,6 @@
 """Nova docling integration module."""
 
+from .attachments import AttachmentConverter, ConversionCache
 from .datamodel import (
     EXT_TO_FORMAT,
     FORMAT_TO_EXT,
@@ -20,4 +21,6 @@ __all__ = [
     "EXT_TO_FORMAT",
     "FormatDetector",
     "DocumentConverter",
+    "AttachmentConverter",
+    "ConversionCache",
 ]
@@ -0,0 +1,433 @@
+"""Parallel, cached conversion of Bear note attachments.
+
+Bear exports keep each note's attachments in a directory next to the note.
+Converting them is CPU-bound (pdfplumber, pillow-heif) and holds the GIL,
+so ``AttachmentConverter`` runs ``DocumentConverter`` in a process pool.
+Converted documents are cached by file content hash in ``ConversionCache``
+so that unchanged attachments are never converted twice.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from .datamodel.base_models import InputFormat
+from .datamodel.document import Document
+from .document_converter import DocumentConverter
+
+logger = logging.getLogger(__name__)
+
+# Extensions DocumentConverter recognizes; anything else would be read as text
+ATTACHMENT_EXTENSIONS = frozenset(
+    {
+        ".gif",
+        ".heic",
+        ".html",
+        ".jpeg",
+        ".jpg",
+        ".json",
+        ".md",
+        ".pdf",
+        ".png",
+        ".svg",
+        ".txt",
+        ".webp",
+    }
+)
+
+MetadataValue = str | date | datetime | list[str]
+
+# Converter of the current worker process, created on first use
+_worker_converter: DocumentConverter | None = None
+
+
+def _convert_in_worker(file_path: Path) -> Document:
+    """Convert a file in a worker process.
+
+    Args:
+        file_path: File to convert
+
+    Returns:
+        Converted document
+    """
+    global _worker_converter
+    if _worker_converter is None:
+        _worker_converter = DocumentConverter()
+    return _worker_converter.convert(file_path)
+
+
+def find_attachments(input_dir: Path) -> list[Path]:
+    """List convertible files in the attachment directories of a Bear export.
+
+    Args:
+        input_dir: Bear export directory
+
+    Returns:
+        Sorted attachment files
+    """
+    files: list[Path] = []
+    for attachment_dir in input_dir.glob("*"):
+        if attachment_dir.is_dir():
+            files.extend(
+                path
+                for path in attachment_dir.rglob("*")
+                if path.is_file() and path.suffix.lower() in ATTACHMENT_EXTENSIONS
+            )
+    return sorted(files)
+
+
+def markdown_output_paths(
+    files: Iterable[Path], input_dir: Path, output_dir: Path
+) -> dict[Path, Path]:
+    """Choose where to write the markdown conversion of each attachment.
+
+    Each attachment keeps its relative path with a ``.md`` suffix, so
+    ``page.html`` becomes ``page.md`` and ``notes.md`` stays ``notes.md``.
+    When several attachments of a directory would get the same name, such as
+    ``scan.pdf`` and ``scan.png``, the later ones keep their original suffix
+    in the name, as in ``scan.png.md``, numbered if that is taken too.
+
+    Args:
+        files: Attachment files inside the input directory
+        input_dir: Bear export directory
+        output_dir: Directory to write the conversions to
+
+    Returns:
+        Output path of each attachment
+    """
+    outputs: dict[Path, Path] = {}
+    # Compare names case-insensitively, as on the default macOS filesystem
+    taken: set[str] = set()
+    for path in files:
+        output = (output_dir / path.relative_to(input_dir)).with_suffix(".md")
+        if str(output).casefold() in taken:
+            output = output.with_name(f"{path.name}.md")
+            number = 1
+            while str(output).casefold() in taken:
+                number += 1
+                output = output.with_name(f"{path.name}.{number}.md")
+        taken.add(str(output).casefold())
+        outputs[path] = output
+    return outputs
+
+
+def _encode_metadata(metadata: dict[str, MetadataValue]) -> str:
+    """Serialize document metadata, preserving date values."""
+    encoded: dict[str, Any] = {}
+    for key, value in metadata.items():
+        if isinstance(value, datetime):
+            encoded[key] = {"$datetime": value.isoformat()}
+        elif isinstance(value, date):
+            encoded[key] = {"$date": value.isoformat()}
+        else:
+            encoded[key] = value
+    return json.dumps(encoded)
+
+
+def _decode_metadata(data: str) -> dict[str, MetadataValue]:
+    """Deserialize document metadata written by _encode_metadata."""
+    metadata: dict[str, MetadataValue] = {}
+    for key, value in json.loads(data).items():
+        if isinstance(value, dict) and "$datetime" in value:
+            metadata[key] = datetime.fromisoformat(value["$datetime"])
+        elif isinstance(value, dict) and "$date" in value:
+            metadata[key] = date.fromisoformat(value["$date"])
+        else:
+            metadata[key] = value
+    return metadata
+
+
+class ConversionCache:
+    """On-disk cache of converted attachment documents."""
+
+    FILENAME = "conversions.db"
+    # Bump when converter output changes so that stale conversions are ignored
+    VERSION = 3
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory containing the cache database
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / self.FILENAME
+        self.hits = 0
+        self.misses = 0
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize the cache database."""
+        with self._get_db() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS conversions (
+                    key TEXT PRIMARY KEY,
+                    format TEXT NOT NULL,
+                    title TEXT,
+                    tags TEXT NOT NULL,
+                    metadata TEXT NOT NULL,
+                    content TEXT NOT NULL
+                )
+            """
+            )
+
+    @contextmanager
+    def _get_db(self) -> Iterator[sqlite3.Connection]:
+        """Context manager for database connections.
+
+        Returns:
+            SQLite database connection
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def key(self, file_path: Path) -> str:
+        """Get the cache key for a file.
+
+        The file name is part of the key because converted content names
+        the file it came from.
+
+        Args:
+            file_path: File to convert
+
+        Returns:
+            Hex digest of the converter version, file name and content
+        """
+        with file_path.open("rb") as f:
+            digest = hashlib.file_digest(f, "sha256")
+        digest.update(f"\0{self.VERSION}\0{file_path.name}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, file_path: Path) -> Document | None:
+        """Look up a converted document.
+
+        Args:
+            key: Cache key of the file
+            file_path: Path to set as the document source
+
+        Returns:
+            Cached document or None on a miss
+        """
+        try:
+            with self._get_db() as conn:
+                row = conn.execute(
+                    "SELECT format, title, tags, metadata, content FROM conversions WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Conversion cache lookup failed: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        fmt, title, tags, metadata, content = row
+        return Document(
+            content=content,
+            format=InputFormat(fmt),
+            title=title,
+            tags=json.loads(tags),
+            metadata=_decode_metadata(metadata),
+            source_path=file_path,
+        )
+
+    def put(self, key: str, document: Document) -> None:
+        """Store a converted document.
+
+        Args:
+            key: Cache key of the file
+            document: Converted document
+        """
+        try:
+            with self._get_db() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO conversions "
+                    "(key, format, title, tags, metadata, content) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        document.format.value,
+                        document.title,
+                        json.dumps(document.tags),
+                        _encode_metadata(document.metadata),
+                        document.content,
+                    ),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Conversion cache update failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached conversions."""
+        with self._get_db() as conn:
+            conn.execute("DELETE FROM conversions")
+
+    def __len__(self) -> int:
+        """Get the number of cached conversions."""
+        with self._get_db() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM conversions").fetchone()
+        return int(row[0])
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting a single attachment."""
+
+    path: Path
+    document: Document | None = None
+    error: str | None = None
+    cached: bool = False
+
+
+class AttachmentConverter:
+    """Converts attachments in parallel, reusing cached conversions."""
+
+    # Conversions submitted ahead of the consumer, per worker
+    PREFETCH_PER_WORKER = 2
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        cache: ConversionCache | None = None,
+        use_processes: bool = True,
+    ) -> None:
+        """Initialize the converter.
+
+        Args:
+            workers: Number of conversions to run in parallel; defaults to the CPU count
+            cache: Optional cache of converted documents
+            use_processes: Whether to convert in worker processes instead of threads
+        """
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError(f"Worker count must be positive, got {self.workers}")
+        self.cache = cache
+        self.use_processes = use_processes
+        self.converted = 0
+        self.cached = 0
+        self.failed = 0
+
+    def _lookup(self, file_path: Path) -> tuple[str | None, Document | None]:
+        """Look up a file in the cache.
+
+        Args:
+            file_path: File to convert
+
+        Returns:
+            Cache key, or None without a cache, and the cached document if any
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.key(file_path)
+        return key, self.cache.get(key, file_path)
+
+    def _finish(
+        self, file_path: Path, key: str | None, future: Future[Document], cached: bool
+    ) -> ConversionResult:
+        """Collect a conversion and store it in the cache.
+
+        Args:
+            file_path: Converted file
+            key: Cache key of the file, or None without a cache
+            future: Future of the converted document
+            cached: Whether the document came from the cache
+
+        Returns:
+            Conversion result
+        """
+        try:
+            document = future.result()
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Failed to convert attachment {file_path}: {e}")
+            return ConversionResult(path=file_path, error=str(e))
+
+        if cached:
+            self.cached += 1
+        else:
+            self.converted += 1
+            if self.cache is not None and key is not None:
+                self.cache.put(key, document)
+        return ConversionResult(path=file_path, document=document, cached=cached)
+
+    def convert_many(self, files: Iterable[Path]) -> Iterator[ConversionResult]:
+        """Convert files, yielding results in input order.
+
+        Args:
+            files: Files to convert
+
+        Yields:
+            Result of each conversion; failures are reported, not raised
+        """
+        executor: Executor | None = None
+        if self.workers > 1:
+            if self.use_processes:
+                executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="nova_convert"
+                )
+
+        def submit(file_path: Path) -> tuple[Path, str | None, Future[Document], bool]:
+            future: Future[Document]
+            try:
+                key, document = self._lookup(file_path)
+            except OSError as e:
+                future = Future()
+                future.set_exception(e)
+                return file_path, None, future, False
+            if document is not None:
+                future = Future()
+                future.set_result(document)
+                return file_path, key, future, True
+            if executor is None:
+                future = Future()
+                try:
+                    future.set_result(_convert_in_worker(file_path))
+                except Exception as e:
+                    future.set_exception(e)
+                return file_path, key, future, False
+            return file_path, key, executor.submit(_convert_in_worker, file_path), False
+
+        # Keep a bounded window of conversions in flight and yield them in order
+        remaining = iter(files)
+        pending: deque[tuple[Path, str | None, Future[Document], bool]] = deque()
+        window = self.workers * self.PREFETCH_PER_WORKER
+        try:
+            for file_path in remaining:
+                pending.append(submit(file_path))
+                if len(pending) >= window:
+                    break
+            while pending:
+                file_path, key, future, cached = pending.popleft()
+                next_file = next(remaining, None)
+                if next_file is not None:
+                    pending.append(submit(next_file))
+                yield self._finish(file_path, key, future, cached)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get conversion statistics.
+
+        Returns:
+            Number of converted, cached and failed attachments
+        """
+        return {"converted": self.converted, "cached": self.cached, "failed": self.failed}
@@ -8,9 +8,8 @@ from html.parser import HTMLParser
 from pathlib import Path
 from typing import Any, NotRequired, TypedDict, cast
 
-import chardet
 import frontmatter  # type: ignore
-import pdfplumber
+import html2text
 import piexif
 import pillow_heif
 import pypandoc
@@ -18,6 +17,8 @@ from PIL import ExifTags, Image
 
 from .datamodel.base_models import InputFormat
 from .datamodel.document import Document
+from .encoding import read_text
+from .pdf_stream import PdfPageStream, PdfStreamOptions
 
 
 class DocumentConversionError(Exception):
@@ -84,83 +85,114 @@ def _normalize_path(file_path: Path, relative_to: Path | None = None) -> str:
     return normalized.replace("\\", "/")
 
 
-def _convert_image_to_markdown(image_path: Path, converter: "DocumentConverter") -> Document:
-    """Convert an image file to markdown format."""
-    try:
-        image = Image.open(image_path)
-        metadata: dict[str, str | date | datetime | list[str]] = {
-            "format": str(image.format).lower(),
-            "mode": str(image.mode),
-            "size": f"{image.width}x{image.height}",
-        }
+def _check_image_pixels(width: int, height: int, limit: int | None) -> None:
+    """Check that an image is within the pixel count limit.
 
-        # Extract format-specific metadata
-        if image.format == "PNG":
-            for key, value in image.info.items():
-                if isinstance(value, (str, int, float, bool)):
-                    metadata[f"png_{key}"] = str(value)
-        elif image.format == "JPEG":
-            try:
-                exif_dict = piexif.load(image.info.get("exif", b""))
-                for ifd in ("0th", "Exif", "GPS"):
-                    if ifd in exif_dict:
-                        for tag, value in exif_dict[ifd].items():
-                            try:
-                                if ifd == "0th":
-                                    tag_name = piexif.TAGS["Image"][tag]["name"]
-                                elif ifd == "Exif":
-                                    tag_name = piexif.TAGS["Exif"][tag]["name"]
-                                elif ifd == "GPS":
-                                    tag_name = piexif.TAGS["GPS"][tag]["name"]
-                                else:
-                                    continue
-
-                                if isinstance(value, bytes):
-                                    try:
-                                        value = value.decode("utf-8")
-                                    except UnicodeDecodeError:
-                                        value = value.hex()
-                                metadata[f"exif_{tag_name}"] = str(value)
-                            except KeyError:
-                                continue
-            except Exception as e:
-                logger.warning(f"Error extracting EXIF data: {e}")
-        elif image.format == "WEBP":
-            # Properly handle WebP metadata
-            is_lossless = image.info.get("lossless") is True or (
-                image.mode == "RGB" and "transparency" not in image.info
-            )
-            metadata["webp_lossless"] = "True" if is_lossless else "False"
-            metadata["webp_quality"] = "100" if is_lossless else str(image.info.get("quality", 0))
-            if "loop" in image.info:
-                metadata["webp_loop"] = str(image.info["loop"])
-            if "duration" in image.info:
-                metadata["webp_duration"] = str(image.info["duration"])
+    Only the image header is needed, so oversized images are rejected
+    before any pixel data is read.
 
-        # Generate markdown content
-        content = [
-            f"# {image.format}: {image_path.name}",
-            "",
-            "## Image Information",
-            "",
-            f"- Format: {metadata['format']}",
-            f"- Mode: {metadata['mode']}",
-            f"- Size: {metadata['size']}",
-        ]
-
-        # Use _detect_format to get the correct format
-        fmt = converter._detect_format(image_path)
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        limit: Maximum number of pixels, or None for no limit
 
-        return Document(
-            content="\n".join(content),
-            format=fmt,
-            metadata=metadata,
-            source_path=image_path,
+    Raises:
+        DocumentConversionError: If the image has more pixels than the limit
+    """
+    if limit is not None and width * height > limit:
+        raise DocumentConversionError(
+            f"Image of {width}x{height} has {width * height} pixels, more than the limit of {limit}"
         )
+
+
+def _convert_image_to_markdown(image_path: Path, converter: "DocumentConverter") -> Document:
+    """Convert an image file to markdown format.
+
+    Only the image header is read; pixel data is never decoded.
+    """
+    try:
+        with Image.open(image_path) as image:
+            return _image_header_to_markdown(image, image_path, converter)
     except Exception as e:
         raise DocumentConversionError(f"Error converting image file {image_path}: {e}")
 
 
+def _image_header_to_markdown(
+    image: Image.Image, image_path: Path, converter: "DocumentConverter"
+) -> Document:
+    """Build an image Document from a lazily opened image."""
+    _check_image_pixels(image.width, image.height, converter.max_image_pixels)
+    metadata: dict[str, str | date | datetime | list[str]] = {
+        "format": str(image.format).lower(),
+        "mode": str(image.mode),
+        "size": f"{image.width}x{image.height}",
+    }
+
+    # Extract format-specific metadata
+    if image.format == "PNG":
+        for key, value in image.info.items():
+            if isinstance(value, (str, int, float, bool)):
+                metadata[f"png_{key}"] = str(value)
+    elif image.format == "JPEG":
+        try:
+            exif_dict = piexif.load(image.info.get("exif", b""))
+            for ifd in ("0th", "Exif", "GPS"):
+                if ifd in exif_dict:
+                    for tag, value in exif_dict[ifd].items():
+                        try:
+                            if ifd == "0th":
+                                tag_name = piexif.TAGS["Image"][tag]["name"]
+                            elif ifd == "Exif":
+                                tag_name = piexif.TAGS["Exif"][tag]["name"]
+                            elif ifd == "GPS":
+                                tag_name = piexif.TAGS["GPS"][tag]["name"]
+                            else:
+                                continue
+
+                            if isinstance(value, bytes):
+                                try:
+                                    value = value.decode("utf-8")
+                                except UnicodeDecodeError:
+                                    value = value.hex()
+                            metadata[f"exif_{tag_name}"] = str(value)
+                        except KeyError:
+                            continue
+        except Exception as e:
+            logger.warning(f"Error extracting EXIF data: {e}")
+    elif image.format == "WEBP":
+        # Properly handle WebP metadata
+        is_lossless = image.info.get("lossless") is True or (
+            image.mode == "RGB" and "transparency" not in image.info
+        )
+        metadata["webp_lossless"] = "True" if is_lossless else "False"
+        metadata["webp_quality"] = "100" if is_lossless else str(image.info.get("quality", 0))
+        if "loop" in image.info:
+            metadata["webp_loop"] = str(image.info["loop"])
+        if "duration" in image.info:
+            metadata["webp_duration"] = str(image.info["duration"])
+
+    # Generate markdown content
+    content = [
+        f"# {image.format}: {image_path.name}",
+        "",
+        "## Image Information",
+        "",
+        f"- Format: {metadata['format']}",
+        f"- Mode: {metadata['mode']}",
+        f"- Size: {metadata['size']}",
+    ]
+
+    # Use _detect_format to get the correct format
+    fmt = converter._detect_format(image_path)
+
+    return Document(
+        content="\n".join(content),
+        format=fmt,
+        metadata=metadata,
+        source_path=image_path,
+    )
+
+
 def _convert_svg_to_markdown(file_path: Path) -> Document:
     """Convert SVG file to markdown.
 
@@ -253,10 +285,12 @@ class MetadataParser(HTMLParser):
         self.metadata: dict[str, str] = {}
         self.in_title = False
         self.current_meta = None
+        self._title: list[str] = []
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
         if tag == "title":
             self.in_title = True
+            self._title = []
         elif tag == "meta":
             attrs_dict = {k: v for k, v in attrs if v is not None}
             name = attrs_dict.get("name", "")
@@ -273,19 +307,77 @@ class MetadataParser(HTMLParser):
                 self.metadata[name[3:]] = content
 
     def handle_endtag(self, tag: str) -> None:
-        if tag == "title":
+        if tag == "title" and self.in_title:
             self.in_title = False
+            self.metadata["title"] = "".join(self._title).strip()
 
     def handle_data(self, data: str) -> None:
+        # Titles can arrive in pieces, e.g. split around character references
         if self.in_title:
-            self.metadata["title"] = data.strip()
+            self._title.append(data)
+
+
+class HTMLMarkdownParser(html2text.HTML2Text):
+    """Converts HTML to markdown in-process, collecting metadata in the same pass.
+
+    Every parser event is also passed to a MetadataParser, so the document is
+    parsed once for both the markdown and its title and meta tags.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser and the metadata parser it feeds."""
+        # Do not wrap lines; chunking relies on paragraph boundaries instead
+        super().__init__(bodywidth=0)
+        self.metadata_parser = MetadataParser()
+
+    @property
+    def metadata(self) -> dict[str, str]:
+        """Get the metadata collected while converting."""
+        return self.metadata_parser.metadata
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Handle a start tag for both the metadata and the markdown."""
+        self.metadata_parser.handle_starttag(tag, attrs)
+        super().handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        """Handle an end tag for both the metadata and the markdown."""
+        self.metadata_parser.handle_endtag(tag)
+        super().handle_endtag(tag)
+
+    def handle_data(self, data: str, entity_char: bool = False) -> None:
+        """Handle text for both the metadata and the markdown."""
+        self.metadata_parser.handle_data(data)
+        super().handle_data(data, entity_char)
 
 
 class DocumentConverter:
     """Document converter class."""
 
-    def __init__(self) -> None:
-        """Initialize the document converter."""
+    DEFAULT_MAX_FILE_SIZE = 256 * 1024 * 1024
+    DEFAULT_MAX_IMAGE_PIXELS = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        pdf_options: PdfStreamOptions | None = None,
+        use_pandoc: bool = False,
+        max_file_size: int | None = DEFAULT_MAX_FILE_SIZE,
+        max_image_pixels: int | None = DEFAULT_MAX_IMAGE_PIXELS,
+    ) -> None:
+        """Initialize the document converter.
+
+        Args:
+            pdf_options: Parallelism and limits of PDF page extraction
+            use_pandoc: Convert HTML with pandoc instead of in-process html2text
+            max_file_size: Largest file in bytes to convert, or None for no
+                limit. Checked before the file is read.
+            max_image_pixels: Largest image in pixels to convert, or None for
+                no limit. Checked from the image header.
+        """
+        self.pdf_options = pdf_options
+        self.use_pandoc = use_pandoc
+        self.max_file_size = max_file_size
+        self.max_image_pixels = max_image_pixels
         self.supported_formats = {
             InputFormat.MD,
             InputFormat.HTML,
@@ -355,14 +447,20 @@ class DocumentConverter:
             if fmt not in self.supported_formats:
                 raise DocumentConversionError(f"Unsupported format: {fmt}")
 
+            size = file_path.stat().st_size
+            if self.max_file_size is not None and size > self.max_file_size:
+                raise DocumentConversionError(
+                    f"File of {size} bytes is larger than the limit of {self.max_file_size}"
+                )
+
             if fmt == InputFormat.HEIC:
-                return _convert_heic_to_markdown(file_path)
+                return _convert_heic_to_markdown(file_path, self.max_image_pixels)
             elif fmt in [InputFormat.PNG, InputFormat.JPEG, InputFormat.GIF, InputFormat.WEBP]:
                 return _convert_image_to_markdown(file_path, self)
             elif fmt == InputFormat.MD:
                 return _convert_markdown_to_markdown(file_path)
             elif fmt == InputFormat.HTML:
-                return _convert_html_to_markdown(file_path)
+                return _convert_html_to_markdown(file_path, self.use_pandoc)
             elif fmt == InputFormat.JSON:
                 return _convert_json_to_markdown(file_path)
             elif fmt == InputFormat.SVG:
@@ -370,12 +468,26 @@ class DocumentConverter:
             elif fmt == InputFormat.TEXT:
                 return _convert_text_to_markdown(file_path)
             elif fmt == InputFormat.PDF:
-                return _convert_pdf_to_markdown(file_path)
+                return _convert_pdf_to_markdown(file_path, self.pdf_options)
             else:
                 raise DocumentConversionError(f"Unsupported format: {fmt}")
         except Exception as e:
             raise DocumentConversionError(f"Error converting file {file_path}: {e}")
 
+    def stream_pdf(self, file_path: Path) -> PdfPageStream:
+        """Stream the pages of a PDF file.
+
+        Unlike convert, pages are extracted lazily, so they can be chunked
+        one at a time without holding the whole document in memory.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            Iterable of the file's pages in order
+        """
+        return PdfPageStream(file_path, self.pdf_options)
+
 
 def _convert_markdown_to_markdown(file_path: Path) -> Document:
     """Convert markdown file to Document.
@@ -440,11 +552,12 @@ def _convert_json_to_markdown(file_path: Path) -> Document:
         raise DocumentConversionError(f"Error converting JSON file {file_path}: {e}")
 
 
-def _convert_html_to_markdown(file_path: Path) -> Document:
+def _convert_html_to_markdown(file_path: Path, use_pandoc: bool = False) -> Document:
     """Convert HTML file to markdown format.
 
     Args:
         file_path: Path to the HTML file.
+        use_pandoc: Convert with a pandoc subprocess instead of html2text.
 
     Returns:
         Document object containing markdown content and metadata.
@@ -453,19 +566,24 @@ def _convert_html_to_markdown(file_path: Path) -> Document:
         DocumentConversionError: If conversion fails.
     """
     try:
-        # Parse metadata first
-        with open(file_path, encoding="utf-8") as f:
-            html_content = f.read()
+        html_content = read_text(file_path).text
+
+        if use_pandoc:
+            parser = MetadataParser()
+            parser.feed(html_content)
+            parser.close()
+            output = pypandoc.convert_text(html_content, "markdown", format="html")
+            html_metadata = parser.metadata
+        else:
+            # Convert in-process, collecting metadata in the same pass
+            html_parser = HTMLMarkdownParser()
+            output = html_parser.handle(html_content)
+            html_metadata = html_parser.metadata
 
-        parser = MetadataParser()
-        parser.feed(html_content)
         metadata: dict[str, str | date | datetime | list[str]] = {
-            k: v for k, v in parser.metadata.items()
+            k: v for k, v in html_metadata.items()
         }
 
-        # Convert HTML to markdown using pandoc
-        output = pypandoc.convert_file(str(file_path), "markdown", format="html")
-
         return Document(
             content=output, format=InputFormat.HTML, metadata=metadata, source_path=file_path
         )
@@ -486,20 +604,15 @@ def _convert_text_to_markdown(file_path: Path) -> Document:
         DocumentConversionError: If conversion fails.
     """
     try:
-        # Detect encoding
-        with open(file_path, "rb") as f:
-            raw = f.read()
-            result = chardet.detect(raw)
-            encoding = result["encoding"] or "utf-8"
-
-        # Read file with detected encoding
-        with open(file_path, encoding=encoding) as f:
-            content = f.read()
+        # Read once, detecting the encoding only if the file is not UTF-8
+        decoded = read_text(file_path)
+        content = decoded.text
 
         # Extract basic metadata
         metadata: dict[str, str | date | datetime | list[str]] = {
             "format": "text",
-            "encoding": encoding,
+            "encoding": decoded.encoding,
+            "encoding_detection_ms": f"{decoded.detection_time * 1000:.2f}",
             "size": str(len(content)),
             "lines": str(len(content.splitlines())),
         }
@@ -511,11 +624,12 @@ def _convert_text_to_markdown(file_path: Path) -> Document:
         raise DocumentConversionError(f"Error converting text file {file_path}: {e}")
 
 
-def _convert_pdf_to_markdown(file_path: Path) -> Document:
+def _convert_pdf_to_markdown(file_path: Path, options: PdfStreamOptions | None = None) -> Document:
     """Convert PDF file to markdown format.
 
     Args:
         file_path: Path to the PDF file.
+        options: Parallelism and limits of page extraction.
 
     Returns:
         Document object containing markdown content and metadata.
@@ -524,35 +638,24 @@ def _convert_pdf_to_markdown(file_path: Path) -> Document:
         DocumentConversionError: If conversion fails.
     """
     try:
-        # Extract text and metadata using pdfplumber
-        with pdfplumber.open(file_path) as pdf:
-            # Extract metadata
-            metadata: dict[str, str | date | datetime | list[str]] = {
-                "format": "pdf",
-                "pages": str(len(pdf.pages)),
-                "size": str(file_path.stat().st_size),
-            }
-
-            # Add PDF metadata if available
-            if pdf.metadata:
-                for key, value in pdf.metadata.items():
-                    if isinstance(value, (str, int, float, bool)):
-                        metadata[f"pdf_{key}"] = str(value)
-
-            # Extract text from each page
-            content = []
-            for i, page in enumerate(pdf.pages, 1):
-                # Add page header
-                content.append(f"\n## Page {i}\n")
-
-                # Extract text
-                text = page.extract_text()
-                if text:
-                    content.append(text)
-
-                # Add page metadata
-                page_dims = page.width, page.height
-                metadata[f"page_{i}_dimensions"] = f"{page_dims[0]:.2f}x{page_dims[1]:.2f}"
+        stream = PdfPageStream(file_path, options)
+        content = []
+        page_dimensions = {}
+        for page in stream:
+            content.append(page.markdown)
+            page_dimensions[f"page_{page.number}_dimensions"] = page.dimensions
+
+        metadata: dict[str, str | date | datetime | list[str]] = {
+            "format": "pdf",
+            "pages": str(stream.page_count),
+            "size": str(file_path.stat().st_size),
+        }
+        for key, value in stream.metadata.items():
+            metadata[f"pdf_{key}"] = value
+        metadata.update(page_dimensions)
+        if stream.truncated:
+            metadata["truncated"] = stream.truncated
+            metadata["pages_extracted"] = str(len(content))
 
         return Document(
             content="\n".join(content),
@@ -564,11 +667,14 @@ def _convert_pdf_to_markdown(file_path: Path) -> Document:
         raise DocumentConversionError(f"Error converting PDF file {file_path}: {e}")
 
 
-def _convert_heic_to_markdown(file_path: Path) -> Document:
+def _convert_heic_to_markdown(file_path: Path, max_pixels: int | None = None) -> Document:
     """Convert HEIC image to markdown.
 
+    Only the HEIF container is parsed; the image is never decoded.
+
     Args:
         file_path: Path to HEIC file.
+        max_pixels: Largest image in pixels to accept.
 
     Returns:
         Document object containing markdown content and metadata.
@@ -577,32 +683,24 @@ def _convert_heic_to_markdown(file_path: Path) -> Document:
         DocumentConversionError: If conversion fails.
     """
     try:
-        # Read HEIC file
-        heif_file = pillow_heif.read_heif(str(file_path))
-        data = heif_file.data
-        if data is None:
-            raise ValueError("Failed to read HEIC data")
-
-        image = Image.frombytes(
-            heif_file.mode,
-            heif_file.size,
-            data,
-            "raw",
-            heif_file.mode,
-            heif_file.stride,
-        )
+        # open_heif decodes lazily, on first access to the pixel data
+        heif_file = pillow_heif.open_heif(str(file_path))
+        width, height = heif_file.size
+        _check_image_pixels(width, height, max_pixels)
 
         # Extract metadata
         metadata: dict[str, str | date | datetime | list[str]] = {
             "format": "heic",
-            "mode": str(image.mode),
-            "size": f"{image.width}x{image.height}",
+            "mode": str(heif_file.mode),
+            "size": f"{width}x{height}",
         }
 
-        # Extract EXIF data if available
+        # Extract EXIF data from the raw EXIF block if available
         try:
-            exif_data = image.getexif()
-            if exif_data:
+            exif_bytes = heif_file.info.get("exif")
+            if exif_bytes:
+                exif_data = Image.Exif()
+                exif_data.load(exif_bytes)
                 exif_dict: dict[str, str] = {}
                 for tag_id in exif_data:
                     # Get the tag name, default to the tag ID if not known
@@ -0,0 +1,102 @@
+"""Text decoding with sampled encoding detection.
+
+Files are read once. Strict UTF-8 is tried first, which covers almost every
+note; only when it fails is chardet run, and then on a bounded prefix of the
+buffer rather than the whole file.
+"""
+
+import codecs
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import chardet
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_SIZE = 64 * 1024
+"""Number of leading bytes chardet inspects when a file is not UTF-8."""
+
+FALLBACK_ENCODING = "latin-1"
+"""Encoding used when the detected one cannot decode the whole buffer."""
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+@dataclass
+class DecodedText:
+    """Decoded text and how its encoding was determined."""
+
+    text: str
+    encoding: str
+    detection_time: float
+    """Seconds spent determining the encoding, including failed attempts."""
+
+
+def decode_bytes(raw: bytes, sample_size: int = DEFAULT_SAMPLE_SIZE) -> DecodedText:
+    """Decode a buffer, detecting its encoding.
+
+    Args:
+        raw: Bytes to decode
+        sample_size: Number of leading bytes to sample when UTF-8 fails
+
+    Returns:
+        Decoded text
+    """
+    start = time.perf_counter()
+
+    # BOMs identify the encoding outright; UTF-32 LE must be checked before UTF-16 LE
+    for bom, bom_encoding in _BOMS:
+        if raw.startswith(bom):
+            try:
+                text = raw.decode(bom_encoding)
+            except UnicodeDecodeError:
+                break
+            return DecodedText(text, bom_encoding, time.perf_counter() - start)
+
+    try:
+        return DecodedText(raw.decode("utf-8"), "utf-8", time.perf_counter() - start)
+    except UnicodeDecodeError:
+        pass
+
+    # Cut the sample back to a line break so chardet does not see a split character
+    sample = raw[:sample_size]
+    if len(raw) > sample_size:
+        sample = sample[: sample.rfind(b"\n") + 1] or sample
+    encoding = chardet.detect(sample)["encoding"]
+    if encoding:
+        try:
+            return DecodedText(raw.decode(encoding), encoding, time.perf_counter() - start)
+        except (UnicodeDecodeError, LookupError):
+            logger.debug(f"Detected encoding {encoding} does not decode the whole buffer")
+
+    text = raw.decode(FALLBACK_ENCODING)
+    return DecodedText(text, FALLBACK_ENCODING, time.perf_counter() - start)
+
+
+def read_text(path: Path, sample_size: int = DEFAULT_SAMPLE_SIZE) -> DecodedText:
+    """Read a file and decode it, detecting its encoding.
+
+    Args:
+        path: File to read
+        sample_size: Number of leading bytes to sample when UTF-8 fails
+
+    Returns:
+        Decoded text
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    decoded = decode_bytes(path.read_bytes(), sample_size)
+    logger.debug(
+        f"Decoded {path} as {decoded.encoding} "
+        f"(detection took {decoded.detection_time * 1000:.2f}ms)"
+    )
+    return decoded
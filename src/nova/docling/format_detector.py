@@ -1,7 +1,12 @@
 """Format detector class."""
 
+import json
 import logging
 import mimetypes
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import magic
@@ -12,12 +17,89 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)  # Set to WARNING to reduce noise
 
 
+@dataclass
+class _CacheEntry:
+    """Detected format of a file at a given size and mtime."""
+
+    size: int
+    mtime_ns: int
+    format: InputFormat | None
+
+
 class FormatDetector:
-    """Detects input format of files."""
+    """Detects input format of files.
 
-    def __init__(self) -> None:
-        """Initialize the format detector."""
-        self._magic = magic.Magic(mime=True)
+    Results are cached by path, size and mtime, so detecting the format of an
+    unchanged file again only costs a stat. With a cache path the cache is
+    kept across runs.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, trust_extensions: bool = False, cache_path: Path | None = None) -> None:
+        """Initialize the format detector.
+
+        Args:
+            trust_extensions: Take the format of files with a known extension from
+                the extension, without reading the file. Faster, but a file whose
+                extension does not match its content is misdetected.
+            cache_path: JSON file to load the detection cache from and save it to
+        """
+        self.trust_extensions = trust_extensions
+        self.cache_path = cache_path
+        self._cache: dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        # libmagic handles are not thread-safe, so each thread opens its own
+        self._local = threading.local()
+        if cache_path is not None:
+            self.load_cache()
+
+    @property
+    def _magic(self) -> magic.Magic:
+        """Get the libmagic handle of the current thread."""
+        handle = getattr(self._local, "magic", None)
+        if handle is None:
+            handle = self._local.magic = magic.Magic(mime=True)
+        return handle
+
+    def load_cache(self) -> None:
+        """Load the detection cache, starting empty if it is missing or invalid."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("version") != self.CACHE_VERSION:
+                logger.warning(f"Ignoring format cache with unsupported version: {self.cache_path}")
+                return
+            self._cache = {
+                path: _CacheEntry(size, mtime_ns, InputFormat(fmt) if fmt else None)
+                for path, (size, mtime_ns, fmt) in data["files"].items()
+            }
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable format cache {self.cache_path}: {e}")
+
+    def save_cache(self) -> None:
+        """Write the detection cache to disk atomically."""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            files = {
+                path: [entry.size, entry.mtime_ns, entry.format.value if entry.format else None]
+                for path, entry in self._cache.items()
+            }
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": self.CACHE_VERSION, "files": files}), encoding="utf-8"
+        )
+        os.replace(tmp_path, self.cache_path)
+
+    def _cached(self, file_path: Path, stat: os.stat_result) -> _CacheEntry | None:
+        """Look up a file in the cache, ignoring entries for other contents."""
+        entry = self._cache.get(str(file_path))
+        if entry and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            return entry
+        return None
 
     def detect_format(self, file_path: Path) -> InputFormat | None:
         """Detect format of a file.
@@ -33,42 +115,107 @@ class FormatDetector:
             ext = file_path.suffix.lower()
             if ext == ".md":
                 return InputFormat.MD
+            if self.trust_extensions and ext in EXT_TO_FORMAT:
+                return EXT_TO_FORMAT[ext]
 
-            # Try to detect MIME type using magic
-            mime_type = self._magic.from_file(str(file_path))
-
-            # Special handling for text/plain files
-            if mime_type == "text/plain":
-                # Check if it's a markdown file by extension
-                if ext == ".md":
-                    return InputFormat.MD
-                # Check if it's a known format by extension
-                fmt = EXT_TO_FORMAT.get(ext)
-                if fmt:
-                    return fmt
-                # Default to TEXT for unknown extensions
-                return InputFormat.TEXT
-
-            # Try to get format from MIME type
-            fmt = MIME_TO_FORMAT.get(mime_type)
-            if fmt:
-                return fmt
-
-            # Try to get format from file extension
-            fmt = EXT_TO_FORMAT.get(ext)
-            if fmt:
-                return fmt
-
-            # Try to get format from mimetypes module
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if mime_type:
-                fmt = MIME_TO_FORMAT.get(mime_type)
-                if fmt:
-                    return fmt
+            stat = file_path.stat()
+            entry = self._cached(file_path, stat)
+            if entry:
+                return entry.format
 
-            logger.warning(f"Unsupported format for {file_path} (MIME: {mime_type}, ext: {ext})")
-            return None
+            fmt = self._sniff_format(file_path)
+            with self._lock:
+                self._cache[str(file_path)] = _CacheEntry(stat.st_size, stat.st_mtime_ns, fmt)
+            return fmt
 
         except Exception as e:
             logger.error(f"Failed to detect format for {file_path}: {e}")
             return None
+
+    def detect_directory(
+        self, directory: Path, workers: int | None = None
+    ) -> dict[Path, InputFormat | None]:
+        """Detect the format of every file under a directory.
+
+        Files that can be detected from their extension or the cache are
+        resolved first; the rest are sniffed with libmagic in parallel.
+
+        Args:
+            directory: Directory to scan recursively
+            workers: Number of sniffing threads; defaults to the CPU count
+
+        Returns:
+            Detected format of each file, in path order
+        """
+        files = sorted(path for path in directory.rglob("*") if path.is_file())
+        results: dict[Path, InputFormat | None] = {}
+        to_sniff = []
+        for path in files:
+            ext = path.suffix.lower()
+            if ext == ".md" or (self.trust_extensions and ext in EXT_TO_FORMAT):
+                results[path] = self.detect_format(path)
+                continue
+            try:
+                entry = self._cached(path, path.stat())
+            except OSError as e:
+                logger.error(f"Failed to detect format for {path}: {e}")
+                results[path] = None
+                continue
+            if entry:
+                results[path] = entry.format
+            else:
+                to_sniff.append(path)
+
+        if to_sniff:
+            logger.info(f"Sniffing format of {len(to_sniff)} of {len(files)} files")
+            with ThreadPoolExecutor(
+                max_workers=workers or os.cpu_count(), thread_name_prefix="nova_format"
+            ) as executor:
+                formats = executor.map(self.detect_format, to_sniff)
+                for path, fmt in zip(to_sniff, formats, strict=True):
+                    results[path] = fmt
+
+        return {path: results[path] for path in files}
+
+    def _sniff_format(self, file_path: Path) -> InputFormat | None:
+        """Detect the format of a file from its content with libmagic.
+
+        Args:
+            file_path: Path to file to detect format of.
+
+        Returns:
+            Detected format or None if format is not supported.
+        """
+        ext = file_path.suffix.lower()
+
+        # Try to detect MIME type using magic
+        mime_type = self._magic.from_file(str(file_path))
+
+        # Special handling for text/plain files
+        if mime_type == "text/plain":
+            # Check if it's a known format by extension
+            fmt = EXT_TO_FORMAT.get(ext)
+            if fmt:
+                return fmt
+            # Default to TEXT for unknown extensions
+            return InputFormat.TEXT
+
+        # Try to get format from MIME type
+        fmt = MIME_TO_FORMAT.get(mime_type)
+        if fmt:
+            return fmt
+
+        # Try to get format from file extension
+        fmt = EXT_TO_FORMAT.get(ext)
+        if fmt:
+            return fmt
+
+        # Try to get format from mimetypes module
+        mime_type, _ = mimetypes.guess_type(str(file_path))
+        if mime_type:
+            fmt = MIME_TO_FORMAT.get(mime_type)
+            if fmt:
+                return fmt
+
+        logger.warning(f"Unsupported format for {file_path} (MIME: {mime_type}, ext: {ext})")
+        return None
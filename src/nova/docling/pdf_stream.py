@@ -0,0 +1,233 @@
+"""Page-streaming PDF text extraction.
+
+Large scanned PDFs used to be converted by accumulating the text of every
+page before building a single document. ``PdfPageStream`` yields pages one
+at a time instead, so consumers such as the chunker can process a page and
+drop it before the next one is extracted. Page ranges can be extracted in
+worker processes, and extraction stops early at a page cap, a byte cap or a
+deadline.
+"""
+
+import logging
+import multiprocessing
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from pathlib import Path
+
+import pdfplumber
+from pdfplumber.page import Page
+from pdfplumber.pdf import PDF
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PdfPage:
+    """Text of a single PDF page."""
+
+    number: int
+    text: str
+    width: float
+    height: float
+
+    @property
+    def markdown(self) -> str:
+        """Get the page as markdown, headed by its page number."""
+        header = f"\n## Page {self.number}\n"
+        return f"{header}\n{self.text}" if self.text else header
+
+    @property
+    def dimensions(self) -> str:
+        """Get the page dimensions as WIDTHxHEIGHT."""
+        return f"{self.width:.2f}x{self.height:.2f}"
+
+
+@dataclass
+class PdfStreamOptions:
+    """Parallelism and limits of PDF page extraction."""
+
+    workers: int = 1
+    """Number of worker processes; 1 extracts pages in the calling process."""
+
+    pages_per_task: int = 8
+    """Number of consecutive pages each worker task extracts."""
+
+    max_pages: int | None = None
+    """Maximum number of pages to extract."""
+
+    max_bytes: int | None = None
+    """Maximum total size of the extracted markdown in UTF-8 bytes."""
+
+    timeout: float | None = None
+    """Seconds after which extraction stops.
+
+    The deadline cannot interrupt a page that is being extracted. Serial
+    extraction checks it between pages, so a page that never finishes
+    blocks the stream. Parallel extraction stops waiting for a page range
+    once it has passed, but running worker processes are not killed: a
+    stuck page keeps its worker busy, and interpreter shutdown waits for it.
+    """
+
+
+def _extract_page(page: Page, number: int) -> PdfPage:
+    """Extract a page and release its parsed objects."""
+    try:
+        return PdfPage(
+            number=number, text=page.extract_text() or "", width=page.width, height=page.height
+        )
+    finally:
+        page.close()
+
+
+def _extract_page_range(file_path: Path, start: int, end: int) -> list[PdfPage]:
+    """Extract a range of pages in a worker process.
+
+    Args:
+        file_path: PDF file
+        start: Index of the first page to extract
+        end: Index after the last page to extract
+
+    Returns:
+        Extracted pages
+    """
+    with pdfplumber.open(file_path) as pdf:
+        return [_extract_page(pdf.pages[i], i + 1) for i in range(start, end)]
+
+
+class PdfPageStream:
+    """Iterates over the pages of a PDF file in order.
+
+    After iteration, ``truncated`` names the limit that stopped extraction
+    early ("max_pages", "max_bytes" or "timeout"), or is None.
+    """
+
+    def __init__(self, file_path: Path, options: PdfStreamOptions | None = None) -> None:
+        """Initialize the stream.
+
+        Args:
+            file_path: PDF file
+            options: Parallelism and limits; defaults to serial and unlimited
+        """
+        self.file_path = Path(file_path)
+        self.options = options or PdfStreamOptions()
+        if self.options.workers < 1:
+            raise ValueError(f"Worker count must be positive, got {self.options.workers}")
+        if self.options.pages_per_task < 1:
+            raise ValueError(f"Pages per task must be positive, got {self.options.pages_per_task}")
+        self.page_count = 0
+        self.metadata: dict[str, str] = {}
+        self.truncated: str | None = None
+        self._bytes = 0
+        self._deadline: float | None = None
+
+    def _read_info(self, pdf: PDF) -> int:
+        """Read the page count and document metadata.
+
+        Returns:
+            Number of pages to extract
+        """
+        self.page_count = len(pdf.pages)
+        self.metadata = {
+            str(key): str(value)
+            for key, value in (pdf.metadata or {}).items()
+            if isinstance(value, (str, int, float, bool))
+        }
+        max_pages = self.options.max_pages
+        return self.page_count if max_pages is None else min(self.page_count, max_pages)
+
+    def _admit(self, page: PdfPage) -> bool:
+        """Check whether a page fits in the byte cap and account for it."""
+        size = len(page.markdown.encode("utf-8"))
+        if self.options.max_bytes is not None and self._bytes + size > self.options.max_bytes:
+            self.truncated = "max_bytes"
+            return False
+        self._bytes += size
+        return True
+
+    def _timed_out(self) -> bool:
+        """Check the deadline, marking the stream as truncated if it passed."""
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self.truncated = "timeout"
+            return True
+        return False
+
+    def __iter__(self) -> Iterator[PdfPage]:
+        """Extract pages lazily.
+
+        Yields:
+            Pages in document order
+        """
+        self.truncated = None
+        self._bytes = 0
+        if self.options.timeout is not None:
+            self._deadline = time.monotonic() + self.options.timeout
+
+        with pdfplumber.open(self.file_path) as pdf:
+            limit = self._read_info(pdf)
+            if self.options.workers == 1:
+                for i in range(limit):
+                    if self._timed_out():
+                        break
+                    page = _extract_page(pdf.pages[i], i + 1)
+                    if not self._admit(page):
+                        break
+                    yield page
+
+        if self.options.workers > 1 and limit:
+            yield from self._iter_parallel(limit)
+
+        if self.truncated is None and limit < self.page_count:
+            self.truncated = "max_pages"
+        if self.truncated:
+            logger.warning(
+                f"Stopped extracting {self.file_path} at the {self.truncated} limit "
+                f"({self.page_count} pages in total)"
+            )
+
+    def _iter_parallel(self, limit: int) -> Iterator[PdfPage]:
+        """Extract page ranges in worker processes.
+
+        Args:
+            limit: Number of pages to extract
+
+        Yields:
+            Pages in document order
+        """
+        step = self.options.pages_per_task
+        ranges = iter([(start, min(start + step, limit)) for start in range(0, limit, step)])
+        # Streams may be consumed in threaded pipeline stages, where forking is unsafe
+        executor = ProcessPoolExecutor(
+            max_workers=self.options.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        # Keep a bounded window of ranges in flight so memory stays flat
+        pending: deque[Future[list[PdfPage]]] = deque()
+        try:
+            for start, end in ranges:
+                pending.append(executor.submit(_extract_page_range, self.file_path, start, end))
+                if len(pending) >= self.options.workers * 2:
+                    break
+            while pending:
+                future = pending.popleft()
+                next_range = next(ranges, None)
+                if next_range is not None:
+                    pending.append(
+                        executor.submit(_extract_page_range, self.file_path, *next_range)
+                    )
+                remaining = None
+                if self._deadline is not None:
+                    remaining = max(0.0, self._deadline - time.monotonic())
+                try:
+                    pages = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    self.truncated = "timeout"
+                    return
+                for page in pages:
+                    if not self._admit(page):
+                        return
+                    yield page
+        finally:
+            # Do not wait for ranges that are no longer needed
+            executor.shutdown(wait=self.truncated is None, cancel_futures=True)
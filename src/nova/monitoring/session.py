@@ -76,9 +76,12 @@ class SessionMonitor:
         self.metrics = SessionMetrics(start_time=self.session_start)
         logger.info("SessionMonitor initialization complete")
 
-    def check_health(self) -> SessionHealthData:
+    def check_health(self, full_scan: bool = False) -> SessionHealthData:
         """Check system health.
 
+        Args:
+            full_scan: Whether to verify vector store statistics with a full scan
+
         Returns:
             Dict containing health status and metrics
         """
@@ -90,7 +93,7 @@ class SessionMonitor:
         vector_store_health: HealthData | None = None
         if self.vector_store:
             try:
-                vector_store_health = self.vector_store.check_health()
+                vector_store_health = self.vector_store.check_health(full_scan=full_scan)
                 # Check if we have documents but can't access them
                 collection = vector_store_health.get("collection", {})
                 if collection.get("exists", False):
@@ -185,6 +188,9 @@ class SessionMonitor:
         if self.log_manager:
             stats["logs"] = self.log_manager.get_stats()
 
+        if self.vector_store:
+            stats["search_cache"] = self.vector_store.get_cache_stats()
+
         return stats
 
     def enforce_limits(self) -> None:
@@ -243,13 +249,18 @@ class SessionMonitor:
         self.metrics.rebuild_last_error_message = None
         self.metrics.rebuild_peak_memory_mb = 0.0
 
-    def update_rebuild_progress(self, chunks_processed: int, processing_time: float) -> None:
+    def update_rebuild_progress(
+        self, chunks_processed: int, processing_time: float, total_chunks: int | None = None
+    ) -> None:
         """Update rebuild progress.
 
         Args:
             chunks_processed: Number of chunks processed
             processing_time: Total processing time in seconds
+            total_chunks: Updated total, for rebuilds whose size is not known up front
         """
+        if total_chunks is not None:
+            self.metrics.total_chunks = total_chunks
         self.metrics.chunks_processed = chunks_processed
         self.metrics.processing_time = processing_time
         # Update peak memory
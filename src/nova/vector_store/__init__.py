@@ -1,13 +1,28 @@
 """Vector store package for Nova."""
 
+from typing import TYPE_CHECKING, Any
+
 from .chunking import Chunk, ChunkingEngine
-from .embedding import EmbeddingEngine, EmbeddingResult
+from .embedding_cache import EmbeddingCache
 from .store import VectorStore
 
+if TYPE_CHECKING:
+    from .embedding import EmbeddingEngine, EmbeddingResult
+
 __all__ = [
-    "ChunkingEngine",
     "Chunk",
+    "ChunkingEngine",
+    "EmbeddingCache",
     "EmbeddingEngine",
     "EmbeddingResult",
     "VectorStore",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the embedding module (and with it chromadb) only when it is used."""
+    if name in ("EmbeddingEngine", "EmbeddingResult"):
+        from . import embedding
+
+        return getattr(embedding, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,192 @@
+"""Micro-batching of concurrent search queries.
+
+Encoding a single short query leaves most of the embedding model's batch
+capacity unused. ``SearchBatcher`` collects queries that arrive within a
+short window from concurrent callers and runs them as one
+``VectorStore.search_many`` call: one embedding call and one multi-query
+collection query, with the results fanned back out to the callers.
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from nova.vector_store.executor import BoundedExecutor
+from nova.vector_store.store import VectorStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingQuery:
+    """A query waiting to be run as part of a batch."""
+
+    query: str
+    limit: int
+    where: dict[str, Any] | None
+    future: Future[list[dict[str, Any]]] = field(default_factory=Future)
+
+
+class SearchBatcher:
+    """Coalesces concurrent searches into batched vector store queries.
+
+    Queries are collected for up to ``max_wait`` seconds after the first
+    one arrives in an empty window, or until ``max_batch`` queries are
+    waiting, and then run as one batch on behalf of every caller.
+
+    Waiting callers do not hold a worker thread: ``submit`` returns a
+    future, and batches run on ``executor`` when one is given. The batch
+    size is therefore not limited by the number of workers.
+    """
+
+    def __init__(
+        self,
+        store: VectorStore,
+        max_wait: float = 0.005,
+        max_batch: int = 32,
+        executor: BoundedExecutor | None = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            store: Vector store to search
+            max_wait: Seconds to wait for more queries after the first one
+            max_batch: Number of waiting queries that triggers an immediate run
+            executor: Executor to run batches on. Without one, a batch runs on
+                the timer thread that closes its window, or on the thread whose
+                query fills it.
+        """
+        if max_wait < 0:
+            raise ValueError(f"Batch wait must not be negative, got {max_wait}")
+        if max_batch < 1:
+            raise ValueError(f"Batch size must be positive, got {max_batch}")
+        self.store = store
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+        self.executor = executor
+        self.batches = 0
+        self.queries = 0
+        self._lock = threading.Lock()
+        self._pending: list[_PendingQuery] = []
+        self._timer: threading.Timer | None = None
+
+    def submit(
+        self, query: str, limit: int = 5, where: dict[str, Any] | None = None
+    ) -> Future[list[dict[str, Any]]]:
+        """Queue a search to run with concurrent ones.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results to return
+            where: Optional ChromaDB metadata filter
+
+        Returns:
+            Future resolved with the search results when the batch has run
+        """
+        request = _PendingQuery(query=query, limit=limit, where=where)
+        batch = None
+        with self._lock:
+            self._pending.append(request)
+            if len(self._pending) >= self.max_batch:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_wait, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            self._dispatch(batch)
+        return request.future
+
+    def search(
+        self, query: str, limit: int = 5, where: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Search, sharing the work with concurrent callers.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results to return
+            where: Optional ChromaDB metadata filter
+
+        Returns:
+            List of search results with scores and metadata
+        """
+        return self.submit(query, limit=limit, where=where).result()
+
+    def _take_pending(self) -> list[_PendingQuery]:
+        """Take the waiting queries and close the window; the lock must be held."""
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self) -> None:
+        """Run the waiting queries when their window closes."""
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[_PendingQuery]) -> None:
+        """Run a batch on the executor, or in the current thread without one.
+
+        Args:
+            batch: Queries to run
+        """
+        if self.executor is None:
+            self._run(batch)
+            return
+        try:
+            self.executor.submit(self._run, batch)
+        except Exception as e:
+            # A saturated executor rejects the whole batch
+            for request in batch:
+                request.future.set_exception(e)
+
+    def _run(self, batch: list[_PendingQuery]) -> None:
+        """Run a batch of queries and resolve their futures.
+
+        Args:
+            batch: Queries to run
+        """
+        # Queries can only share a collection query if they share a filter
+        groups: dict[str | None, list[_PendingQuery]] = {}
+        for request in batch:
+            key = json.dumps(request.where, sort_keys=True) if request.where else None
+            groups.setdefault(key, []).append(request)
+
+        for requests in groups.values():
+            limit = max(request.limit for request in requests)
+            try:
+                results = self.store.search_many(
+                    [request.query for request in requests],
+                    limit=limit,
+                    where=requests[0].where,
+                )
+            except Exception as e:
+                for request in requests:
+                    request.future.set_exception(e)
+                continue
+            for request, result in zip(requests, results, strict=True):
+                request.future.set_result(result[: request.limit])
+
+        with self._lock:
+            self.batches += 1
+            self.queries += len(batch)
+        logger.debug(f"Ran batch of {len(batch)} queries in {len(groups)} collection queries")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics.
+
+        Returns:
+            Number of batches and queries run and the average batch size
+        """
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "queries": self.queries,
+                "avg_batch_size": self.queries / self.batches if self.batches else 0.0,
+            }
@@ -0,0 +1,188 @@
+"""Compact in-memory storage for chunks.
+
+A ``Chunk`` dataclass carries an instance dict, its own tag list, a dict per
+attachment and a hex ID string, which together cost several times more memory
+than the chunk text. ``ChunkStore`` keeps chunks in columns instead: texts
+and packed IDs in lists, everything else as small integers in arrays that
+index tables of interned values. Sources, headings, tag sets and attachment
+sets are stored once however many chunks share them. Chunks are rebuilt on
+access.
+
+The ingest pipeline streams chunks straight to the vector store and never
+holds many at once, so it does not use this store; it is meant for callers
+that keep a large number of chunks in memory.
+"""
+
+import sys
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from .chunking import Chunk, DocumentMetadata
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Attachments as (type, path) pairs
+_Attachments = tuple[tuple[str, str], ...]
+
+# Length of the hex chunk IDs created by make_chunk_id
+_HEX_ID_LENGTH = 32
+
+
+class _Interner(Generic[K, V]):
+    """Table of distinct values, each stored once and referenced by index."""
+
+    __slots__ = ("_indexes", "values")
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.values: list[V] = []
+        self._indexes: dict[K, int] = {}
+
+    def add(self, key: K, value: V) -> int:
+        """Get the index of a value, adding it to the table if it is new.
+
+        Args:
+            key: Hashable key identifying the value
+            value: Value to store when the key is new
+
+        Returns:
+            Index of the value
+        """
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def _pack_id(chunk_id: str) -> bytes | str:
+    """Pack a hex chunk ID into half as many bytes; other IDs are kept as is."""
+    if len(chunk_id) == _HEX_ID_LENGTH:
+        try:
+            packed = bytes.fromhex(chunk_id)
+        except ValueError:
+            return chunk_id
+        # Only pack IDs that unpack to the same string
+        if packed.hex() == chunk_id:
+            return packed
+    return chunk_id
+
+
+def _unpack_id(chunk_id: bytes | str) -> str:
+    """Restore a chunk ID packed by _pack_id."""
+    return chunk_id.hex() if isinstance(chunk_id, bytes) else chunk_id
+
+
+class ChunkStore:
+    """Columnar store of chunks with interned shared values.
+
+    Chunks are appended and read back as ``Chunk`` objects equal to the ones
+    appended; the store itself holds no ``Chunk`` objects.
+    """
+
+    def __init__(self, chunks: Iterable[Chunk] = ()) -> None:
+        """Initialize the store.
+
+        Args:
+            chunks: Chunks to add
+        """
+        self._texts: list[str] = []
+        self._ids: list[bytes | str] = []
+        self._documents: array[int] = array("I")
+        self._headings: array[int] = array("I")
+        # Heading levels count the leading "#" of a line, which is not bounded
+        self._levels: array[int] = array("I")
+        self._tags: array[int] = array("I")
+        self._attachments: array[int] = array("I")
+        self._starts: array[int] = array("Q")
+        self._ends: array[int] = array("Q")
+
+        # Source and metadata are per document, so they are interned together
+        self._document_table: _Interner[
+            tuple[Path | None, int], tuple[Path | None, DocumentMetadata | None]
+        ] = _Interner()
+        self._heading_table: _Interner[str, str] = _Interner()
+        self._tag_table: _Interner[tuple[str, ...], tuple[str, ...]] = _Interner()
+        self._attachment_table: _Interner[_Attachments, _Attachments] = _Interner()
+        self.extend(chunks)
+
+    def __len__(self) -> int:
+        """Get the number of chunks in the store."""
+        return len(self._texts)
+
+    def __iter__(self) -> Iterator[Chunk]:
+        """Iterate over the chunks in the order they were added."""
+        for index in range(len(self._texts)):
+            yield self._chunk(index)
+
+    def __getitem__(self, index: int) -> Chunk:
+        """Get a chunk by position.
+
+        Args:
+            index: Position of the chunk; negative positions count from the end
+
+        Returns:
+            Chunk
+
+        Raises:
+            IndexError: If the position is out of range
+        """
+        return self._chunk(range(len(self._texts))[index])
+
+    def append(self, chunk: Chunk) -> None:
+        """Add a chunk to the store.
+
+        Args:
+            chunk: Chunk to add
+        """
+        self._texts.append(chunk.text)
+        self._ids.append(_pack_id(chunk.chunk_id))
+        # The metadata object is keyed by identity, as chunks of a document share it
+        key = (chunk.source, id(chunk.document))
+        self._documents.append(self._document_table.add(key, (chunk.source, chunk.document)))
+        heading = sys.intern(chunk.heading_text)
+        self._headings.append(self._heading_table.add(heading, heading))
+        self._levels.append(chunk.heading_level)
+        tags = tuple(sys.intern(tag) for tag in chunk.tags)
+        self._tags.append(self._tag_table.add(tags, tags))
+        attachments = tuple(
+            (sys.intern(attachment["type"]), attachment["path"]) for attachment in chunk.attachments
+        )
+        self._attachments.append(self._attachment_table.add(attachments, attachments))
+        self._starts.append(chunk.start)
+        self._ends.append(chunk.end)
+
+    def extend(self, chunks: Iterable[Chunk]) -> None:
+        """Add chunks to the store.
+
+        Args:
+            chunks: Chunks to add
+        """
+        for chunk in chunks:
+            self.append(chunk)
+
+    def chunk_ids(self) -> list[str]:
+        """Get the IDs of the chunks in the order they were added."""
+        return [_unpack_id(chunk_id) for chunk_id in self._ids]
+
+    def _chunk(self, index: int) -> Chunk:
+        """Rebuild the chunk at a position."""
+        source, document = self._document_table.values[self._documents[index]]
+        return Chunk(
+            text=self._texts[index],
+            source=source,
+            heading_text=self._heading_table.values[self._headings[index]],
+            heading_level=self._levels[index],
+            _tags=list(self._tag_table.values[self._tags[index]]),
+            _attachments=[
+                {"type": type_, "path": path}
+                for type_, path in self._attachment_table.values[self._attachments[index]]
+            ],
+            chunk_id=_unpack_id(self._ids[index]),
+            start=self._starts[index],
+            end=self._ends[index],
+            document=document,
+        )
@@ -1,14 +1,125 @@
 """Chunking functionality for the vector store."""
 
+import hashlib
 import logging
 import re
-import uuid
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Tags must start with a letter, so they never start with a digit, "#", "@" or "/"
+_TAG_PATTERN = re.compile(r"#([a-zA-Z][a-zA-Z0-9_/]*)")
+_ATTACHMENT_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]+\s+")
+_WORD_PATTERN = re.compile(r"\S+")
+
+# Piece of a chunk: a (start, end) span of the document, with replacement text
+# for headings whose line differs from their normalized form
+_Piece = tuple[int, int, str | None]
+
+# Compact, cheaply pickled form of a chunk without its source:
+# (text, heading_text, heading_level, tags, attachments, chunk_id, start, end)
+ChunkTuple = tuple[str, str, int, list[str], list[dict[str, str]], str, int, int]
+
+
+def make_chunk_id(source: Path | None, heading_path: str, text: str, occurrence: int = 0) -> str:
+    """Derive a deterministic chunk ID from a chunk's location and content.
+
+    Whitespace in the text is normalized, so reflowing a paragraph keeps
+    its ID. The occurrence index distinguishes identical chunks under the
+    same heading path of the same document.
+
+    Args:
+        source: Source file path, if any
+        heading_path: Path of headings leading to the chunk
+        text: Chunk text
+        occurrence: Index of this chunk among identical chunks in the document
+
+    Returns:
+        Hex chunk ID
+    """
+    text_hash = hashlib.sha256(" ".join(text.split()).encode("utf-8", "surrogatepass"))
+    key = "\x1f".join(
+        [
+            source.as_posix() if source else "",
+            heading_path,
+            text_hash.hexdigest(),
+            str(occurrence),
+        ]
+    )
+    return hashlib.sha256(key.encode("utf-8", "surrogatepass")).hexdigest()[:32]
+
+
+class _ChunkIdAssigner:
+    """Assigns deterministic chunk IDs within one document."""
+
+    def __init__(self, source: Path | None) -> None:
+        """Initialize the assigner.
+
+        Args:
+            source: Source file path, if any
+        """
+        self.source = source
+        self._headings: list[tuple[int, str]] = []
+        self._seen: dict[str, int] = {}
+
+    def next_id(self, heading: str, level: int, text: str) -> str:
+        """Get the ID for the next chunk of the document.
+
+        Args:
+            heading: Chunk heading text
+            level: Chunk heading level
+            text: Chunk text
+
+        Returns:
+            Chunk ID
+        """
+        if level > 0:
+            # Maintain the heading path from the chunks' headings
+            while self._headings and self._headings[-1][0] >= level:
+                self._headings.pop()
+            self._headings.append((level, heading))
+        heading_path = "/".join(name for _, name in self._headings)
+
+        chunk_id = make_chunk_id(self.source, heading_path, text)
+        occurrence = self._seen.get(chunk_id, 0)
+        self._seen[chunk_id] = occurrence + 1
+        if occurrence:
+            return make_chunk_id(self.source, heading_path, text, occurrence)
+        return chunk_id
+
+
+@dataclass
+class DocumentMetadata:
+    """Metadata of a source document, shared by all of its chunks."""
+
+    document_id: str | None = None
+    document_type: str = "unknown"
+    document_size: int | None = None
+    date: str | None = None
+
+    @classmethod
+    def from_source(cls, source: Path | None) -> "DocumentMetadata":
+        """Describe a source document, with a single stat of the file.
+
+        Args:
+            source: Source file path, if any
+
+        Returns:
+            Document metadata; without a source, chunks describe themselves
+        """
+        if source is None:
+            return cls()
+        try:
+            size: int | None = source.stat().st_size
+        except OSError:
+            size = None
+        return cls(document_id=str(source), document_type=source.suffix[1:], document_size=size)
+
 
 @dataclass
 class Chunk:
@@ -22,12 +133,17 @@ class Chunk:
     _attachments: list[dict[str, str]] = field(
         default_factory=list
     )  # Internal list of attachment dicts
-    chunk_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    chunk_id: str = ""
+    # Extent of the chunk in the text it was chunked from
+    start: int = 0
+    end: int = 0
+    # Shared by the chunks of a document; derived from the source when missing
+    document: DocumentMetadata | None = None
 
     def __post_init__(self) -> None:
-        """Initialize chunk ID if not provided."""
+        """Derive the chunk ID from the chunk's content if not provided."""
         if not self.chunk_id:
-            self.chunk_id = str(uuid.uuid4())
+            self.chunk_id = make_chunk_id(self.source, self.heading_text, self.text)
 
     @property
     def tags(self) -> list[str]:
@@ -86,25 +202,67 @@ class Chunk:
         if attachment not in self._attachments:
             self._attachments.append(attachment)
 
-    def to_metadata(self) -> dict:
-        """Convert chunk metadata to a format suitable for ChromaDB."""
-        # Generate a document ID from the source path if available
-        doc_id = str(self.source) if self.source else self.chunk_id
+    def to_tuple(self) -> ChunkTuple:
+        """Convert the chunk to its compact tuple form, without the source."""
+        return (
+            self.text,
+            self.heading_text,
+            self.heading_level,
+            self._tags,
+            self._attachments,
+            self.chunk_id,
+            self.start,
+            self.end,
+        )
+
+    @classmethod
+    def from_tuple(
+        cls,
+        data: ChunkTuple,
+        source: Path | None = None,
+        document: DocumentMetadata | None = None,
+    ) -> "Chunk":
+        """Create a chunk from its compact tuple form.
 
-        # Get document type from source extension or default to unknown
-        doc_type = self.source.suffix[1:] if self.source else "unknown"
+        Args:
+            data: Tuple created by to_tuple
+            source: Source file path, if any
+            document: Metadata of the chunk's document
 
-        # Get document size from source file if available
-        doc_size = (
-            self.source.stat().st_size if self.source and self.source.exists() else len(self.text)
+        Returns:
+            Chunk
+        """
+        text, heading_text, heading_level, tags, attachments, chunk_id, start, end = data
+        return cls(
+            text=text,
+            source=source,
+            heading_text=heading_text,
+            heading_level=heading_level,
+            _tags=tags,
+            _attachments=attachments,
+            chunk_id=chunk_id,
+            start=start,
+            end=end,
+            document=document,
         )
 
+    def to_metadata(self) -> dict:
+        """Convert chunk metadata to a format suitable for ChromaDB."""
+        if self.document is None:
+            self.document = DocumentMetadata.from_source(self.source)
+        document = self.document
+
+        # Without a source, the chunk stands in for its document
+        doc_id = document.document_id or self.chunk_id
+        doc_type = document.document_type
+        doc_size = document.document_size if document.document_size is not None else len(self.text)
+
         return {
             "document_id": doc_id,
             "document_type": doc_type,
             "document_size": doc_size,
             "text": self.text,
-            "date": None,  # Date will be set by the caller if available
+            "date": document.date,  # Date will be set by the caller if available
             "tags": self._tags,
             "attachments": self._attachments,
             "heading_text": self.heading_text,
@@ -113,8 +271,73 @@ class Chunk:
         }
 
 
+class _ChunkText:
+    """Text of a chunk assembled from pieces of a document.
+
+    When the pieces are consecutive lines without trailing whitespace or blank
+    lines between them, the text is a single slice of the document.
+    Otherwise the pieces are joined with newlines.
+    """
+
+    def __init__(self, document: str, pieces: list[_Piece]) -> None:
+        """Assemble the text.
+
+        Args:
+            document: Document text
+            pieces: Pieces of the chunk in order
+        """
+        self.pieces = pieces
+        self._starts: list[int] = []
+        self._base = pieces[0][0]
+        previous_end = self._base - 1
+        for start, end, literal in pieces:
+            if literal is not None or start != previous_end + 1:
+                break
+            previous_end = end
+        else:
+            self.text = document[self._base : previous_end]
+            return
+
+        parts = [
+            document[start:end] if literal is None else literal for start, end, literal in pieces
+        ]
+        offset = 0
+        for part in parts:
+            self._starts.append(offset)
+            offset += len(part) + 1
+        self.text = "\n".join(parts)
+
+    def span(self, start: int, end: int) -> tuple[int, int]:
+        """Map a span of the chunk text to the document.
+
+        Args:
+            start: Start offset in the chunk text
+            end: End offset in the chunk text
+
+        Returns:
+            Start and end offsets in the document
+        """
+        if not self._starts:
+            return self._base + start, self._base + end
+        return self._position(start, is_end=False), self._position(end, is_end=True)
+
+    def _position(self, offset: int, is_end: bool) -> int:
+        """Map an offset of the chunk text to the document."""
+        index = bisect_right(self._starts, offset) - 1
+        start, end, literal = self.pieces[index]
+        if literal is not None:
+            # Normalized headings map to the whole heading line
+            return end if is_end else start
+        return min(start + offset - self._starts[index], end)
+
+
 class ChunkingEngine:
-    """Handles text chunking with simplified logic."""
+    """Handles text chunking with simplified logic.
+
+    Documents are chunked in a single pass over their lines. Chunks are
+    tracked as line offsets into the document, and their text is only sliced
+    out, in one piece where possible, when a chunk is created.
+    """
 
     def __init__(self, min_chunk_size: int = 50, max_chunk_size: int = 512):
         """Initialize the chunking engine.
@@ -125,160 +348,226 @@ class ChunkingEngine:
         """
         self.min_chunk_size = min_chunk_size
         self.max_chunk_size = max_chunk_size
-        self.tag_pattern = re.compile(r"#([a-zA-Z][a-zA-Z0-9_/]*)")  # Must start with letter
-        self.attachment_pattern = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+        self.tag_pattern = _TAG_PATTERN
+        self.attachment_pattern = _ATTACHMENT_PATTERN
 
     def chunk_document(self, text: str, source: Path | None = None) -> list[Chunk]:
         """Chunk a document into smaller pieces."""
-        if not text.strip():
+        return self._chunk_text(
+            text, source, _ChunkIdAssigner(source), DocumentMetadata.from_source(source)
+        )
+
+    def chunk_pages(self, pages: Iterable[str], source: Path | None = None) -> Iterator[Chunk]:
+        """Chunk a document that arrives one page at a time.
+
+        Pages are chunked as they are consumed, so only one page needs to be
+        in memory. Chunk IDs are assigned across the whole document, as for
+        chunk_document; chunks never span a page boundary, and chunk offsets
+        are relative to their page.
+
+        Args:
+            pages: Markdown of each page in order
+            source: Source file path, if any
+
+        Yields:
+            Chunks of each page in order
+        """
+        id_assigner = _ChunkIdAssigner(source)
+        document = DocumentMetadata.from_source(source)
+        for page in pages:
+            yield from self._chunk_text(page, source, id_assigner, document)
+
+    def _chunk_text(
+        self,
+        text: str,
+        source: Path | None,
+        id_assigner: _ChunkIdAssigner,
+        document: DocumentMetadata,
+    ) -> list[Chunk]:
+        """Chunk text, assigning IDs and metadata in the context of its document."""
+        if not text or text.isspace():
             return []
 
-        chunks = []
-        lines = text.split("\n")
-        current_chunk: list[str] = []
+        chunks: list[Chunk] = []
+        max_size = self.max_chunk_size
+        current: list[_Piece] = []
         current_size = 0
         current_heading = ""
         current_level = 0
-        consecutive_headings: list[tuple[str, int]] = []  # Store both heading text and level
-
-        def create_chunk_from_text(text_lines: list[str], heading: str, level: int) -> None:
-            """Helper to create a chunk from text lines."""
-            if not text_lines:
-                return
-
-            # Join text lines and split into smaller chunks if needed
-            text_content = "\n".join(text_lines)
-            if len(text_content) > self.max_chunk_size:
-                # Split at sentence boundaries or line breaks
-                sub_chunks = self._split_text(text_content)
-                for sub_text in sub_chunks:
-                    if len(sub_text) >= self.min_chunk_size or len(sub_text.strip()) > 0:
-                        chunk = self._create_chunk(sub_text, heading, level)
-                        chunk.source = source
-                        self._parse_tags(sub_text, chunk)
-                        self._parse_attachments(sub_text, chunk)
-                        chunks.append(chunk)
-            else:
-                chunk = self._create_chunk(text_content, heading, level)
-                chunk.source = source
-                self._parse_tags(text_content, chunk)
-                self._parse_attachments(text_content, chunk)
-                chunks.append(chunk)
-
-        for line in lines:
-            line = line.rstrip()
+        # Headings not yet followed by content, as (text, level, start, end)
+        consecutive_headings: list[tuple[str, int, int, int]] = []
+
+        def emit(pieces: list[_Piece], heading: str, level: int) -> None:
+            self._emit_chunks(text, pieces, heading, level, source, id_assigner, chunks)
+
+        position = 0
+        for raw_line in text.split("\n"):
+            start = position
+            position += len(raw_line) + 1
+            line = raw_line.rstrip()
+            if not line:
+                continue
+            end = start + len(line)
 
             # Handle headings
-            if line.startswith("#"):
-                # Get heading info
-                heading, level = self._parse_heading(line)
+            if line[0] == "#":
+                level = len(line) - len(line.lstrip("#"))
+                heading = line[level:].strip()
 
                 # If we have consecutive headings, store them
-                if not current_chunk:
-                    consecutive_headings.append((heading, level))
+                if not current:
+                    consecutive_headings.append((heading, level, start, end))
                     continue
 
-                # Save current chunk if it exists
-                if current_chunk:
-                    create_chunk_from_text(current_chunk, current_heading, current_level)
-                    current_chunk = []
-                    current_size = 0
-                    consecutive_headings = [(heading, level)]
-
-                # Start new chunk with heading
+                # Save the current chunk and start a new one with the heading
+                emit(current, current_heading, current_level)
+                consecutive_headings = [(heading, level, start, end)]
                 current_heading = heading
                 current_level = level
-                current_chunk = [line]
+                current = [(start, end, None)]
                 current_size = len(line) + 1  # +1 for newline
                 continue
 
             # If we have consecutive headings and now got content, create a single chunk
-            if consecutive_headings and line:
-                # Use the last heading as the main heading
-                current_heading, current_level = consecutive_headings[-1]
-                # Include all headings in the chunk
-                current_chunk = [f"{'#' * h[1]} {h[0]}" for h in consecutive_headings]
-                current_chunk.append(line)
-                current_size = sum(len(l) + 1 for l in current_chunk)
+            if consecutive_headings:
+                # Use the last heading as the main heading, including all headings
+                current_heading, current_level = consecutive_headings[-1][:2]
+                current = [self._heading_piece(text, *h) for h in consecutive_headings]
+                current.append((start, end, None))
+                current_size = sum(h[1] + len(h[0]) + 2 for h in consecutive_headings)
+                current_size += len(line) + 1
                 consecutive_headings = []
                 continue
 
-            # Handle normal lines
-            if line:
-                # Check if adding this line would exceed max size
-                if current_size + len(line) + 1 > self.max_chunk_size and current_chunk:
-                    create_chunk_from_text(current_chunk, current_heading, current_level)
-                    current_chunk = [line]
-                    current_size = len(line) + 1
-                else:
-                    current_chunk.append(line)
-                    current_size += len(line) + 1  # +1 for newline
+            # Check if adding this line would exceed max size
+            if current_size + len(line) + 1 > max_size and current:
+                emit(current, current_heading, current_level)
+                current = [(start, end, None)]
+                current_size = len(line) + 1
+            else:
+                current.append((start, end, None))
+                current_size += len(line) + 1  # +1 for newline
 
         # Handle remaining text
-        if current_chunk:
-            create_chunk_from_text(current_chunk, current_heading, current_level)
-        elif consecutive_headings:  # Handle remaining consecutive headings
-            # Use the last heading as the main heading
-            current_heading, current_level = consecutive_headings[-1]
-            # Include all headings in the chunk
-            create_chunk_from_text(
-                [f"{'#' * h[1]} {h[0]}" for h in consecutive_headings],
+        if current:
+            emit(current, current_heading, current_level)
+        elif consecutive_headings:
+            current_heading, current_level = consecutive_headings[-1][:2]
+            emit(
+                [self._heading_piece(text, *h) for h in consecutive_headings],
                 current_heading,
                 current_level,
             )
 
         # If no chunks were created, create one from the entire text
-        if not chunks and text.strip():
-            chunk = self._create_chunk(text.strip(), "", 0)
-            chunk.source = source
-            self._parse_tags(text.strip(), chunk)
-            self._parse_attachments(text.strip(), chunk)
-            chunks.append(chunk)
+        if not chunks:
+            stripped = text.strip()
+            start = len(text) - len(text.lstrip())
+            chunks.append(
+                self._create_chunk(
+                    stripped,
+                    "",
+                    0,
+                    id_assigner.next_id("", 0, stripped),
+                    source,
+                    start,
+                    start + len(stripped),
+                )
+            )
 
+        for chunk in chunks:
+            chunk.document = document
         return chunks
 
-    def _create_chunk(self, text: str, heading: str, level: int) -> Chunk:
+    @staticmethod
+    def _heading_piece(text: str, heading: str, level: int, start: int, end: int) -> _Piece:
+        """Get the piece of a heading line, normalized to "<#s> <heading>"."""
+        normalized = f"{'#' * level} {heading}"
+        if end - start == len(normalized) and text.startswith(normalized, start):
+            return start, end, None
+        return start, end, normalized
+
+    def _emit_chunks(
+        self,
+        text: str,
+        pieces: list[_Piece],
+        heading: str,
+        level: int,
+        source: Path | None,
+        id_assigner: _ChunkIdAssigner,
+        chunks: list[Chunk],
+    ) -> None:
+        """Create chunks from the pieces of a section, splitting it if too large."""
+        chunk_text = _ChunkText(text, pieces)
+        content = chunk_text.text
+        if len(content) <= self.max_chunk_size:
+            chunks.append(
+                self._create_chunk(
+                    content,
+                    heading,
+                    level,
+                    id_assigner.next_id(heading, level, content),
+                    source,
+                    pieces[0][0],
+                    pieces[-1][1],
+                )
+            )
+            return
+
+        # Split at sentence boundaries or line breaks
+        for start, end, sub_text in self._split_text(content):
+            if len(sub_text) >= self.min_chunk_size or (sub_text and not sub_text.isspace()):
+                chunks.append(
+                    self._create_chunk(
+                        sub_text,
+                        heading,
+                        level,
+                        id_assigner.next_id(heading, level, sub_text),
+                        source,
+                        *chunk_text.span(start, end),
+                    )
+                )
+
+    def _create_chunk(
+        self,
+        text: str,
+        heading: str,
+        level: int,
+        chunk_id: str = "",
+        source: Path | None = None,
+        start: int = 0,
+        end: int = 0,
+    ) -> Chunk:
         """Create a chunk with metadata."""
-        chunk = Chunk(text=text, heading_text=heading, heading_level=level)
+        chunk = Chunk(
+            text=text,
+            source=source,
+            heading_text=heading,
+            heading_level=level,
+            chunk_id=chunk_id,
+            start=start,
+            end=end,
+        )
+        self._parse_tags(text, chunk)
+        self._parse_attachments(text, chunk)
         return chunk
 
-    def _parse_heading(self, line: str) -> tuple[str, int]:
-        """Parse heading text and level from a line."""
-        match = re.match(r"^(#+)\s*(.*)$", line)
-        if match:
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            return text, level
-        return "", 0
-
     def _parse_tags(self, text: str, chunk: Chunk) -> None:
         """Parse tags from text and add them to the chunk."""
-        # Find all tags in the text
-        matches = self.tag_pattern.finditer(text)
-        tags = set()  # Use a set to avoid duplicates
-
-        for match in matches:
-            tag = match.group(1)
-            # Only add valid tags (no special characters or numbers at start)
-            if tag and not re.match(r"^[0-9#@/]", tag):
-                # Handle hierarchical tags
-                if "/" in tag:
-                    # Only add the full hierarchical tag
-                    tags.add(tag)
-                else:
-                    tags.add(tag)
-
-        # Add tags to chunk
-        chunk._tags = sorted(tags)  # Sort for consistent ordering
+        if "#" not in text:
+            chunk._tags = []
+            return
+        # Sort for consistent ordering; the pattern only matches valid tags
+        chunk._tags = sorted({match.group(1) for match in _TAG_PATTERN.finditer(text)})
 
     def _parse_attachments(self, text: str, chunk: Chunk) -> None:
         """Parse attachments from text and add them to the chunk."""
-        # Find all attachments in the text
-        matches = self.attachment_pattern.finditer(text)
-        attachments = []
+        attachments: list[dict[str, str]] = []
+        if "![" not in text:
+            chunk._attachments = attachments
+            return
 
-        for match in self.attachment_pattern.finditer(text):
-            title = match.group(1)
+        for match in _ATTACHMENT_PATTERN.finditer(text):
             path = match.group(2)
 
             # Determine type based on extension
@@ -299,74 +588,94 @@ class ChunkingEngine:
         # Add attachments to chunk
         chunk._attachments = attachments
 
-    def _split_text(self, text: str) -> list[str]:
-        """Split text into smaller chunks at sentence boundaries or line
-        breaks.
+    def _split_text(self, text: str) -> list[tuple[int, int, str]]:
+        """Split text into smaller chunks at sentence boundaries or line breaks.
+
+        Returns:
+            Start and end offsets of each piece in the text, with its text
         """
-        # First try to split at sentence boundaries
-        sentences = re.split(r"([.!?]+\s+)", text)
-        chunks = []
-        current_chunk: list[str] = []
-        current_size = 0
+        min_size = self.min_chunk_size
+        max_size = self.max_chunk_size
+        pieces: list[tuple[int, int, str]] = []
+
+        def add(start: int, end: int) -> None:
+            if end - start >= min_size:
+                pieces.append((start, end, text[start:end]))
 
-        for i in range(0, len(sentences), 2):
-            sentence = sentences[i]
-            if i + 1 < len(sentences):
-                sentence += sentences[i + 1]  # Add the delimiter back
-            sentence_size = len(sentence)
+        # Consecutive sentences are accumulated as one span
+        current_start: int | None = None
+        current_end = 0
+        sentence_start = 0
+        sentence_ends = [match.end() for match in _SENTENCE_END_PATTERN.finditer(text)]
+        sentence_ends.append(len(text))
+
+        for sentence_end in sentence_ends:
+            start, end = sentence_start, sentence_end
+            sentence_start = sentence_end
 
             # If sentence is too large, split at line breaks
-            if sentence_size > self.max_chunk_size:
+            if end - start > max_size:
                 # First add current chunk if it exists
-                if current_chunk:
-                    chunk_text = "".join(current_chunk)
-                    if len(chunk_text) >= self.min_chunk_size:
-                        chunks.append(chunk_text)
-                    current_chunk = []
-                    current_size = 0
-
-                # Split sentence at line breaks
-                for line in sentence.split("\n"):
-                    line_size = len(line) + 1  # +1 for newline
-                    if line_size > self.max_chunk_size:
+                if current_start is not None:
+                    add(current_start, current_end)
+                    current_start = None
+
+                line_start = start
+                while True:
+                    newline = text.find("\n", line_start, end)
+                    line_end = end if newline < 0 else newline
+                    if line_end - line_start + 1 > max_size:
                         # If line is too large, split at word boundaries
-                        words = line.split()
-                        line_chunk: list[str] = []
-                        line_size = 0
-                        for word in words:
-                            word_size = len(word) + 1  # +1 for space
-                            if line_size + word_size > self.max_chunk_size and line_chunk:
-                                chunk_text = " ".join(line_chunk)
-                                if len(chunk_text) >= self.min_chunk_size:
-                                    chunks.append(chunk_text)
-                                line_chunk = [word]
-                                line_size = word_size
-                            else:
-                                line_chunk.append(word)
-                                line_size += word_size
-                        if line_chunk:
-                            chunk_text = " ".join(line_chunk)
-                            if len(chunk_text) >= self.min_chunk_size:
-                                chunks.append(chunk_text)
+                        self._split_words(text, line_start, line_end, pieces)
                     else:
-                        if len(line) >= self.min_chunk_size:
-                            chunks.append(line)
+                        add(line_start, line_end)
+                    if newline < 0:
+                        break
+                    line_start = newline + 1
+
+            # If adding this sentence would exceed max size, create new chunk
+            elif current_start is not None and end - current_start > max_size:
+                add(current_start, current_end)
+                current_start, current_end = start, end
             else:
-                # If adding this sentence would exceed max size, create new chunk
-                if current_size + sentence_size > self.max_chunk_size and current_chunk:
-                    chunk_text = "".join(current_chunk)
-                    if len(chunk_text) >= self.min_chunk_size:
-                        chunks.append(chunk_text)
-                    current_chunk = [sentence]
-                    current_size = sentence_size
-                else:
-                    current_chunk.append(sentence)
-                    current_size += sentence_size
+                if current_start is None:
+                    current_start = start
+                current_end = end
 
         # Add remaining chunk
-        if current_chunk:
-            chunk_text = "".join(current_chunk)
-            if len(chunk_text) >= self.min_chunk_size:
-                chunks.append(chunk_text)
+        if current_start is not None:
+            add(current_start, current_end)
 
-        return chunks
+        return pieces
+
+    def _split_words(
+        self, text: str, start: int, end: int, pieces: list[tuple[int, int, str]]
+    ) -> None:
+        """Split a line of text at word boundaries, joining words with spaces.
+
+        Args:
+            text: Text containing the line
+            start: Start offset of the line
+            end: End offset of the line
+            pieces: List to append (start, end, text) pieces to
+        """
+        words: list[tuple[int, int]] = []
+        size = 0
+
+        def add() -> None:
+            # The joined words are size - 1 characters long
+            if size - 1 >= self.min_chunk_size:
+                joined = " ".join(text[word_start:word_end] for word_start, word_end in words)
+                pieces.append((words[0][0], words[-1][1], joined))
+
+        for match in _WORD_PATTERN.finditer(text, start, end):
+            word_size = match.end() - match.start() + 1  # +1 for space
+            if size + word_size > self.max_chunk_size and words:
+                add()
+                words = [match.span()]
+                size = word_size
+            else:
+                words.append(match.span())
+                size += word_size
+        if words:
+            add()
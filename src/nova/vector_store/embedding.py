@@ -1,12 +1,20 @@
 """Embedding engine for text processing."""
 
 import logging
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import numpy as np
 from chromadb.api.types import Documents, Embedding, EmbeddingFunction, Embeddings
 from numpy.typing import NDArray
-from sentence_transformers import SentenceTransformer
+
+from nova.vector_store.embedding_cache import EmbeddingCache
+from nova.vector_store.token_chunking import TokenCounter
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +38,49 @@ class EmbeddingResult:
         self.metadata = metadata or {}
 
 
+def length_batches(
+    lengths: Sequence[int], token_budget: int, max_batch_size: int
+) -> list[list[int]]:
+    """Group texts of similar length into batches within a token budget.
+
+    Each batch is padded to its longest text, so texts are sorted by length,
+    longest first, and a batch takes as many texts as fit the budget once
+    padded. Short texts therefore share large batches, and long texts
+    small ones.
+
+    Args:
+        lengths: Number of tokens of each text
+        token_budget: Maximum number of padded tokens per batch
+        max_batch_size: Maximum number of texts per batch
+
+    Returns:
+        Indices of the texts in each batch
+    """
+    order = sorted(range(len(lengths)), key=lambda index: lengths[index], reverse=True)
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    for index in order:
+        # The batch's first text is its longest
+        padded = max(lengths[batch[0]] if batch else lengths[index], 1)
+        if batch and ((len(batch) + 1) * padded > token_budget or len(batch) >= max_batch_size):
+            batches.append(batch)
+            batch = []
+        batch.append(index)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 class NovaEmbeddingFunction(EmbeddingFunction):
     """ChromaDB embedding function implementation."""
 
-    def __init__(self) -> None:
-        """Initialize the embedding function."""
-        self.engine = EmbeddingEngine()
+    def __init__(self, cache: EmbeddingCache | None = None) -> None:
+        """Initialize the embedding function.
+
+        Args:
+            cache: Optional persistent embedding cache
+        """
+        self.engine = EmbeddingEngine(cache=cache)
 
     def __call__(self, input: Documents) -> Embeddings:
         """Create embeddings for texts.
@@ -51,13 +96,76 @@ class NovaEmbeddingFunction(EmbeddingFunction):
         embeddings: list[Embedding] = [result.vector for result in results]
         return embeddings
 
+    def embed_queries(self, queries: list[str]) -> Embeddings:
+        """Create embeddings for search queries without persisting them.
+
+        Free-text queries rarely repeat across sessions, so storing them
+        would only grow the embedding cache.
+
+        Args:
+            queries: Search queries to embed
+
+        Returns:
+            List of embeddings as numpy arrays
+        """
+        results = self.engine.embed_texts(queries, persist=False)
+        embeddings: list[Embedding] = [result.vector for result in results]
+        return embeddings
+
 
 class EmbeddingEngine:
     """Engine for creating text embeddings."""
 
-    def __init__(self) -> None:
-        """Initialize the embedding engine."""
-        self.model = SentenceTransformer("paraphrase-MiniLM-L3-v2")
+    MODEL_NAME = "paraphrase-MiniLM-L3-v2"
+    # Padded tokens per batch: 32 texts of the model's 128-token sequence length
+    DEFAULT_TOKEN_BUDGET = 32 * 128
+    DEFAULT_MAX_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        cache: EmbeddingCache | None = None,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """Initialize the embedding engine.
+
+        Args:
+            cache: Optional persistent embedding cache consulted before encoding
+            token_budget: Maximum number of padded tokens encoded per batch
+            max_batch_size: Maximum number of texts encoded per batch
+        """
+        if token_budget < 1:
+            raise ValueError(f"Token budget must be positive, got {token_budget}")
+        if max_batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {max_batch_size}")
+        self.cache = cache
+        self.token_budget = token_budget
+        self.max_batch_size = max_batch_size
+        self._model: SentenceTransformer | None = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self) -> "SentenceTransformer":
+        """Get the sentence transformer, loading it on first use.
+
+        Importing sentence_transformers pulls in torch, so it is deferred
+        until something actually needs to be embedded.
+        """
+        with self._model_lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                logger.info(f"Loading embedding model {self.MODEL_NAME}")
+                self._model = SentenceTransformer(self.MODEL_NAME)
+            return self._model
+
+    def token_counter(self) -> TokenCounter:
+        """Get a counter of the model's tokens, limited to its maximum sequence length.
+
+        Returns:
+            Token counter for token-aware chunking
+        """
+        return TokenCounter.from_model(self.model)
 
     def embed_text(self, text: str) -> EmbeddingResult:
         """Create embedding for a single text.
@@ -68,6 +176,9 @@ class EmbeddingEngine:
         Returns:
             Embedding result
         """
+        if self.cache is not None:
+            return self.embed_texts([text])[0]
+
         # Create embedding using sentence transformer
         embedding = self.model.encode(
             text,
@@ -77,24 +188,80 @@ class EmbeddingEngine:
         vector = embedding.astype(np.float32)
         return EmbeddingResult(text=text, vector=vector)
 
-    def embed_texts(self, texts: list[str]) -> list[EmbeddingResult]:
+    def embed_texts(self, texts: list[str], persist: bool = True) -> list[EmbeddingResult]:
         """Create embeddings for multiple texts.
 
+        Texts found in the cache are not encoded again, and each distinct
+        missing text is encoded only once.
+
         Args:
             texts: List of texts to embed
+            persist: Whether to store new embeddings in the cache
 
         Returns:
             List of embedding results
         """
-        # Create embeddings in batch
-        embeddings = self.model.encode(
-            texts,
-            convert_to_numpy=True,
-            normalize_embeddings=True,
-            batch_size=32,
-        )
-        vectors = embeddings.astype(np.float32)
+        if self.cache is None:
+            vectors = list(self._encode(texts))
+        else:
+            cached = self.cache.get_many(texts)
+            missing = list(
+                dict.fromkeys(t for t, v in zip(texts, cached, strict=True) if v is None)
+            )
+            encoded = dict(zip(missing, self._encode(missing), strict=True))
+            if persist:
+                self.cache.put_many(missing, [encoded[text] for text in missing])
+            vectors = [
+                vector if vector is not None else encoded[text]
+                for text, vector in zip(texts, cached, strict=True)
+            ]
+
         return [
             EmbeddingResult(text=text, vector=vector)
             for text, vector in zip(texts, vectors, strict=False)
         ]
+
+    def _encode(self, texts: list[str]) -> NDArray[np.float32]:
+        """Encode texts with the model.
+
+        Texts are encoded in batches of similar length sized by the token
+        budget, and the embeddings are returned in the order of the texts.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Array of normalized embeddings, one row per text
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        model = self.model
+        batches = length_batches(self._token_lengths(texts), self.token_budget, self.max_batch_size)
+        parts = [
+            model.encode(
+                [texts[index] for index in batch],
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                batch_size=len(batch),
+            )
+            for batch in batches
+        ]
+        embeddings = np.empty((len(texts), parts[0].shape[1]), dtype=np.float32)
+        embeddings[[index for batch in batches for index in batch]] = np.concatenate(parts)
+        return embeddings
+
+    def _token_lengths(self, texts: list[str]) -> list[int]:
+        """Count the tokens the model sees of each text.
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            Number of tokens of each text, including special tokens and
+            truncated to the model's maximum sequence length
+        """
+        model = self.model
+        encoding = model.tokenizer(
+            texts, truncation=True, max_length=model.max_seq_length, verbose=False
+        )
+        return [len(ids) for ids in encoding["input_ids"]]
@@ -0,0 +1,158 @@
+"""Persistent embedding cache.
+
+Embeddings are stored in a SQLite database keyed by a hash of the model
+name and the text, so identical text is only ever embedded once per
+model. The cache lives in its own directory inside the vector store, which
+``clean-vectors`` keeps: a full rebuild only embeds text that has not been
+seen before. Only document embeddings are stored; search queries are not.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """On-disk cache of text embeddings."""
+
+    FILENAME = "embeddings.db"
+    # Stay well below SQLite's limit on host parameters per statement
+    MAX_QUERY_PARAMS = 500
+
+    def __init__(self, cache_dir: Path, model_name: str) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory containing the cache database
+            model_name: Name of the model the embeddings belong to
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / self.FILENAME
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        # Lookups run on search pool threads as well as the ingest thread
+        self._stats_lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize the cache database."""
+        with self._get_db() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL
+                )
+            """
+            )
+
+    @contextmanager
+    def _get_db(self) -> Iterator[sqlite3.Connection]:
+        """Context manager for database connections.
+
+        Returns:
+            SQLite database connection
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def key(self, text: str) -> str:
+        """Get the cache key for a text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Hex digest of the model name and text
+        """
+        digest = hashlib.sha256(self.model_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", errors="surrogatepass"))
+        return digest.hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> list[NDArray[np.float32] | None]:
+        """Look up embeddings for texts.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Cached embedding for each text, or None where there is none
+        """
+        keys = [self.key(text) for text in texts]
+        found: dict[str, NDArray[np.float32]] = {}
+        try:
+            with self._get_db() as conn:
+                unique_keys = list(dict.fromkeys(keys))
+                for start in range(0, len(unique_keys), self.MAX_QUERY_PARAMS):
+                    batch = unique_keys[start : start + self.MAX_QUERY_PARAMS]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        batch,
+                    )
+                    for key, vector in rows:
+                        found[key] = np.frombuffer(vector, dtype=np.float32).copy()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+
+        vectors = [found.get(key) for key in keys]
+        hits = sum(vector is not None for vector in vectors)
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += len(vectors) - hits
+        return vectors
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[NDArray[np.float32]]) -> None:
+        """Store embeddings for texts.
+
+        Args:
+            texts: Embedded texts
+            vectors: Embedding for each text
+        """
+        rows = [
+            (self.key(text), self.model_name, len(vector), np.asarray(vector, np.float32).tobytes())
+            for text, vector in zip(texts, vectors, strict=True)
+        ]
+        if not rows:
+            return
+        try:
+            with self._get_db() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model, dim, vector) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache update failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached embeddings for the model."""
+        with self._get_db() as conn:
+            conn.execute("DELETE FROM embeddings WHERE model = ?", (self.model_name,))
+
+    def __len__(self) -> int:
+        """Get the number of cached embeddings for the model."""
+        with self._get_db() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ?", (self.model_name,)
+            ).fetchone()
+        return int(row[0])
@@ -1,7 +1,9 @@
 """Thread pool executor for CPU-bound operations."""
 
+import asyncio
 import concurrent.futures
 import multiprocessing
+import threading
 from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
@@ -40,7 +42,9 @@ class ThreadPoolExecutor:
         assert self._executor is not None  # for type checker
         return self._executor
 
-    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> concurrent.futures.Future[T]:
+    def submit(
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[T]:
         """Submit a function to the executor.
 
         Args:
@@ -76,5 +80,124 @@ class ThreadPoolExecutor:
             self._executor = None
 
 
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a bounded executor cannot accept more work."""
+
+
+class BoundedExecutor:
+    """Thread pool that rejects work instead of queueing without limit.
+
+    At most ``max_workers`` tasks run at once and at most ``max_queue``
+    more wait for a worker. Further submissions raise
+    ``ExecutorSaturatedError`` immediately so that callers can shed load.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int = 32,
+        thread_name_prefix: str = "nova_worker",
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Number of worker threads, defaults to the CPU count
+            max_queue: Number of tasks allowed to wait for a worker
+            thread_name_prefix: Prefix for worker thread names
+        """
+        max_workers = max_workers or multiprocessing.cpu_count()
+        if max_workers < 1:
+            raise ValueError(f"Worker count must be positive, got {max_workers}")
+        if max_queue < 0:
+            raise ValueError(f"Queue depth must not be negative, got {max_queue}")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def submit(
+        self, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[T]:
+        """Submit a function to the executor.
+
+        Args:
+            fn: Function to execute
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Future object
+
+        Raises:
+            ExecutorSaturatedError: If all workers are busy and the queue is full
+        """
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(
+                    f"Executor saturated: {self._pending} tasks pending "
+                    f"({self.max_workers} workers, queue depth {self.max_queue})"
+                )
+            self._pending += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._task_done)
+        return future
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a function in the executor without blocking the event loop.
+
+        Args:
+            fn: Function to execute
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Result of the function
+
+        Raises:
+            ExecutorSaturatedError: If all workers are busy and the queue is full
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _task_done(self, future: concurrent.futures.Future[Any]) -> None:
+        """Release the slot held by a finished task."""
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get executor statistics.
+
+        Returns:
+            Pool size, queue depth and task counters
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shutdown the executor.
+
+        Args:
+            wait: Whether to wait for pending futures
+        """
+        self._executor.shutdown(wait=wait)
+
+
 # Global executor instance
 executor = ThreadPoolExecutor()
@@ -0,0 +1,308 @@
+"""Index manifest for incremental vector store updates.
+
+The manifest lives in the vector store directory and records, for every
+indexed source file, the hash and stat of the content that was indexed
+and the IDs of the chunks created from it. Incremental runs use it to
+skip unchanged files and to delete chunks of changed or removed files.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    """Indexed state of a single source file."""
+
+    content_hash: str
+    mtime: float
+    size: int
+    chunk_ids: list[str] = field(default_factory=list)
+
+
+class IndexManifest:
+    """Maps source files to their indexed content hash, stat and chunk IDs."""
+
+    FILENAME = "manifest.json"
+    VERSION = 1
+
+    def __init__(self, base_path: str | Path) -> None:
+        """Initialize the manifest and load it from disk if present.
+
+        Args:
+            base_path: Vector store directory containing the manifest
+        """
+        self.path = Path(base_path) / self.FILENAME
+        self._entries: dict[str, ManifestEntry] = {}
+        self.load()
+
+    @staticmethod
+    def hash_content(text: str) -> str:
+        """Hash document content.
+
+        Args:
+            text: Document content
+
+        Returns:
+            Hex digest of the content
+        """
+        return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+    def load(self) -> None:
+        """Load the manifest from disk, starting empty if it is missing or invalid."""
+        self._entries = {}
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != self.VERSION:
+                logger.warning(f"Ignoring manifest with unsupported version: {self.path}")
+                return
+            self._entries = {
+                source: ManifestEntry(**entry) for source, entry in data["files"].items()
+            }
+            logger.info(f"Loaded manifest with {len(self._entries)} files from {self.path}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+
+    def save(self) -> None:
+        """Write the manifest to disk atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": self.VERSION,
+            "files": {source: asdict(entry) for source, entry in self._entries.items()},
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved manifest with {len(self._entries)} files to {self.path}")
+
+    def clear(self) -> None:
+        """Remove all entries and delete the manifest file."""
+        self._entries = {}
+        self.path.unlink(missing_ok=True)
+
+    def get(self, source: str) -> ManifestEntry | None:
+        """Get the entry for a source file.
+
+        Args:
+            source: Source file key
+
+        Returns:
+            Manifest entry or None if the file is not indexed
+        """
+        return self._entries.get(source)
+
+    def put(self, source: str, entry: ManifestEntry) -> None:
+        """Set the entry for a source file.
+
+        Args:
+            source: Source file key
+            entry: Manifest entry
+        """
+        self._entries[source] = entry
+
+    def remove(self, source: str) -> ManifestEntry | None:
+        """Remove the entry for a source file.
+
+        Args:
+            source: Source file key
+
+        Returns:
+            Removed entry or None if the file was not indexed
+        """
+        return self._entries.pop(source, None)
+
+    def sources(self) -> set[str]:
+        """Get all indexed source files.
+
+        Returns:
+            Set of source file keys
+        """
+        return set(self._entries)
+
+    def __len__(self) -> int:
+        """Get the number of indexed files."""
+        return len(self._entries)
+
+
+def _manifest_key(path: Path) -> str:
+    """Get the manifest key for a source path without touching the filesystem."""
+    return os.path.abspath(path)
+
+
+class ManifestUpdate:
+    """Tracks a single ingest run against an index manifest.
+
+    Readers call ``should_read`` before reading a file and the chunking
+    stage calls ``should_index`` and ``track_chunks`` for every document;
+    ``record_batch`` is called as ingest batches complete, in order.
+    ``finish`` then updates the manifest and returns the IDs of chunks
+    that belong to changed or removed files and must be deleted.
+
+    A store can hold files from several input directories, so only files
+    under the run's root directory that were not seen are treated as
+    removed, and only when pruning.
+    """
+
+    def __init__(
+        self,
+        manifest: IndexManifest,
+        incremental: bool = False,
+        root: Path | None = None,
+        prune: bool | None = None,
+    ) -> None:
+        """Initialize the update.
+
+        Args:
+            manifest: Manifest to update
+            incremental: Whether to skip files that are unchanged since the last run
+            root: Input directory of the run; files outside it are never removed
+            prune: Whether to remove files under the root that were not seen;
+                defaults to incremental
+        """
+        self.manifest = manifest
+        self.incremental = incremental
+        self.root = _manifest_key(root) if root is not None else None
+        self.prune = incremental if prune is None else prune
+        self.skipped = 0
+        self._seen: set[str] = set()
+        self._pending: dict[str, ManifestEntry] = {}
+        self._failed: set[str] = set()
+        self._chunk_sources: deque[str | None] = deque()
+
+    def should_read(self, path: Path) -> bool:
+        """Check whether a file needs to be read.
+
+        Args:
+            path: Source file path
+
+        Returns:
+            False if running incrementally and the file's stat is unchanged
+        """
+        key = _manifest_key(path)
+        self._seen.add(key)
+        entry = self.manifest.get(key)
+        if self.incremental and entry is not None:
+            try:
+                stat = path.stat()
+            except OSError:
+                return True
+            if stat.st_mtime == entry.mtime and stat.st_size == entry.size:
+                self.skipped += 1
+                return False
+        return True
+
+    def should_index(self, text: str, source: Path | None) -> bool:
+        """Check whether a document's content needs to be chunked and embedded.
+
+        Args:
+            text: Document content
+            source: Source file path, if any
+
+        Returns:
+            False if running incrementally and the content is unchanged
+        """
+        if source is None:
+            return True
+
+        key = _manifest_key(source)
+        self._seen.add(key)
+        content_hash = IndexManifest.hash_content(text)
+        try:
+            stat = source.stat()
+            mtime, size = stat.st_mtime, stat.st_size
+        except OSError:
+            mtime, size = 0.0, -1
+
+        entry = self.manifest.get(key)
+        if self.incremental and entry is not None and entry.content_hash == content_hash:
+            # Touched but not modified: remember the new stat so the next run skips the read
+            entry.mtime, entry.size = mtime, size
+            self.skipped += 1
+            return False
+
+        self._pending[key] = ManifestEntry(content_hash=content_hash, mtime=mtime, size=size)
+        return True
+
+    def track_chunks(self, source: Path | None, chunk_ids: Iterable[str]) -> None:
+        """Record the chunks created for a document, in ingest order.
+
+        Args:
+            source: Source file path, if any
+            chunk_ids: IDs of the document's chunks
+        """
+        key = _manifest_key(source) if source is not None else None
+        ids = list(chunk_ids)
+        if key is not None and key in self._pending:
+            self._pending[key].chunk_ids.extend(ids)
+        self._chunk_sources.extend([key] * len(ids))
+
+    def mark_failed(self, source: Path | None) -> None:
+        """Mark a document as failed so that it is re-indexed on the next run.
+
+        Args:
+            source: Source file path, if any
+        """
+        if source is not None:
+            self._failed.add(_manifest_key(source))
+
+    def record_batch(self, size: int, failed: bool = False) -> None:
+        """Record a completed ingest batch.
+
+        Args:
+            size: Number of chunks in the batch
+            failed: Whether the batch failed to be stored
+        """
+        for _ in range(size):
+            key = self._chunk_sources.popleft()
+            if failed and key is not None:
+                self._failed.add(key)
+
+    def _in_root(self, key: str) -> bool:
+        """Check whether a manifest key may be removed by this run."""
+        if not self.prune:
+            return False
+        if self.root is None:
+            return True
+        return key == self.root or key.startswith(self.root.rstrip(os.sep) + os.sep)
+
+    def finish(self) -> list[str]:
+        """Apply the run's results to the manifest.
+
+        Returns:
+            IDs of stale chunks from changed or removed files
+        """
+        stale: list[str] = []
+
+        removed = {key for key in self.manifest.sources() - self._seen if self._in_root(key)}
+        for key in removed:
+            entry = self.manifest.remove(key)
+            if entry is not None:
+                stale.extend(entry.chunk_ids)
+
+        for key, entry in self._pending.items():
+            previous = self.manifest.get(key)
+            previous_ids = previous.chunk_ids if previous else []
+            if key in self._failed:
+                # Keep every ID we may have stored and force a re-index next time
+                chunk_ids = list(dict.fromkeys([*previous_ids, *entry.chunk_ids]))
+                entry = ManifestEntry(content_hash="", mtime=0.0, size=-1, chunk_ids=chunk_ids)
+            else:
+                current_ids = set(entry.chunk_ids)
+                stale.extend(chunk_id for chunk_id in previous_ids if chunk_id not in current_ids)
+            self.manifest.put(key, entry)
+
+        logger.info(
+            f"Manifest update: {len(self._pending)} files indexed, {self.skipped} unchanged, "
+            f"{len(removed)} removed, {len(stale)} stale chunks"
+        )
+        return stale
@@ -0,0 +1,138 @@
+"""Parallel chunking of documents across worker processes.
+
+Chunking is pure Python, so a single process uses one core. The
+``ParallelChunker`` distributes documents over a process pool. Workers
+return chunks in their compact tuple form, which pickles much faster than
+``Chunk`` dataclasses; the parent process rebuilds the chunks.
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .chunking import Chunk, ChunkingEngine, ChunkTuple, DocumentMetadata
+
+logger = logging.getLogger(__name__)
+
+# Document metadata, sent once per document, and the document's chunks
+_WorkerResult = tuple[DocumentMetadata | None, list[ChunkTuple]]
+
+# Engine of the current worker process, set when the worker starts
+_worker_engine: ChunkingEngine | None = None
+
+
+def _init_worker(engine: ChunkingEngine) -> None:
+    """Set the engine of a worker process.
+
+    Args:
+        engine: Engine to chunk documents with, pickled once per worker
+    """
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _chunk_in_worker(text: str, source: Path | None) -> _WorkerResult:
+    """Chunk a document in a worker process.
+
+    Args:
+        text: Document text
+        source: Source file path, if any
+
+    Returns:
+        Metadata of the document, sent once rather than with every chunk,
+        and its chunks in tuple form
+    """
+    assert _worker_engine is not None  # set by _init_worker
+    chunks = _worker_engine.chunk_document(text, source)
+    document = chunks[0].document if chunks else None
+    return document, [chunk.to_tuple() for chunk in chunks]
+
+
+@dataclass
+class ChunkingResult:
+    """Outcome of chunking a single document."""
+
+    source: Path | None
+    chunks: list[Chunk] = field(default_factory=list)
+    error: str | None = None
+
+
+class ParallelChunker:
+    """Chunks documents in worker processes, yielding results in input order."""
+
+    # Documents submitted ahead of the consumer, per worker
+    PREFETCH_PER_WORKER = 4
+
+    def __init__(self, engine: ChunkingEngine | None = None, workers: int | None = None) -> None:
+        """Initialize the chunker.
+
+        Args:
+            engine: Engine to chunk documents with; it is pickled to each worker
+            workers: Number of worker processes; defaults to the CPU count.
+                With one worker, documents are chunked in the calling process.
+        """
+        self.engine = engine or ChunkingEngine()
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError(f"Worker count must be positive, got {self.workers}")
+
+    def chunk_many(self, documents: Iterable[tuple[str, Path | None]]) -> Iterator[ChunkingResult]:
+        """Chunk documents, yielding results in input order.
+
+        Args:
+            documents: Tuples of (document text, source path)
+
+        Yields:
+            Result of each document; failures are reported, not raised
+        """
+        if self.workers == 1:
+            for text, source in documents:
+                try:
+                    yield ChunkingResult(source, self.engine.chunk_document(text, source))
+                except Exception as e:
+                    yield ChunkingResult(source, error=str(e))
+            return
+
+        # Chunking runs inside threaded pipeline stages, and forking a process
+        # with other threads running can copy locks they hold; spawn instead
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.engine,),
+        )
+
+        def submit(
+            document: tuple[str, Path | None],
+        ) -> tuple[Path | None, Future[_WorkerResult]]:
+            text, source = document
+            return source, executor.submit(_chunk_in_worker, text, source)
+
+        # Keep a bounded window of documents in flight so memory stays flat
+        remaining = iter(documents)
+        pending: deque[tuple[Path | None, Future[_WorkerResult]]] = deque()
+        window = self.workers * self.PREFETCH_PER_WORKER
+        try:
+            for document in remaining:
+                pending.append(submit(document))
+                if len(pending) >= window:
+                    break
+            while pending:
+                source, future = pending.popleft()
+                next_document = next(remaining, None)
+                if next_document is not None:
+                    pending.append(submit(next_document))
+                try:
+                    metadata, tuples = future.result()
+                    chunks = [Chunk.from_tuple(data, source, metadata) for data in tuples]
+                except Exception as e:
+                    yield ChunkingResult(source, error=str(e))
+                    continue
+                yield ChunkingResult(source, chunks)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
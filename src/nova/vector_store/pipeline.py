@@ -0,0 +1,95 @@
+"""Streaming pipeline helpers for vector ingestion.
+
+Ingestion is organised as a chain of generators (read -> chunk -> embed
+-> upsert). ``bounded_stage`` runs one link of that chain in a background
+thread and hands its items to the next link through a bounded queue, so
+stages overlap while memory stays proportional to the queue sizes rather
+than to the corpus size.
+"""
+
+import logging
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How long the producer waits on a full queue before re-checking for cancellation
+_PUT_TIMEOUT = 0.1
+
+
+class _StageDone:
+    """Marker placed on the queue when a stage finishes."""
+
+    def __init__(self, error: BaseException | None = None) -> None:
+        """Initialize the marker.
+
+        Args:
+            error: Exception raised by the producer, if any
+        """
+        self.error = error
+
+
+def bounded_stage(items: Iterable[T], maxsize: int = 64, name: str = "stage") -> Iterator[T]:
+    """Produce items in a background thread through a bounded queue.
+
+    The producer blocks when ``maxsize`` items are waiting, which bounds
+    memory use. Exceptions raised by the producer are re-raised in the
+    consumer. Closing the returned generator early stops the producer.
+
+    Args:
+        items: Iterable to consume in the background
+        maxsize: Maximum number of items buffered between the stages
+        name: Stage name used for the thread name and logging
+
+    Yields:
+        Items from ``items`` in their original order
+    """
+    if maxsize < 1:
+        raise ValueError(f"Queue size must be positive, got {maxsize}")
+
+    buffer: queue.Queue[T | _StageDone] = queue.Queue(maxsize=maxsize)
+    cancelled = threading.Event()
+
+    def put(item: T | _StageDone) -> bool:
+        while not cancelled.is_set():
+            try:
+                buffer.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as e:
+            logger.debug(f"Pipeline stage '{name}' failed: {e}")
+            put(_StageDone(e))
+            return
+        finally:
+            # Propagate cancellation to upstream generators (and their stages)
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        put(_StageDone())
+
+    thread = threading.Thread(target=produce, name=f"nova_pipeline_{name}", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, _StageDone):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        cancelled.set()
+        thread.join()
@@ -0,0 +1,99 @@
+"""In-memory caches for search queries.
+
+Search requests from agents are frequently repeated verbatim. The vector
+store keeps a bounded LRU of query embeddings and one of search results;
+result entries are keyed on the collection generation so that any write
+to the collection makes earlier results unreachable.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypedDict, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStats(TypedDict):
+    """Cache statistics."""
+
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe bounded least-recently-used cache."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; 0 disables caching
+        """
+        if maxsize < 0:
+            raise ValueError(f"Cache size must not be negative, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """Get an entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on a miss
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Add an entry, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries; hit and miss counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Get cache statistics.
+
+        Returns:
+            Size, capacity and hit/miss counters
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        return len(self._entries)
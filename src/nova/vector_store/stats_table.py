@@ -0,0 +1,303 @@
+"""Incrementally maintained vector store statistics.
+
+Health checks used to fetch every chunk from ChromaDB and aggregate its
+metadata on each call. ``ChunkStatsTable`` instead keeps per-chunk stat
+rows and aggregate counters in SQLite and updates both whenever chunks are
+stored or deleted, so reading repository statistics costs a handful of
+small queries regardless of the collection size.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Chunk attachments are stored as the str() of their dicts, joined by commas
+_ATTACHMENT_TYPE_PATTERN = re.compile(r"""['"]type['"]:\s*['"]([^'"]*)['"]""")
+
+
+def _parse_tags(value: Any) -> list[str]:
+    """Parse the tags stored in chunk metadata.
+
+    Args:
+        value: JSON list, comma-separated string or list of tags
+
+    Returns:
+        List of tags
+    """
+    if isinstance(value, list):
+        return [str(tag) for tag in value]
+    if not isinstance(value, str) or not value:
+        return []
+    try:
+        tags = json.loads(value)
+        if isinstance(tags, list):
+            return [str(tag) for tag in tags]
+    except json.JSONDecodeError:
+        pass
+    return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+
+def _parse_attachment_types(value: Any) -> list[str]:
+    """Parse the attachment types stored in chunk metadata.
+
+    Args:
+        value: JSON list of attachment dicts or their stringified form
+
+    Returns:
+        Type of each attachment
+    """
+    if isinstance(value, str) and value:
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return _ATTACHMENT_TYPE_PATTERN.findall(value)
+    if isinstance(value, list):
+        return [str(item.get("type", "unknown")) for item in value if isinstance(item, dict)]
+    return []
+
+
+class ChunkStatsTable:
+    """Per-chunk statistics and aggregate counters for a vector store."""
+
+    FILENAME = "stats.db"
+    # Upper bounds of the chunk size histogram buckets, in characters
+    SIZE_BUCKETS = (128, 256, 512, 1024, 2048)
+
+    def __init__(self, base_path: Path | None = None) -> None:
+        """Initialize the table.
+
+        Args:
+            base_path: Vector store directory, or None to keep statistics in memory
+        """
+        self.db_path = Path(base_path) / self.FILENAME if base_path else None
+        # A single connection is shared so that in-memory statistics persist
+        self._conn = sqlite3.connect(
+            str(self.db_path) if self.db_path else ":memory:", check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self) -> None:
+        """Initialize the statistics tables."""
+        with self._transaction() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS chunks (
+                    chunk_id TEXT PRIMARY KEY,
+                    document_id TEXT NOT NULL,
+                    document_type TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    tags TEXT NOT NULL,
+                    attachment_types TEXT NOT NULL,
+                    date TEXT
+                );
+                CREATE INDEX IF NOT EXISTS chunks_size ON chunks(size);
+                CREATE INDEX IF NOT EXISTS chunks_date ON chunks(date);
+
+                CREATE TABLE IF NOT EXISTS counts (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (kind, key)
+                );
+            """
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a single locked transaction.
+
+        Returns:
+            SQLite database connection
+        """
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def _size_bucket(self, size: int) -> str:
+        """Get the histogram bucket label for a chunk size."""
+        for bound in self.SIZE_BUCKETS:
+            if size <= bound:
+                return f"<={bound}"
+        return f">{self.SIZE_BUCKETS[-1]}"
+
+    def _contributions(self, row: tuple[Any, ...]) -> Counter[tuple[str, str]]:
+        """Get the counter increments of a chunk row.
+
+        Args:
+            row: Chunk row without its ID
+
+        Returns:
+            Increment per (kind, key) counter
+        """
+        document_id, document_type, size, tags, attachment_types, _date = row
+        tag_list = json.loads(tags)
+        attachment_list = json.loads(attachment_types)
+        counts: Counter[tuple[str, str]] = Counter()
+        counts["total", "chunks"] += 1
+        counts["total", "size"] += size
+        counts["total", "tags"] += len(tag_list)
+        counts["total", "attachments"] += len(attachment_list)
+        counts["source", document_id] += 1
+        counts["size_bucket", self._size_bucket(size)] += 1
+        if document_type:
+            counts["type", document_type] += 1
+        for tag in tag_list:
+            counts["tag", tag] += 1
+        for attachment_type in attachment_list:
+            counts["attachment_type", attachment_type] += 1
+        return counts
+
+    @staticmethod
+    def _make_row(chunk_id: str, text: str, metadata: dict[str, Any]) -> tuple[Any, ...]:
+        """Build a chunk row from stored chunk data."""
+        date = metadata.get("date") or None
+        return (
+            chunk_id,
+            str(metadata.get("document_id") or chunk_id),
+            str(metadata.get("document_type") or ""),
+            len(text or ""),
+            json.dumps(_parse_tags(metadata.get("tags"))),
+            json.dumps(_parse_attachment_types(metadata.get("attachments"))),
+            str(date) if date else None,
+        )
+
+    def record(self, chunks: Iterable[tuple[str, str, dict[str, Any]]]) -> None:
+        """Record stored chunks, replacing the statistics of existing ones.
+
+        Args:
+            chunks: (chunk ID, text, metadata) of each stored chunk
+        """
+        rows = {chunk_id: self._make_row(chunk_id, text, md) for chunk_id, text, md in chunks}
+        if not rows:
+            return
+        with self._transaction() as conn:
+            deltas = self._remove_rows(conn, list(rows))
+            conn.executemany(
+                "INSERT INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?)", list(rows.values())
+            )
+            for row in rows.values():
+                deltas.update(self._contributions(row[1:]))
+            self._apply(conn, deltas)
+
+    def remove(self, chunk_ids: Iterable[str]) -> None:
+        """Remove the statistics of deleted chunks.
+
+        Args:
+            chunk_ids: IDs of the deleted chunks; unknown IDs are ignored
+        """
+        ids = list(chunk_ids)
+        if not ids:
+            return
+        with self._transaction() as conn:
+            self._apply(conn, self._remove_rows(conn, ids))
+
+    def _remove_rows(
+        self, conn: sqlite3.Connection, chunk_ids: list[str]
+    ) -> Counter[tuple[str, str]]:
+        """Delete chunk rows and return the negated contributions.
+
+        Counter.update adds negative values, unlike Counter subtraction
+        which would drop them.
+        """
+        deltas: Counter[tuple[str, str]] = Counter()
+        # Stay well below SQLite's limit on host parameters per statement
+        for start in range(0, len(chunk_ids), 500):
+            batch = chunk_ids[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT document_id, document_type, size, tags, attachment_types, date "
+                f"FROM chunks WHERE chunk_id IN ({placeholders})",
+                batch,
+            ).fetchall()
+            for row in rows:
+                deltas.update({key: -n for key, n in self._contributions(row).items()})
+            conn.execute(f"DELETE FROM chunks WHERE chunk_id IN ({placeholders})", batch)
+        return deltas
+
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, deltas: Counter[tuple[str, str]]) -> None:
+        """Apply counter increments and drop counters that reach zero."""
+        conn.executemany(
+            "INSERT INTO counts VALUES (?, ?, ?) "
+            "ON CONFLICT (kind, key) DO UPDATE SET count = count + excluded.count",
+            [(kind, key, n) for (kind, key), n in deltas.items() if n],
+        )
+        conn.execute("DELETE FROM counts WHERE count = 0 AND kind != 'total'")
+
+    def clear(self) -> None:
+        """Remove all statistics."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM chunks")
+            conn.execute("DELETE FROM counts")
+
+    def count(self) -> int:
+        """Get the number of recorded chunks."""
+        return self._counts("total").get("chunks", 0)
+
+    def _counts(self, kind: str) -> dict[str, int]:
+        """Get all counters of a kind."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, count FROM counts WHERE kind = ?", (kind,))
+            return {key: count for key, count in rows}
+
+    def repository_stats(self) -> dict[str, Any]:
+        """Get aggregated repository statistics.
+
+        Returns:
+            Repository statistics in the shape of the health check's
+            ``repository`` section
+        """
+        totals = self._counts("total")
+        sources = self._counts("source")
+        tags = self._counts("tag")
+        attachment_types = self._counts("attachment_type")
+        histogram = self._counts("size_bucket")
+        with self._lock:
+            min_size, max_size = self._conn.execute(
+                "SELECT MIN(size), MAX(size) FROM chunks"
+            ).fetchone()
+            earliest, latest = self._conn.execute(
+                "SELECT MIN(date), MAX(date) FROM chunks WHERE date IS NOT NULL"
+            ).fetchone()
+
+        total_chunks = totals.get("chunks", 0)
+        total_size = totals.get("size", 0)
+        return {
+            "total_chunks": total_chunks,
+            "unique_sources": len(sources),
+            "file_types": self._counts("type"),
+            "total_attachments": totals.get("attachments", 0),
+            "attachment_types": attachment_types,
+            "date_range": {"earliest": earliest, "latest": latest},
+            "tags": {
+                "total": totals.get("tags", 0),
+                "unique": len(tags),
+                "list": sorted(tags),
+            },
+            "size_stats": {
+                "min_size": min_size or 0,
+                "max_size": max_size or 0,
+                "avg_size": int(total_size / total_chunks) if total_chunks else 0,
+                "total_size": total_size,
+            },
+            "size_histogram": histogram,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
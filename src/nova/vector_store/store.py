@@ -4,27 +4,38 @@ This module provides a vector store implementation using ChromaDB. It
 handles document storage, retrieval, and semantic search functionality.
 """
 
+import copy
 import json
 import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, NotRequired, TypedDict, cast
-
-import chromadb
-from chromadb.api.models.Collection import Collection
-from chromadb.api.types import (
-    IncludeEnum,
-)
-from chromadb.config import Settings
+from typing import TYPE_CHECKING, Any, NotRequired, TypedDict, cast
 
 from nova.vector_store.chunking import Chunk
-from nova.vector_store.embedding import NovaEmbeddingFunction
+from nova.vector_store.embedding_cache import EmbeddingCache
+from nova.vector_store.manifest import IndexManifest
+from nova.vector_store.query_cache import LRUCache
+from nova.vector_store.stats_table import ChunkStatsTable
+
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+    from chromadb.api.models.Collection import Collection
+
+    from nova.vector_store.embedding import EmbeddingEngine, NovaEmbeddingFunction
 
 logger = logging.getLogger(__name__)
 
-# Constants for include fields
-QUERY_INCLUDE_FIELDS = [IncludeEnum.documents, IncludeEnum.metadatas, IncludeEnum.distances]
-GET_INCLUDE_FIELDS = [IncludeEnum.documents, IncludeEnum.metadatas]
+# Generation, query, limit and serialized metadata filter
+SearchCacheKey = tuple[int, str, int, str | None]
+
+# Constants for include fields. These are the values of chromadb's IncludeEnum,
+# spelled out so that importing this module does not import chromadb.
+QUERY_INCLUDE_FIELDS: Any = ["documents", "metadatas", "distances"]
+GET_INCLUDE_FIELDS: Any = ["documents", "metadatas"]
 
 
 def _convert_metadata_value(value: Any) -> str | int | float | bool:
@@ -62,6 +73,7 @@ class RepositoryStats(TypedDict):
     date_range: DateRange
     tags: TagStats
     size_stats: NotRequired[dict[str, int | float]]
+    size_histogram: NotRequired[dict[str, int]]
 
 
 class CollectionStats(TypedDict):
@@ -91,6 +103,19 @@ class HealthData(TypedDict):
     repository: RepositoryStats
 
 
+class BatchTiming(TypedDict):
+    """Timing information for a single bulk-ingest batch."""
+
+    batch: int
+    size: int
+    skipped: int
+    prepare_time: float
+    embed_time: float
+    insert_time: float
+    total_time: float
+    error: NotRequired[str]
+
+
 class ChromaMetadata(TypedDict):
     """ChromaDB metadata structure."""
 
@@ -130,41 +155,127 @@ class VectorStore:
     """Vector store class."""
 
     COLLECTION_NAME = "nova"
-
-    def __init__(self, base_path: str, use_memory: bool = False) -> None:
+    DEFAULT_BATCH_SIZE = 256
+    QUERY_CACHE_SIZE = 1024
+    RESULT_CACHE_SIZE = 256
+    # Kept by clean-vectors so that rebuilds reuse embeddings
+    EMBEDDING_CACHE_DIR = "embedding_cache"
+
+    def __init__(
+        self, base_path: str, use_memory: bool = False, cache_dir: Path | None = None
+    ) -> None:
         """Initialize the vector store.
 
         Args:
             base_path: Base path for storing vectors
             use_memory: Whether to use in-memory storage
+            cache_dir: Directory of the persistent embedding cache. Defaults to
+                ``embedding_cache`` inside ``base_path`` for persistent stores;
+                in-memory stores do not use a cache unless one is given.
         """
         logger.info(f"Initializing VectorStore at {base_path}")
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.persistent = not use_memory
         logger.info(f"Created base directory: {self.base_path}")
 
-        # Initialize ChromaDB client
-        if use_memory:
-            settings = Settings(anonymized_telemetry=False, allow_reset=True, is_persistent=False)
-            logger.info("Using in-memory storage")
-        else:
-            settings = Settings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-                is_persistent=True,
-                persist_directory=str(self.base_path / "chroma"),
-            )
-            logger.info(f"Using persistent storage at {self.base_path / 'chroma'}")
-
-        # Create client and collection with our embedding engine
-        self._client = chromadb.Client(settings)
-        self._embedding_function = NovaEmbeddingFunction()
-        self._collection: Collection = self._client.get_or_create_collection(
-            name=self.COLLECTION_NAME,
-            metadata={"hnsw_space": "cosine"},
-            embedding_function=cast(Any, self._embedding_function),
+        if cache_dir is None and not use_memory:
+            cache_dir = self.base_path / self.EMBEDDING_CACHE_DIR
+        self._cache_dir = cache_dir
+
+        # ChromaDB and the embedding model are expensive to import and load,
+        # so they are only created when the store is first used
+        self._init_lock = threading.RLock()
+        self._chroma_client: ClientAPI | None = None
+        self._chroma_collection: Collection | None = None
+        self._nova_embedding_function: NovaEmbeddingFunction | None = None
+        self._embedding_cache: EmbeddingCache | None = None
+
+        # Repository statistics maintained on every write, read by check_health
+        self._stats_table: ChunkStatsTable | None = None
+
+        # Search caches; result entries are keyed on the collection generation,
+        # which every write to the collection bumps
+        self.generation = 0
+        self._generation_lock = threading.Lock()
+        self._query_embeddings: LRUCache[str, Any] = LRUCache(self.QUERY_CACHE_SIZE)
+        self._search_results: LRUCache[SearchCacheKey, list[dict[str, Any]]] = LRUCache(
+            self.RESULT_CACHE_SIZE
         )
-        logger.info(f"Created/loaded collection '{self.COLLECTION_NAME}'")
+
+    @property
+    def _client(self) -> "ClientAPI":
+        """Get the ChromaDB client, creating it on first use."""
+        with self._init_lock:
+            if self._chroma_client is None:
+                import chromadb
+                from chromadb.config import Settings
+
+                if self.persistent:
+                    settings = Settings(
+                        anonymized_telemetry=False,
+                        allow_reset=True,
+                        is_persistent=True,
+                        persist_directory=str(self.base_path / "chroma"),
+                    )
+                    logger.info(f"Using persistent storage at {self.base_path / 'chroma'}")
+                else:
+                    settings = Settings(
+                        anonymized_telemetry=False, allow_reset=True, is_persistent=False
+                    )
+                    logger.info("Using in-memory storage")
+                self._chroma_client = chromadb.Client(settings)
+            return self._chroma_client
+
+    @property
+    def _stats(self) -> ChunkStatsTable:
+        """Get the statistics table, opening its database on first use."""
+        with self._init_lock:
+            if self._stats_table is None:
+                self._stats_table = ChunkStatsTable(self.base_path if self.persistent else None)
+            return self._stats_table
+
+    @property
+    def _embedding_function(self) -> "NovaEmbeddingFunction":
+        """Get the embedding function; the model itself loads on the first embed."""
+        with self._init_lock:
+            if self._nova_embedding_function is None:
+                from nova.vector_store.embedding import NovaEmbeddingFunction
+
+                self._nova_embedding_function = NovaEmbeddingFunction(cache=self.embedding_cache)
+            return self._nova_embedding_function
+
+    @property
+    def embedding_engine(self) -> "EmbeddingEngine":
+        """Get the engine that embeds the store's chunks and queries."""
+        return self._embedding_function.engine
+
+    @property
+    def _collection(self) -> "Collection":
+        """Get the collection, creating or loading it on first use."""
+        with self._init_lock:
+            if self._chroma_collection is None:
+                self._chroma_collection = self._client.get_or_create_collection(
+                    name=self.COLLECTION_NAME,
+                    metadata={"hnsw_space": "cosine"},
+                    embedding_function=cast(Any, self._embedding_function),
+                )
+                logger.info(f"Created/loaded collection '{self.COLLECTION_NAME}'")
+            return self._chroma_collection
+
+    @_collection.setter
+    def _collection(self, collection: "Collection") -> None:
+        self._chroma_collection = collection
+
+    @property
+    def embedding_cache(self) -> EmbeddingCache | None:
+        """Get the persistent embedding cache, if the store uses one."""
+        with self._init_lock:
+            if self._embedding_cache is None and self._cache_dir is not None:
+                from nova.vector_store.embedding import EmbeddingEngine
+
+                self._embedding_cache = EmbeddingCache(self._cache_dir, EmbeddingEngine.MODEL_NAME)
+            return self._embedding_cache
 
     def add_chunk(self, chunk: Chunk, metadata: dict[str, Any] | None = None) -> None:
         """Add a chunk to the store.
@@ -175,7 +286,6 @@ class VectorStore:
         """
         logger.info(f"Adding chunk {chunk.chunk_id} to vector store")
         logger.debug(f"Chunk text length: {len(chunk.text)}")
-        logger.debug(f"Chunk metadata: {chunk.to_metadata()}")
 
         try:
             # Get metadata from chunk if not provided
@@ -187,11 +297,13 @@ class VectorStore:
             processed_metadata = self._prepare_metadata(metadata)
             logger.debug(f"Prepared metadata: {processed_metadata}")
 
-            # Add chunk directly to collection
+            # Upsert chunk directly to collection
             logger.info("Adding chunk to ChromaDB collection")
-            self._collection.add(
+            self._collection.upsert(
                 ids=[chunk.chunk_id], documents=[chunk.text], metadatas=[processed_metadata]
             )
+            self._stats.record([(chunk.chunk_id, chunk.text, processed_metadata)])
+            self._bump_generation()
             logger.info(f"Successfully added chunk {chunk.chunk_id} to collection")
 
             # Verify the chunk was added
@@ -202,9 +314,168 @@ class VectorStore:
             logger.error(f"Error adding chunk: {e}", exc_info=True)
             raise
 
+    def add_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_batch: Callable[[BatchTiming], None] | None = None,
+    ) -> list[BatchTiming]:
+        """Add chunks to the store in batches.
+
+        Chunks are upserted by ID. Chunks already stored with identical text
+        only have their metadata refreshed; the rest of each batch is
+        embedded with a single call to the embedding function and written
+        with a single ``collection.upsert``. A failing batch is logged and
+        reported in its timing entry; the remaining batches are still
+        processed.
+
+        Args:
+            chunks: Chunks to add, consumed lazily
+            batch_size: Maximum number of chunks per batch
+            on_batch: Optional callback invoked with each batch's timing
+
+        Returns:
+            List of per-batch timing information
+        """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}")
+        batch_size = min(batch_size, self._client.get_max_batch_size())
+
+        timings: list[BatchTiming] = []
+        iterator = iter(chunks)
+        batch_number = 0
+        while batch := list(islice(iterator, batch_size)):
+            batch_number += 1
+            timing: BatchTiming = {
+                "batch": batch_number,
+                "size": len(batch),
+                "skipped": 0,
+                "prepare_time": 0.0,
+                "embed_time": 0.0,
+                "insert_time": 0.0,
+                "total_time": 0.0,
+            }
+            start_time = time.perf_counter()
+            try:
+                # Duplicate IDs within a batch are rejected, keep the last one
+                unique = {chunk.chunk_id: chunk for chunk in batch}
+                ids = list(unique)
+                documents = [chunk.text for chunk in unique.values()]
+                metadatas = [
+                    self._prepare_metadata(chunk.to_metadata()) for chunk in unique.values()
+                ]
+
+                # Find chunks that are already stored with the same text
+                existing = self._collection.get(ids=ids, include=cast(Any, ["documents"]))
+                stored = dict(zip(existing["ids"], existing["documents"] or [], strict=False))
+                unchanged = [i for i, id_ in enumerate(ids) if stored.get(id_) == documents[i]]
+                unchanged_set = set(unchanged)
+                changed = [i for i in range(len(ids)) if i not in unchanged_set]
+                timing["skipped"] = len(unchanged)
+                prepared_time = time.perf_counter()
+                timing["prepare_time"] = prepared_time - start_time
+
+                embeddings = (
+                    self._embedding_function([documents[i] for i in changed]) if changed else []
+                )
+                embedded_time = time.perf_counter()
+                timing["embed_time"] = embedded_time - prepared_time
+
+                if changed:
+                    self._collection.upsert(
+                        ids=[ids[i] for i in changed],
+                        embeddings=cast(Any, embeddings),
+                        documents=[documents[i] for i in changed],
+                        metadatas=cast(Any, [metadatas[i] for i in changed]),
+                    )
+                if unchanged:
+                    self._collection.update(
+                        ids=[ids[i] for i in unchanged],
+                        metadatas=cast(Any, [metadatas[i] for i in unchanged]),
+                    )
+                timing["insert_time"] = time.perf_counter() - embedded_time
+                self._stats.record(zip(ids, documents, metadatas, strict=True))
+            except Exception as e:
+                timing["error"] = str(e)
+                logger.error(f"Error adding batch {batch_number}: {e}", exc_info=True)
+            # A failed batch may still have been partially written
+            self._bump_generation()
+
+            timing["total_time"] = time.perf_counter() - start_time
+            logger.info(
+                f"Batch {batch_number}: {timing['size']} chunks "
+                f"({timing['skipped']} unchanged) in {timing['total_time']:.2f}s "
+                f"(embed {timing['embed_time']:.2f}s, insert {timing['insert_time']:.2f}s)"
+            )
+            timings.append(timing)
+            if on_batch:
+                on_batch(timing)
+
+        return timings
+
+    def delete_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """Delete chunks from the store by ID.
+
+        Args:
+            chunk_ids: IDs of the chunks to delete; unknown IDs are ignored
+
+        Returns:
+            Number of chunk IDs submitted for deletion
+        """
+        ids = list(chunk_ids)
+        batch_size = self._client.get_max_batch_size()
+        for start in range(0, len(ids), batch_size):
+            self._collection.delete(ids=ids[start : start + batch_size])
+        self._stats.remove(ids)
+        if ids:
+            self._bump_generation()
+            logger.info(f"Deleted {len(ids)} chunks from vector store")
+        return len(ids)
+
+    def _rebuild_stats(self) -> None:
+        """Rebuild the statistics table from a scan of the whole collection."""
+        logger.info("Rebuilding vector store statistics from a full collection scan")
+        before = self._stats.repository_stats()
+        self._stats.clear()
+        batch_size = self._client.get_max_batch_size()
+        offset = 0
+        while True:
+            results = self._collection.get(
+                include=GET_INCLUDE_FIELDS, limit=batch_size, offset=offset
+            )
+            ids = results["ids"]
+            if not ids:
+                break
+            documents = results.get("documents") or [""] * len(ids)
+            metadatas = results.get("metadatas") or [{}] * len(ids)
+            self._stats.record(
+                (chunk_id, document, dict(metadata or {}))
+                for chunk_id, document, metadata in zip(ids, documents, metadatas, strict=True)
+            )
+            offset += len(ids)
+        if self._stats.repository_stats() != before:
+            logger.warning("Maintained vector store statistics were out of date and were rebuilt")
+
+    def _bump_generation(self) -> None:
+        """Mark the collection as changed, invalidating cached search results."""
+        with self._generation_lock:
+            self.generation += 1
+        self._search_results.clear()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get search cache statistics.
+
+        Returns:
+            Statistics for the query embedding and search result caches
+        """
+        return {
+            "generation": self.generation,
+            "query_embeddings": self._query_embeddings.stats(),
+            "results": self._search_results.stats(),
+        }
+
     def _prepare_metadata(self, metadata: dict[str, Any]) -> dict[str, Any]:
-        """Prepare metadata for ChromaDB by converting values to supported
-        types.
+        """Prepare metadata for ChromaDB by converting values to supported types.
 
         Args:
             metadata: Original metadata dictionary
@@ -252,56 +523,122 @@ class VectorStore:
                 metadata={"hnsw_space": "cosine"},
             )
             logger.info("Collection recreated")
+            self._stats.clear()
+            self._bump_generation()
+            self._query_embeddings.clear()
+
+            # Forget what was indexed so the next incremental run re-indexes everything
+            IndexManifest(self.base_path).clear()
 
         except Exception as e:
             logger.error(f"Error clearing vector store: {e}", exc_info=True)
             raise
 
-    def search(self, query: str, limit: int = 5) -> list[dict[str, Any]]:
+    def search(
+        self, query: str, limit: int = 5, where: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Search for chunks matching the query.
 
+        Repeated queries are answered from the result cache until the
+        collection changes, and query embeddings are kept in an LRU cache.
+
         Args:
             query: Search query
             limit: Maximum number of results to return
+            where: Optional ChromaDB metadata filter
 
         Returns:
             List of search results with scores and metadata
         """
-        try:
-            results = self._collection.query(
-                query_texts=[query],
-                n_results=limit,
-                include=QUERY_INCLUDE_FIELDS,
-            )
+        return self.search_many([query], limit=limit, where=where)[0]
+
+    def search_many(
+        self, queries: list[str], limit: int = 5, where: dict[str, Any] | None = None
+    ) -> list[list[dict[str, Any]]]:
+        """Search for chunks matching each of several queries.
 
-            search_results = []
-            documents = results.get("documents", [[]])
-            metadatas = results.get("metadatas", [[]])
-            distances = results.get("distances", [[]])
-
-            if documents and metadatas and distances and len(documents[0]) > 0:
-                for doc, metadata, distance in zip(
-                    documents[0], metadatas[0], distances[0], strict=False
-                ):
-                    # Convert distance to similarity score (0-100)
-                    score = round((1.0 - distance / 2.0) * 100, 2)
-                    search_results.append(
-                        {
-                            "text": doc,
-                            "metadata": metadata,
-                            "score": score,
-                        }
+        Queries that are not cached are embedded with a single call to the
+        embedding function and run as a single multi-query collection query.
+
+        Args:
+            queries: Search queries
+            limit: Maximum number of results to return per query
+            where: Optional ChromaDB metadata filter applied to every query
+
+        Returns:
+            List of search results with scores and metadata for each query
+        """
+        try:
+            filters = json.dumps(where, sort_keys=True) if where else None
+            generation = self.generation
+            found: dict[str, list[dict[str, Any]]] = {}
+            missing: list[str] = []
+            for query in dict.fromkeys(queries):
+                cached = self._search_results.get((generation, query, limit, filters))
+                if cached is not None:
+                    found[query] = cached
+                else:
+                    missing.append(query)
+
+            if missing:
+                embeddings = [self._query_embeddings.get(query) for query in missing]
+                to_embed = [q for q, e in zip(missing, embeddings, strict=True) if e is None]
+                if to_embed:
+                    embedded = dict(
+                        zip(to_embed, self._embedding_function.embed_queries(to_embed), strict=True)
                     )
+                    for query, embedding in embedded.items():
+                        self._query_embeddings.put(query, embedding)
+                    embeddings = [
+                        e if e is not None else embedded[q]
+                        for q, e in zip(missing, embeddings, strict=True)
+                    ]
+
+                results = self._collection.query(
+                    query_embeddings=cast(Any, embeddings),
+                    n_results=limit,
+                    where=where,
+                    include=QUERY_INCLUDE_FIELDS,
+                )
+                documents = results.get("documents") or []
+                metadatas = results.get("metadatas") or []
+                distances = results.get("distances") or []
+                for i, query in enumerate(missing):
+                    search_results = []
+                    if i < len(documents) and i < len(metadatas) and i < len(distances):
+                        for doc, metadata, distance in zip(
+                            documents[i], metadatas[i], distances[i], strict=False
+                        ):
+                            # Convert distance to similarity score (0-100)
+                            score = round((1.0 - distance / 2.0) * 100, 2)
+                            search_results.append(
+                                {
+                                    "text": doc,
+                                    "metadata": metadata,
+                                    "score": score,
+                                }
+                            )
+                    found[query] = search_results
+                    self._search_results.put((generation, query, limit, filters), search_results)
 
-            return search_results
+            # Callers own their results; the cached copies must stay untouched
+            return [copy.deepcopy(found[query]) for query in queries]
 
         except Exception as e:
             logger.error(f"Error searching: {e}")
             raise
 
-    def check_health(self) -> HealthData:
+    def check_health(self, full_scan: bool = False) -> HealthData:
         """Check vector store health and return detailed statistics.
 
+        Repository statistics are read from the incrementally maintained
+        statistics table. They are rebuilt from a scan of the collection
+        when ``full_scan`` is set or when their chunk count does not match
+        the collection's.
+
+        Args:
+            full_scan: Whether to verify the statistics against the collection
+
         Returns:
             Dictionary containing health status and detailed statistics
 
@@ -362,122 +699,25 @@ class VectorStore:
 
                 # Try to get our collection
                 try:
-                    collection = self._client.get_collection(name=self.COLLECTION_NAME)
+                    collection = self._collection
                     logger.info(f"Got collection: {self.COLLECTION_NAME}")
-
-                    # Get all documents and metadata
-                    logger.info("Getting documents and metadata")
-                    results = collection.get(include=GET_INCLUDE_FIELDS)
-                    logger.info(f"Got results: {results.keys() if results else None}")
-
-                    # Extract data safely
-                    if results and isinstance(results, dict):
-                        # Get raw data and cast to our type
-                        results_typed = cast(ChromaGetResult, results)
-                        documents = results_typed.get("documents", [])
-                        metadatas = results_typed.get("metadatas", [])
-                        count = len(documents) if documents else 0
-
-                        # Log the first metadata entry to understand structure
-                        if metadatas and len(metadatas) > 0:
-                            logger.info(f"First metadata entry: {metadatas[0]}")
-                            logger.info(f"Metadata type: {type(metadatas[0])}")
-                            logger.info(
-                                f"Available keys: {metadatas[0].keys() if isinstance(metadatas[0], dict) else 'Not a dict'}"
-                            )
-
-                        # Initialize tracking variables
-                        sources: set[str] = set()
-                        file_types: dict[str, int] = {}
-                        attachment_types: dict[str, int] = {}
-                        all_tags: set[str] = set()
-                        dates: list[str] = []
-                        doc_sizes: list[int] = []
-
-                        # Process each document and its metadata
-                        for i, metadata in enumerate(metadatas):
-                            # Cast metadata to our type
-                            nova_metadata = cast(NovaMetadata, metadata)
-
-                            # Track document size
-                            if documents and i < len(documents):
-                                doc_size = len(str(documents[i]))
-                                doc_sizes.append(doc_size)
-
-                            # Track document type from metadata
-                            doc_type = str(nova_metadata["document_type"])
-                            if doc_type:
-                                file_types[doc_type] = file_types.get(doc_type, 0) + 1
-
-                            # Track source from document_id
-                            doc_id = str(nova_metadata["document_id"])
-                            if doc_id:
-                                sources.add(doc_id)
-
-                            # Track tags
-                            tags_list = []
-                            total_tags = 0
-                            for meta in metadatas:
-                                if "tags" in meta:
-                                    tags_value = meta["tags"]
-                                    try:
-                                        if isinstance(tags_value, str):
-                                            chunk_tags = json.loads(str(tags_value))  # Cast to str
-                                            if isinstance(chunk_tags, list):
-                                                total_tags += len(chunk_tags)  # Count total tags
-                                                tags_list.extend(
-                                                    chunk_tags
-                                                )  # Add to list for unique count
-                                        elif isinstance(tags_value, list):
-                                            total_tags += len(tags_value)  # Count total tags
-                                            tags_list.extend(
-                                                tags_value
-                                            )  # Add to list for unique count
-                                    except json.JSONDecodeError:
-                                        logger.warning("Failed to parse tags JSON: %s", tags_value)
-
-                            unique_tags = list(set(tags_list))
-                            all_tags.update(unique_tags)
-
-                        logger.info(f"Found {count} documents")
-                        health_data["collection"]["exists"] = True
-                        health_data["collection"]["count"] = count
-
-                        # Process metadata if we have documents
-                        if count > 0 and metadatas:
-                            # Update repository stats
-                            repository_stats: RepositoryStats = {
-                                "total_chunks": count,
-                                "unique_sources": len(sources),
-                                "file_types": file_types,
-                                "total_attachments": sum(attachment_types.values()),
-                                "attachment_types": attachment_types,
-                                "date_range": {
-                                    "earliest": None,
-                                    "latest": None,
-                                },
-                                "tags": {
-                                    "total": total_tags,  # Total number of tags across all chunks
-                                    "unique": len(unique_tags),  # Number of unique tags
-                                    "list": unique_tags,  # List of unique tags
-                                },
-                                "size_stats": {
-                                    "min_size": min(doc_sizes) if doc_sizes else 0,
-                                    "max_size": max(doc_sizes) if doc_sizes else 0,
-                                    "avg_size": int(sum(doc_sizes) / len(doc_sizes))
-                                    if doc_sizes
-                                    else 0,
-                                    "total_size": sum(doc_sizes) if doc_sizes else 0,
-                                },
-                            }
-                            health_data["repository"] = repository_stats
-
-                            # Log findings
-                            logger.info(f"Found sources: {sources}")
-                            logger.info(f"Found file types: {file_types}")
-                            logger.info(f"Found tags: {all_tags}")
-                        else:
-                            logger.warning("No metadata found in results")
+                    count = collection.count()
+
+                    # Statistics are maintained on every write; rebuild them if they
+                    # were never built for this store or have drifted from it
+                    if full_scan or self._stats.count() != count:
+                        self._rebuild_stats()
+
+                    logger.info(f"Found {count} documents")
+                    health_data["collection"]["exists"] = True
+                    health_data["collection"]["count"] = count
+
+                    if count > 0:
+                        health_data["repository"] = cast(
+                            RepositoryStats, self._stats.repository_stats()
+                        )
+                    else:
+                        logger.warning("No metadata found in results")
 
                 except Exception as e:
                     health_data["status"] = "error"
@@ -0,0 +1,262 @@
+"""Chunking sized by the embedding model's tokenizer.
+
+``ChunkingEngine`` limits chunks by characters, which only loosely tracks
+what the embedding model sees: some chunks exceed the model's maximum
+sequence length and are silently truncated, while others fill a fraction
+of it. ``TokenChunkingEngine`` keeps the same section structure but splits
+each section into windows of at most the model's token limit, packed as
+close to it as sentence, line and word boundaries allow.
+"""
+
+import logging
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .chunking import Chunk, ChunkingEngine, _ChunkIdAssigner, _ChunkText, _Piece
+
+logger = logging.getLogger(__name__)
+
+_SENTENCE_END = frozenset(".!?")
+
+
+class TokenCounter:
+    """Counts tokens with a Hugging Face fast tokenizer."""
+
+    def __init__(self, tokenizer: Any, max_tokens: int) -> None:
+        """Initialize the counter.
+
+        Args:
+            tokenizer: Fast tokenizer that can return offset mappings
+            max_tokens: Maximum number of tokens the model embeds, excluding
+                special tokens
+        """
+        if max_tokens < 1:
+            raise ValueError(f"Token limit must be positive, got {max_tokens}")
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+
+    @classmethod
+    def from_model(cls, model: Any) -> "TokenCounter":
+        """Create a counter for a sentence transformer.
+
+        Args:
+            model: Sentence transformer whose tokenizer and sequence length to use
+
+        Returns:
+            Token counter
+        """
+        tokenizer = model.tokenizer
+        return cls(tokenizer, model.max_seq_length - tokenizer.num_special_tokens_to_add())
+
+    def offsets(self, text: str) -> list[tuple[int, int]]:
+        """Tokenize text.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Start and end offsets of each token in the text
+        """
+        encoding = self.tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True, verbose=False
+        )
+        return [tuple(offset) for offset in encoding["offset_mapping"]]
+
+    def count(self, texts: Sequence[str]) -> list[int]:
+        """Count the tokens of several texts.
+
+        Args:
+            texts: Texts to count
+
+        Returns:
+            Number of tokens of each text, excluding special tokens
+        """
+        if not texts:
+            return []
+        encoding = self.tokenizer(list(texts), add_special_tokens=False, verbose=False)
+        return [len(ids) for ids in encoding["input_ids"]]
+
+
+@dataclass
+class TokenStats:
+    """How well chunks fit the embedding model's token limit."""
+
+    chunks: int
+    tokens: int
+    truncated: int
+    """Chunks longer than the limit, whose tail the model ignores."""
+    truncated_tokens: int
+    fill_ratio: float
+    """Mean share of the limit used by each chunk, counting truncated chunks as full."""
+
+    @classmethod
+    def measure(cls, chunks: Iterable[Chunk], counter: TokenCounter) -> "TokenStats":
+        """Measure chunks against a token limit.
+
+        Args:
+            chunks: Chunks to measure
+            counter: Counter of the embedding model's tokens
+
+        Returns:
+            Token statistics of the chunks
+        """
+        counts = counter.count([chunk.text for chunk in chunks])
+        limit = counter.max_tokens
+        truncated = [count - limit for count in counts if count > limit]
+        fill = sum(min(count, limit) for count in counts) / (limit * len(counts)) if counts else 0.0
+        return cls(
+            chunks=len(counts),
+            tokens=sum(counts),
+            truncated=len(truncated),
+            truncated_tokens=sum(truncated),
+            fill_ratio=fill,
+        )
+
+    @classmethod
+    def combine(cls, stats: Iterable["TokenStats"]) -> "TokenStats":
+        """Combine the statistics of several sets of chunks.
+
+        Args:
+            stats: Statistics to combine
+
+        Returns:
+            Token statistics of all the chunks
+        """
+        stats = list(stats)
+        chunks = sum(s.chunks for s in stats)
+        fill = sum(s.fill_ratio * s.chunks for s in stats) / chunks if chunks else 0.0
+        return cls(
+            chunks=chunks,
+            tokens=sum(s.tokens for s in stats),
+            truncated=sum(s.truncated for s in stats),
+            truncated_tokens=sum(s.truncated_tokens for s in stats),
+            fill_ratio=fill,
+        )
+
+    def __str__(self) -> str:
+        """Format the statistics as a summary line."""
+        return (
+            f"{self.chunks} chunks, {self.tokens} tokens, {self.fill_ratio:.0%} filled, "
+            f"{self.truncated} truncated ({self.truncated_tokens} tokens lost)"
+        )
+
+
+class TokenChunkingEngine(ChunkingEngine):
+    """Chunks documents into windows of the embedding model's tokens.
+
+    Sections are found as by ``ChunkingEngine``, so headings, tags and chunk
+    IDs work the same way, but sections are only split when they exceed the
+    token limit. Windows end at the last sentence end, line break or word
+    boundary in their second half, and may overlap the previous window.
+
+    Each chunk belongs to a single section, so adjacent short sections are
+    not packed together and their chunks may use little of the limit.
+    """
+
+    def __init__(self, counter: TokenCounter, overlap: int = 0) -> None:
+        """Initialize the chunking engine.
+
+        Args:
+            counter: Counter of the embedding model's tokens
+            overlap: Number of tokens each window repeats from the previous one
+                of the same section
+        """
+        if not 0 <= overlap < counter.max_tokens // 2:
+            raise ValueError(
+                f"Overlap must be at least 0 and less than half of {counter.max_tokens} tokens, "
+                f"got {overlap}"
+            )
+        # Sections are only split by tokens, never by characters
+        super().__init__(min_chunk_size=0, max_chunk_size=sys.maxsize)
+        self.counter = counter
+        self.max_tokens = counter.max_tokens
+        self.overlap = overlap
+
+    def _emit_chunks(
+        self,
+        text: str,
+        pieces: list[_Piece],
+        heading: str,
+        level: int,
+        source: Path | None,
+        id_assigner: _ChunkIdAssigner,
+        chunks: list[Chunk],
+    ) -> None:
+        """Create chunks from the pieces of a section, splitting it by tokens."""
+        chunk_text = _ChunkText(text, pieces)
+        content = chunk_text.text
+        for start, end in self._token_windows(content):
+            sub_text = content[start:end]
+            chunks.append(
+                self._create_chunk(
+                    sub_text,
+                    heading,
+                    level,
+                    id_assigner.next_id(heading, level, sub_text),
+                    source,
+                    *chunk_text.span(start, end),
+                )
+            )
+
+    def _token_windows(self, text: str) -> list[tuple[int, int]]:
+        """Split text into windows of at most the token limit.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            Start and end offsets of each window in the text
+        """
+        offsets = self.counter.offsets(text)
+        if len(offsets) <= self.max_tokens:
+            return [(0, len(text))] if offsets else []
+
+        windows: list[tuple[int, int]] = []
+        first = 0
+        while True:
+            last = first + self.max_tokens
+            if last >= len(offsets):
+                windows.append((offsets[first][0], offsets[-1][1]))
+                return windows
+            last = self._boundary(text, offsets, first, last)
+            windows.append((offsets[first][0], offsets[last - 1][1]))
+            if not self.overlap:
+                first = last
+                continue
+            # Start the overlap at a word, but always make progress
+            next_first = last - self.overlap
+            while next_first > first + 1 and not self._starts_word(offsets, next_first):
+                next_first -= 1
+            first = max(next_first, first + 1)
+
+    def _boundary(self, text: str, offsets: list[tuple[int, int]], first: int, last: int) -> int:
+        """Find where to end a window of tokens.
+
+        Args:
+            text: Text being split
+            offsets: Token offsets of the text
+            first: Index of the window's first token
+            last: Index of the token after the longest possible window
+
+        Returns:
+            Index of the token after the window
+        """
+        lowest = first + max(1, (last - first) // 2)
+        word_boundary = None
+        for index in range(last, lowest - 1, -1):
+            if not self._starts_word(offsets, index):
+                continue
+            gap = text[offsets[index - 1][1] : offsets[index][0]]
+            if "\n" in gap or text[offsets[index - 1][1] - 1] in _SENTENCE_END:
+                return index
+            if word_boundary is None:
+                word_boundary = index
+        return word_boundary or last
+
+    @staticmethod
+    def _starts_word(offsets: list[tuple[int, int]], index: int) -> bool:
+        """Check whether whitespace precedes a token, so text can be cut before it."""
+        return offsets[index][0] > offsets[index - 1][1]
@@ -1,13 +1,16 @@
 """Tests for Bear note processing."""
 
+import os
 from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from nova.bear_parser.parser import BearDocument
+from nova.bear_parser.parser import BearDocument, BearNote
 from nova.bear_parser.processing import BearNoteProcessing
+from nova.bear_parser.sync import ExportSync
 
 
 @pytest.fixture
@@ -142,3 +145,85 @@ def test_process_bear_notes_permission_error(test_dir: Path, tmp_path: Path) ->
     finally:
         # Restore permissions for cleanup
         output_dir.chmod(0o755)
+
+
+def test_iter_notes_skips_documents(test_dir: Path, tmp_path: Path) -> None:
+    """Test that the indexing fast path yields notes without building documents."""
+    output_dir = tmp_path / "output"
+    processor = BearNoteProcessing(input_dir=test_dir, output_dir=output_dir)
+    with patch.object(BearNote, "to_docling", side_effect=AssertionError("not needed")):
+        notes = list(processor.iter_notes())
+
+    assert all(isinstance(note, BearNote) for note in notes)
+    assert {note.source_path.name for note in notes if note.source_path} == {
+        "20240101 - Note 1.txt",
+        "20240102 - Note 2.md",
+        "Note 3.md",
+    }
+    assert not output_dir.exists()
+
+
+def test_output_sync_is_incremental(test_dir: Path, tmp_path: Path) -> None:
+    """Test that reprocessing only transfers changed files and removes deleted ones."""
+    output_dir = tmp_path / "output"
+    processor = BearNoteProcessing(input_dir=test_dir, output_dir=output_dir)
+    processor.process_bear_notes()
+    assert processor.sync_stats is not None
+    assert processor.sync_stats.skipped == 0
+    assert processor.sync_stats.copied + processor.sync_stats.linked == 4
+
+    # Files outside the synced set are never touched
+    (output_dir / "unrelated.json").write_text("{}")
+    (test_dir / "20240101 - Note 1.txt").write_text("Note 1 changed content #tag1")
+    (test_dir / "Note 3" / "test.jpg").unlink()
+    (test_dir / "Note 3" / "other.png").write_text("new image")
+
+    processor = BearNoteProcessing(input_dir=test_dir, output_dir=output_dir)
+    processor.process_bear_notes()
+    stats = processor.sync_stats
+    assert stats is not None
+    assert (stats.copied + stats.linked, stats.skipped, stats.removed) == (2, 2, 1)
+    assert stats.bytes_skipped > 0
+    assert (output_dir / "20240101 - Note 1.txt").read_text() == "Note 1 changed content #tag1"
+    assert (output_dir / "Note 3" / "other.png").exists()
+    assert not (output_dir / "Note 3" / "test.jpg").exists()
+    assert (output_dir / "unrelated.json").exists()
+
+
+def test_output_sync_checksum(test_dir: Path, tmp_path: Path) -> None:
+    """Test that checksum mode detects content changes that keep size and mtime."""
+    output_dir = tmp_path / "output"
+    note = test_dir / "20240101 - Note 1.txt"
+    BearNoteProcessing(
+        input_dir=test_dir, output_dir=output_dir, checksum=True
+    )._copy_files_to_output()
+
+    # Replace the note (breaking any hardlink) with same-size content and mtime
+    stat = note.stat()
+    note.unlink()
+    note.write_text("Note 1 content #tagX")
+    os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    plain = BearNoteProcessing(input_dir=test_dir, output_dir=output_dir)
+    plain._copy_files_to_output()
+    assert plain.sync_stats is not None and plain.sync_stats.skipped == 4
+
+    checked = BearNoteProcessing(input_dir=test_dir, output_dir=output_dir, checksum=True)
+    checked._copy_files_to_output()
+    assert checked.sync_stats is not None and checked.sync_stats.skipped == 3
+    assert (output_dir / note.name).read_text() == "Note 1 content #tagX"
+
+
+def test_output_sync_copies_by_default(test_dir: Path, tmp_path: Path) -> None:
+    """Test that synced files do not share inodes with the export unless hardlinks are enabled."""
+    source = test_dir / "20240101 - Note 1.txt"
+    copied = ExportSync(test_dir, tmp_path / "copied").sync([source])
+    assert (copied.copied, copied.linked) == (1, 0)
+    target = tmp_path / "copied" / source.name
+    assert not os.path.samefile(source, target)
+    assert target.read_text() == source.read_text()
+    assert target.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+    linked = ExportSync(test_dir, tmp_path / "linked", hardlinks=True).sync([source])
+    assert linked.linked == 1
+    assert os.path.samefile(source, tmp_path / "linked" / source.name)
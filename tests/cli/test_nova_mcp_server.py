@@ -0,0 +1,34 @@
+"""Tests for the Nova MCP server."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from nova.cli.commands import nova_mcp_server
+from nova.vector_store.executor import BoundedExecutor
+
+
+def test_search_backpressure(test_client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that searches are rejected with 429 when the worker pool is full."""
+    pool = BoundedExecutor(max_workers=1, max_queue=0)
+    monkeypatch.setattr(nova_mcp_server, "search_pool", pool)
+    monkeypatch.setattr(nova_mcp_server.search_batcher, "executor", pool)
+    release = threading.Event()
+    try:
+        pool.submit(release.wait)
+        response = test_client.post("/search", json={"query": "notes"})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_health_reports_worker_pools(test_client: TestClient) -> None:
+    """Test that the health check runs in the pool and reports pool stats."""
+    response = test_client.get("/health")
+
+    assert response.status_code == 200
+    assert set(response.json()["workers"]) == {"search", "health"}
@@ -0,0 +1,25 @@
+"""Tests for CLI startup cost."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_cli_import_does_not_load_heavy_dependencies(tmp_path: Path) -> None:
+    """Test that building the CLI does not import chromadb or the embedding model."""
+    code = (
+        "import sys\n"
+        "import nova.cli.main\n"
+        "from nova.vector_store.store import VectorStore\n"
+        "VectorStore(sys.argv[1])\n"
+        "heavy = [m for m in ('chromadb', 'sentence_transformers', 'torch') if m in sys.modules]\n"
+        "print(','.join(heavy))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, "vectors"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+    )
+    assert result.stdout.strip() == ""
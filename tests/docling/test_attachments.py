@@ -0,0 +1,95 @@
+"""Tests for parallel attachment conversion."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from nova.docling.attachments import (
+    AttachmentConverter,
+    ConversionCache,
+    find_attachments,
+    markdown_output_paths,
+)
+
+
+@pytest.fixture
+def export_dir(tmp_path: Path) -> Path:
+    """Create a Bear export with attachment directories."""
+    export = tmp_path / "export"
+    attachments = export / "Note 1"
+    attachments.mkdir(parents=True)
+    (export / "Note 1.md").write_text("# Note 1\n![](Note 1/red.png)")
+    Image.new("RGB", (10, 20), color="red").save(attachments / "red.png")
+    (attachments / "page.html").write_text("<html><head><title>Page</title></head></html>")
+    (attachments / "data.json").write_text('{"a": 1}')
+    (attachments / "broken.svg").write_text("<svg")
+    (attachments / "archive.zip").write_bytes(b"PK")
+    return export
+
+
+def test_find_attachments(export_dir: Path) -> None:
+    """Test that only convertible files in attachment directories are listed."""
+    names = [path.name for path in find_attachments(export_dir)]
+    assert names == ["broken.svg", "data.json", "page.html", "red.png"]
+
+
+def test_markdown_output_paths(tmp_path: Path) -> None:
+    """Test that conversions replace the suffix without overwriting each other."""
+    export, output = tmp_path / "export", tmp_path / "output"
+    names = ["notes.md", "page.html", "scan.PNG", "scan.pdf", "scan.pdf.md", "readme.markdown"]
+    files = [export / "Note 1" / name for name in sorted(names)]
+
+    paths = markdown_output_paths(files, export, output)
+    assert {path.name: out.relative_to(output).as_posix() for path, out in paths.items()} == {
+        "notes.md": "Note 1/notes.md",
+        "page.html": "Note 1/page.md",
+        "readme.markdown": "Note 1/readme.md",
+        "scan.PNG": "Note 1/scan.md",
+        "scan.pdf": "Note 1/scan.pdf.md",
+        "scan.pdf.md": "Note 1/scan.pdf.md.md",
+    }
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_parallel_conversion_matches_serial(export_dir: Path, use_processes: bool) -> None:
+    """Test that pooled conversion returns the serial results in order."""
+    files = [path for path in find_attachments(export_dir) if path.suffix != ".html"]
+    serial = list(AttachmentConverter(workers=1).convert_many(files))
+    parallel = list(AttachmentConverter(workers=2, use_processes=use_processes).convert_many(files))
+
+    assert [result.path for result in parallel] == files
+    assert [result.error is None for result in parallel] == [False, True, True]
+    assert [r.document.content for r in parallel if r.document] == [
+        r.document.content for r in serial if r.document
+    ]
+
+
+def test_cached_conversions_are_reused(export_dir: Path, tmp_path: Path) -> None:
+    """Test that unchanged attachments are served from the cache."""
+    image = export_dir / "Note 1" / "red.png"
+    data = export_dir / "Note 1" / "data.json"
+    cache = ConversionCache(tmp_path / "cache")
+
+    first = list(AttachmentConverter(workers=1, cache=cache).convert_many([image, data]))
+    assert not any(result.cached for result in first)
+    assert len(cache) == 2
+
+    with patch("nova.docling.attachments._convert_in_worker") as convert:
+        converter = AttachmentConverter(workers=1, cache=ConversionCache(tmp_path / "cache"))
+        second = list(converter.convert_many([image, data]))
+    convert.assert_not_called()
+    assert all(result.cached for result in second)
+    assert [r.document.content for r in second if r.document] == [
+        r.document.content for r in first if r.document
+    ]
+    assert second[1].document is not None
+    assert second[1].document.metadata["modified"] == first[1].document.metadata["modified"]
+
+    # Changed content is converted again
+    data.write_text('{"a": 2}')
+    converter = AttachmentConverter(workers=1, cache=cache)
+    third = list(converter.convert_many([image, data]))
+    assert [result.cached for result in third] == [True, False]
+    assert converter.get_stats() == {"converted": 1, "cached": 1, "failed": 0}
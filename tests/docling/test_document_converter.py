@@ -7,9 +7,10 @@ from pathlib import Path
 import piexif
 import piexif.helper
 import pytest
-from PIL import Image, PngImagePlugin
+from PIL import Image, ImageFile, PngImagePlugin
 
 from nova.docling.document_converter import (
+    DocumentConversionError,
     DocumentConverter,
 )
 
@@ -149,3 +150,68 @@ def test_svg_path_handling(test_files: Path) -> None:
     element_counts = json.loads(doc.metadata["element_counts"])
     assert element_counts["rect"] == 1
     assert element_counts["circle"] == 1
+
+
+def test_image_pixels_are_not_decoded(test_files: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that image metadata comes from headers alone."""
+
+    def fail_load(*args: object) -> None:
+        raise AssertionError("pixel data was decoded")
+
+    monkeypatch.setattr(ImageFile.ImageFile, "load", fail_load)
+    converter = DocumentConverter()
+
+    doc = converter.convert(test_files / "test.png")
+    assert doc.metadata["size"] == "100x100"
+    assert doc.metadata["png_comment"] == "Test comment"
+
+    doc = converter.convert(test_files / "test.jpg")
+    assert doc.metadata["size"] == "100x100"
+    assert "exif_Make" in doc.metadata
+
+
+def test_conversion_limits(test_files: Path) -> None:
+    """Test that files and images above the limits are rejected before being read."""
+    png_file = test_files / "test.png"
+    size = png_file.stat().st_size
+    assert DocumentConverter(max_file_size=size).convert(png_file)
+    with pytest.raises(DocumentConversionError, match="larger than the limit"):
+        DocumentConverter(max_file_size=size - 1).convert(png_file)
+
+    # The test image is 100x100
+    assert DocumentConverter(max_image_pixels=10000).convert(png_file)
+    with pytest.raises(DocumentConversionError, match="more than the limit"):
+        DocumentConverter(max_image_pixels=9999).convert(png_file)
+
+
+HTML_CLIP = """<!DOCTYPE html>
+<html>
+<head>
+<title>Clip &amp; Notes</title>
+<meta name="author" content="Jane Doe">
+<meta name="og:site_name" content="Example" />
+</head>
+<body>
+<h1>Heading</h1>
+<p>Some <strong>bold</strong> text with a <a href="https://example.com">link</a>.</p>
+<ul><li>First</li><li>Second</li></ul>
+</body>
+</html>
+"""
+
+
+def test_html_conversion_in_process(tmp_path: Path) -> None:
+    """Test converting HTML without pandoc, collecting metadata in the same pass."""
+    html_file = tmp_path / "clip.html"
+    html_file.write_text(HTML_CLIP)
+
+    doc = DocumentConverter().convert(html_file)
+
+    assert doc.metadata["title"] == "Clip & Notes"
+    assert doc.metadata["author"] == "Jane Doe"
+    assert doc.metadata["site_name"] == "Example"
+    assert "# Heading" in doc.content
+    assert "**bold**" in doc.content
+    assert "[link](https://example.com)" in doc.content
+    assert "First" in doc.content and "Second" in doc.content
+    assert "Clip" not in doc.content
@@ -0,0 +1,46 @@
+"""Tests for sampled encoding detection."""
+
+from pathlib import Path
+
+from nova.docling.encoding import decode_bytes, read_text
+
+
+def test_utf8_fast_path() -> None:
+    """Test that UTF-8 is decoded without running detection."""
+    decoded = decode_bytes("Café ☕\n".encode())
+    assert decoded.text == "Café ☕\n"
+    assert decoded.encoding == "utf-8"
+    assert decoded.detection_time >= 0
+
+
+def test_bom_is_honored() -> None:
+    """Test that byte order marks select the encoding and are stripped."""
+    assert decode_bytes("﻿note".encode()).encoding == "utf-8-sig"
+    assert decode_bytes("﻿note".encode()).text == "note"
+
+    decoded = decode_bytes("note ☕".encode("utf-16"))
+    assert decoded.encoding == "utf-16"
+    assert decoded.text == "note ☕"
+
+
+def test_non_utf8_is_detected_from_sample() -> None:
+    """Test that non-UTF-8 text is decoded from a sample of its prefix."""
+    raw = ("Élève à la café, très naïve.\n" * 200).encode("latin-1")
+    decoded = decode_bytes(raw, sample_size=256)
+    assert decoded.encoding != "utf-8"
+    assert decoded.text == raw.decode(decoded.encoding)
+
+
+def test_falls_back_when_sample_is_misleading() -> None:
+    """Test that bytes past the sample cannot make decoding fail."""
+    raw = b"plain ascii\n" * 100 + "éè".encode("latin-1")
+    decoded = decode_bytes(raw, sample_size=64)
+    assert decoded.text.endswith("éè")
+
+
+def test_read_text(tmp_path: Path) -> None:
+    """Test reading a file once and decoding it."""
+    path = tmp_path / "note.txt"
+    text = "Grüße aus München, schöne Straße.\n" * 50
+    path.write_bytes(text.encode("cp1252"))
+    assert read_text(path).text == text
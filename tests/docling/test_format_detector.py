@@ -0,0 +1,88 @@
+"""Tests for cached format detection."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from nova.docling import FormatDetector, InputFormat
+
+
+@pytest.fixture
+def attachments(tmp_path: Path) -> Path:
+    """Create an attachment tree with known and unknown extensions."""
+    (tmp_path / "note").mkdir()
+    (tmp_path / "note" / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    (tmp_path / "note" / "readme").write_text("plain text")
+    (tmp_path / "note" / "data.bin").write_text("more text")
+    return tmp_path
+
+
+def _count_sniffs(detector: FormatDetector, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record the files the detector sniffs with libmagic."""
+    sniffed: list[Path] = []
+    sniff = detector._sniff_format
+
+    def counting_sniff(file_path: Path) -> InputFormat | None:
+        sniffed.append(file_path)
+        return sniff(file_path)
+
+    monkeypatch.setattr(detector, "_sniff_format", counting_sniff)
+    return sniffed
+
+
+def test_trusted_extension_skips_libmagic(
+    attachments: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that known extensions are detected without reading the file."""
+    detector = FormatDetector(trust_extensions=True)
+    sniffed = _count_sniffs(detector, monkeypatch)
+
+    assert detector.detect_format(attachments / "note" / "image.png") == InputFormat.PNG
+    assert sniffed == []
+
+
+def test_content_is_sniffed_by_default(attachments: Path) -> None:
+    """Test that a misleading extension is only trusted when asked to."""
+    misnamed = attachments / "note" / "scan.txt"
+    misnamed.write_bytes(b"%PDF-1.4\n%%EOF\n")
+
+    assert FormatDetector().detect_format(misnamed) == InputFormat.PDF
+    assert FormatDetector(trust_extensions=True).detect_format(misnamed) == InputFormat.TEXT
+
+
+def test_cache_is_keyed_by_stat(attachments: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that unchanged files are not sniffed again."""
+    detector = FormatDetector()
+    sniffed = _count_sniffs(detector, monkeypatch)
+    readme = attachments / "note" / "readme"
+
+    assert detector.detect_format(readme) == InputFormat.TEXT
+    assert detector.detect_format(readme) == InputFormat.TEXT
+    assert sniffed == [readme]
+
+    readme.write_text("changed text")
+    os.utime(readme, ns=(0, 0))
+    detector.detect_format(readme)
+    assert sniffed == [readme, readme]
+
+
+def test_detect_directory_persists_cache(
+    attachments: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a rescan of an unchanged tree with a saved cache sniffs nothing."""
+    cache_path = tmp_path / "formats.json"
+    detector = FormatDetector(cache_path=cache_path)
+    formats = detector.detect_directory(attachments / "note", workers=2)
+    detector.save_cache()
+
+    assert formats == {
+        attachments / "note" / "data.bin": InputFormat.TEXT,
+        attachments / "note" / "image.png": InputFormat.PNG,
+        attachments / "note" / "readme": InputFormat.TEXT,
+    }
+
+    detector = FormatDetector(cache_path=cache_path)
+    sniffed = _count_sniffs(detector, monkeypatch)
+    assert detector.detect_directory(attachments / "note") == formats
+    assert sniffed == []
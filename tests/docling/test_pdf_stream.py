@@ -0,0 +1,107 @@
+"""Tests for page-streaming PDF conversion."""
+
+from pathlib import Path
+
+import pytest
+
+from nova.docling.document_converter import DocumentConverter
+from nova.docling.pdf_stream import PdfPageStream, PdfStreamOptions
+from nova.vector_store.chunking import ChunkingEngine
+
+
+def _write_pdf(path: Path, page_texts: list[str]) -> Path:
+    """Write a minimal PDF with one line of text per page."""
+    page_count = len(page_texts)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(f"{3 + 2 * i} 0 R".encode() for i in range(page_count))
+        + f"] /Count {page_count} >>".encode(),
+    ]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>".encode()
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    data += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode()
+    data += f"startxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(data)
+    return path
+
+
+@pytest.fixture
+def pdf_file(tmp_path: Path) -> Path:
+    """Create a five page PDF."""
+    return _write_pdf(tmp_path / "manual.pdf", [f"Page {i} text" for i in range(1, 6)])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_stream_yields_pages_in_order(pdf_file: Path, workers: int) -> None:
+    """Test that serial and parallel streams yield the same pages in order."""
+    stream = PdfPageStream(pdf_file, PdfStreamOptions(workers=workers, pages_per_task=2))
+    pages = list(stream)
+
+    assert [page.number for page in pages] == [1, 2, 3, 4, 5]
+    assert [page.text for page in pages] == [f"Page {i} text" for i in range(1, 6)]
+    assert stream.page_count == 5
+    assert stream.truncated is None
+
+
+def test_convert_matches_streamed_pages(pdf_file: Path) -> None:
+    """Test that the converted document is the concatenation of the pages."""
+    document = DocumentConverter().convert(pdf_file)
+    pages = list(DocumentConverter().stream_pdf(pdf_file))
+
+    assert document.content == "\n".join(page.markdown for page in pages)
+    assert document.content.startswith("\n## Page 1\n\nPage 1 text")
+    assert document.metadata["pages"] == "5"
+    assert document.metadata["page_5_dimensions"] == "612.00x792.00"
+    assert "truncated" not in document.metadata
+
+
+def test_page_and_byte_caps(pdf_file: Path) -> None:
+    """Test that extraction stops at the page and byte caps."""
+    stream = PdfPageStream(pdf_file, PdfStreamOptions(max_pages=2))
+    assert [page.number for page in stream] == [1, 2]
+    assert stream.truncated == "max_pages"
+
+    page_size = len(next(iter(PdfPageStream(pdf_file))).markdown.encode())
+    stream = PdfPageStream(pdf_file, PdfStreamOptions(workers=2, max_bytes=3 * page_size))
+    assert [page.number for page in stream] == [1, 2, 3]
+    assert stream.truncated == "max_bytes"
+
+    document = DocumentConverter(PdfStreamOptions(max_pages=1)).convert(pdf_file)
+    assert document.metadata["truncated"] == "max_pages"
+    assert document.metadata["pages_extracted"] == "1"
+    assert "Page 2" not in document.content
+
+
+def test_timeout(pdf_file: Path) -> None:
+    """Test that an expired deadline stops extraction."""
+    stream = PdfPageStream(pdf_file, PdfStreamOptions(timeout=0))
+    assert list(stream) == []
+    assert stream.truncated == "timeout"
+
+
+def test_chunk_pages_matches_chunk_document(pdf_file: Path) -> None:
+    """Test that chunking streamed pages matches chunking the whole document."""
+    engine = ChunkingEngine()
+    document = DocumentConverter().convert(pdf_file)
+    pages = (page.markdown for page in DocumentConverter().stream_pdf(pdf_file))
+
+    streamed = [(c.chunk_id, c.text) for c in engine.chunk_pages(pages, pdf_file)]
+    whole = [(c.chunk_id, c.text) for c in engine.chunk_document(document.content, pdf_file)]
+    assert streamed == whole
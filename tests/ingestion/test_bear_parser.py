@@ -161,3 +161,27 @@ def test_process_multiple_notes(note_dir: Path) -> None:
         assert doc.name == note.title
         assert doc.content == note.content
         assert doc.tags == note.tags
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_parallel_parse_matches_serial(note_dir: Path, use_processes: bool) -> None:
+    """Test that parallel parsing keeps file order and skips unreadable notes."""
+    for i in range(30):
+        (note_dir / f"note_{i:02d}.md").write_text(f"Note {i} #tag{i}")
+    (note_dir / "broken.txt").write_bytes(b"\xff\xfe invalid utf-8 \x80")
+
+    serial = BearParser(note_dir)
+    serial.parse_directory()
+    parallel = BearParser(note_dir, workers=3, use_processes=use_processes)
+    parallel.parse_directory()
+
+    assert len(parallel._notes) == 30
+    assert [n.title for n in parallel._notes] == [n.title for n in serial._notes]
+    assert [n.tags for n in parallel._notes] == [n.tags for n in serial._notes]
+    assert parallel._notes[0].source_path == note_dir / "note_00.md"
+
+
+def test_invalid_worker_count(note_dir: Path) -> None:
+    """Test that a non-positive worker count is rejected."""
+    with pytest.raises(ValueError):
+        BearParser(note_dir, workers=0)
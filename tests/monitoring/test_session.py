@@ -158,3 +158,11 @@ def test_get_rebuild_stats_completed(session_monitor):
     assert stats["performance"]["chunks_per_second"] > 0
     assert stats["performance"]["peak_memory_mb"] == 100.0  # From mock process
     assert stats["errors"]["count"] == 0
+
+
+def test_get_stats_includes_search_cache(session_monitor):
+    """Test that search cache statistics are reported."""
+    session_monitor.vector_store = MagicMock()
+    session_monitor.vector_store.get_cache_stats.return_value = {"generation": 3}
+
+    assert session_monitor.get_stats()["search_cache"] == {"generation": 3}
@@ -1,6 +1,7 @@
 """Performance test configuration and fixtures."""
 
 import os
+import random
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
@@ -13,6 +14,11 @@ T = TypeVar("T")
 SyncF = TypeVar("SyncF", bound=Callable[..., Any])
 AsyncF = TypeVar("AsyncF", bound=Callable[..., Awaitable[Any]])
 
+NOTE_WORDS = "the quick brown fox jumps over lazy dog meeting project plan #work #idea/next".split()
+
+# Benchmark reports of the session, as (title, rows) pairs
+_REPORTS = pytest.StashKey[list[tuple[str, dict[str, str]]]]()
+
 
 @dataclass
 class BenchmarkResult:
@@ -44,6 +50,7 @@ class BenchmarkableFunction(Protocol):
     """Protocol for functions that can be benchmarked."""
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the function being benchmarked."""
         ...
 
 
@@ -175,3 +182,102 @@ def benchmark_fixture(request: pytest.FixtureRequest) -> None:
         print(f"  Average time: {avg_time:.4f}s")
         print(f"  Min time: {min_time:.4f}s")
         print(f"  Max time: {max_time:.4f}s")
+
+
+def _generate_notes(
+    count: int,
+    sections: int | tuple[int, int] = 10,
+    paragraphs: tuple[int, int] = (1, 5),
+    words: tuple[int, int] = (5, 60),
+    heading_levels: tuple[int, int] = (2, 2),
+    attachment_rate: float = 0.0,
+    vocabulary: list[str] = NOTE_WORDS,
+    seed: int = 0,
+) -> list[str]:
+    """Generate reproducible markdown notes with headings and paragraphs.
+
+    Args:
+        count: Number of notes
+        sections: Number of sections per note, or the range to draw it from
+        paragraphs: Range of the number of paragraphs per section
+        words: Range of the number of words per paragraph
+        heading_levels: Range of the heading level of each section
+        attachment_rate: Probability that a section ends with an image attachment
+        vocabulary: Words to draw paragraphs from
+        seed: Random seed
+
+    Returns:
+        Markdown text of each note
+    """
+    rng = random.Random(seed)
+    low, high = (sections, sections) if isinstance(sections, int) else sections
+    notes = []
+    for i in range(count):
+        lines = []
+        for section in range(rng.randint(low, high)):
+            lines.append(f"{'#' * rng.randint(*heading_levels)} Section {section}")
+            for _ in range(rng.randint(*paragraphs)):
+                lines.append(" ".join(rng.choices(vocabulary, k=rng.randint(*words))) + ".")
+            if attachment_rate and rng.random() < attachment_rate:
+                lines.append(f"![photo](assets/photo_{i}_{section}.png)")
+        notes.append("\n".join(lines))
+    return notes
+
+
+def _measure_throughput(run: Callable[[], int], repeats: int = 3) -> float:
+    """Measure the best throughput of repeated runs.
+
+    Args:
+        run: Function that processes a workload and returns the number of items
+        repeats: Number of runs; the fastest counts, to damp scheduling noise
+
+    Returns:
+        Items processed per second
+    """
+    best = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        items = run()
+        best = max(best, items / (time.perf_counter() - start))
+    return best
+
+
+@pytest.fixture
+def generate_notes() -> Callable[..., list[str]]:
+    """Get a generator of reproducible markdown notes."""
+    return _generate_notes
+
+
+@pytest.fixture
+def measure_throughput() -> Callable[..., float]:
+    """Get a function that measures the best throughput of repeated runs."""
+    return _measure_throughput
+
+
+@pytest.fixture
+def benchmark_report(request: pytest.FixtureRequest) -> Callable[[str, dict[str, str]], None]:
+    """Get a function that records benchmark results.
+
+    Results are shown in the terminal summary, so they are visible without
+    disabling output capture, and are attached to the test's user properties.
+    """
+    reports = request.config.stash.setdefault(_REPORTS, [])
+
+    def report(title: str, rows: dict[str, str]) -> None:
+        reports.append((f"{request.node.name}: {title}", rows))
+        request.node.user_properties.extend(rows.items())
+
+    return report
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    """Show the benchmark results recorded during the session."""
+    reports = config.stash.get(_REPORTS, [])
+    if not reports:
+        return
+    terminalreporter.section("benchmark results")
+    for title, rows in reports:
+        terminalreporter.write_line(title)
+        width = max(map(len, rows), default=0)
+        for label, value in rows.items():
+            terminalreporter.write_line(f"  {label:<{width}}  {value}")
@@ -0,0 +1,62 @@
+"""Benchmark of memory held per chunk by chunk lists and the chunk store."""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from nova.vector_store.chunk_store import ChunkStore
+from nova.vector_store.chunking import Chunk, ChunkingEngine
+
+
+def _allocated(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Build a value and measure the memory it still holds afterwards."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, size
+
+
+def test_chunk_memory(
+    generate_notes: Callable[..., list[str]],
+    benchmark_report: Callable[[str, dict[str, str]], None],
+) -> None:
+    """Compare bytes per chunk for a list of chunks and for the chunk store."""
+    notes = generate_notes(2000, paragraphs=(1, 4), words=(5, 40), attachment_rate=0.3)
+    documents = [(text, Path(f"notes/note_{i}.md")) for i, text in enumerate(notes)]
+    engine = ChunkingEngine()
+
+    def chunk_list() -> list[Chunk]:
+        chunks = []
+        for text, source in documents:
+            chunks.extend(engine.chunk_document(text, source))
+        return chunks
+
+    def chunk_store() -> ChunkStore:
+        store = ChunkStore()
+        for text, source in documents:
+            store.extend(engine.chunk_document(text, source))
+        return store
+
+    chunks, list_bytes = _allocated(chunk_list)
+    count = len(chunks)
+    text_bytes = sum(len(chunk.text) for chunk in chunks)
+    del chunks
+    store, store_bytes = _allocated(chunk_store)
+    assert len(store) == count
+
+    benchmark_report(
+        f"holding {count} chunks ({text_bytes / count:.0f} characters of text each)",
+        {
+            "list[Chunk]": f"{list_bytes / count:.0f} bytes/chunk",
+            "ChunkStore": f"{store_bytes / count:.0f} bytes/chunk",
+        },
+    )
+    # The store must save at least a quarter of the memory of a chunk list
+    assert store_bytes < list_bytes * 3 / 4
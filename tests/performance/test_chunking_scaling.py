@@ -0,0 +1,42 @@
+"""Benchmark of chunking throughput against worker count."""
+
+import os
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from nova.vector_store.parallel_chunking import ParallelChunker
+
+
+def test_chunking_scaling(
+    generate_notes: Callable[..., list[str]],
+    measure_throughput: Callable[..., float],
+    benchmark_report: Callable[[str, dict[str, str]], None],
+) -> None:
+    """Compare chunks per second for increasing numbers of worker processes."""
+    notes = generate_notes(1000, sections=20)
+    documents: list[tuple[str, Path | None]] = [
+        (text, Path(f"notes/note_{i}.md")) for i, text in enumerate(notes)
+    ]
+    cpu_count = os.cpu_count() or 1
+    counts: dict[int, int] = {}
+
+    def chunk(workers: int) -> int:
+        results = ParallelChunker(workers=workers).chunk_many(documents)
+        counts[workers] = sum(len(result.chunks) for result in results)
+        return counts[workers]
+
+    rates = {
+        workers: measure_throughput(partial(chunk, workers), repeats=1)
+        for workers in sorted({1, 2, 4, cpu_count})
+    }
+
+    benchmark_report(
+        f"chunked {len(documents)} notes ({cpu_count} CPUs)",
+        {
+            f"{workers} workers": f"{rate:.0f} chunks/s ({rate / rates[1]:.2f}x)"
+            for workers, rate in rates.items()
+        },
+    )
+    # Every worker count produces the same chunks
+    assert len(set(counts.values())) == 1
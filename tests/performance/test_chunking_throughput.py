@@ -0,0 +1,30 @@
+"""Benchmark of chunking throughput."""
+
+from collections.abc import Callable
+
+from nova.vector_store.chunking import ChunkingEngine
+from tests.vector_store.legacy_chunking import LegacyChunkingEngine
+
+
+def test_chunking_throughput(
+    generate_notes: Callable[..., list[str]],
+    measure_throughput: Callable[..., float],
+    benchmark_report: Callable[[str, dict[str, str]], None],
+) -> None:
+    """Compare the chunks per second of the single-pass and legacy engines."""
+    notes = generate_notes(500, sections=8, heading_levels=(1, 3))
+
+    def chunk(engine: ChunkingEngine | LegacyChunkingEngine) -> Callable[[], int]:
+        return lambda: sum(len(engine.chunk_document(note)) for note in notes)
+
+    legacy = measure_throughput(chunk(LegacyChunkingEngine()))
+    single_pass = measure_throughput(chunk(ChunkingEngine()))
+
+    benchmark_report(
+        f"chunked {len(notes)} notes",
+        {
+            "legacy": f"{legacy:.0f} chunks/s",
+            "single-pass": f"{single_pass:.0f} chunks/s ({single_pass / legacy:.2f}x)",
+        },
+    )
+    assert single_pass > legacy
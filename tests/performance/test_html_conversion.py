@@ -0,0 +1,65 @@
+"""Benchmark of in-process HTML conversion against pandoc."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pypandoc
+import pytest
+
+from nova.docling.document_converter import DocumentConverter
+
+CLIP_COUNT = 50
+
+
+@pytest.fixture
+def html_clips(tmp_path: Path) -> list[Path]:
+    """Create web clips to convert."""
+    clips = []
+    for i in range(CLIP_COUNT):
+        clip = tmp_path / f"clip_{i}.html"
+        paragraphs = "".join(
+            f"<p>Paragraph {j} of clip {i} with <em>emphasis</em> and "
+            f'<a href="https://example.com/{i}/{j}">a link</a>.</p>'
+            for j in range(20)
+        )
+        clip.write_text(
+            f"<html><head><title>Clip {i}</title>"
+            f'<meta name="author" content="Author {i % 5}"></head>'
+            f"<body><h1>Clip {i}</h1>{paragraphs}</body></html>"
+        )
+        clips.append(clip)
+    return clips
+
+
+def test_html2text_vs_pandoc(
+    html_clips: list[Path],
+    measure_throughput: Callable[..., float],
+    benchmark_report: Callable[[str, dict[str, str]], None],
+) -> None:
+    """Compare html2text and pandoc conversion of the same clips."""
+    try:
+        pypandoc.get_pandoc_version()
+    except OSError:
+        pytest.skip("pandoc is not installed")
+
+    def convert(converter: DocumentConverter) -> Callable[[], int]:
+        return lambda: sum(1 for clip in html_clips if converter.convert(clip))
+
+    html2text_rate = measure_throughput(convert(DocumentConverter()), repeats=1)
+    pandoc_rate = measure_throughput(convert(DocumentConverter(use_pandoc=True)), repeats=1)
+
+    benchmark_report(
+        f"converted {len(html_clips)} HTML clips",
+        {
+            "html2text": f"{html2text_rate:.0f} files/s ({html2text_rate / pandoc_rate:.1f}x)",
+            "pandoc": f"{pandoc_rate:.0f} files/s",
+        },
+    )
+    # Converting in process avoids starting a pandoc process per file
+    assert html2text_rate > pandoc_rate
+
+    # Both backends must agree on the metadata extracted from each clip
+    for clip in html_clips[:3]:
+        in_process = DocumentConverter().convert(clip)
+        subprocess = DocumentConverter(use_pandoc=True).convert(clip)
+        assert in_process.metadata == subprocess.metadata
@@ -0,0 +1,49 @@
+"""Benchmark of character against token-aware chunking with the embedding model."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from nova.vector_store.chunking import ChunkingEngine
+from nova.vector_store.token_chunking import TokenChunkingEngine, TokenStats
+
+pytest.importorskip("sentence_transformers")
+
+from nova.vector_store.embedding import EmbeddingEngine
+
+_WORDS = (
+    "the quick brown fox jumps over lazy dog meeting project plan notes review "
+    "architecture deployment kubernetes retrospective #work #idea/next"
+).split()
+
+
+def test_token_chunking(
+    generate_notes: Callable[..., list[str]],
+    benchmark_report: Callable[[str, dict[str, str]], None],
+) -> None:
+    """Compare chunk counts, fill ratio, truncation and encode time of both modes."""
+    embedding_engine = EmbeddingEngine()
+    counter = embedding_engine.token_counter()
+    documents = generate_notes(
+        300, sections=(1, 8), paragraphs=(1, 8), words=(3, 80), vocabulary=_WORDS
+    )
+
+    stats: dict[str, TokenStats] = {}
+    rows: dict[str, str] = {}
+    for name, engine in [
+        ("characters", ChunkingEngine()),
+        ("tokens", TokenChunkingEngine(counter)),
+    ]:
+        chunks = [chunk for text in documents for chunk in engine.chunk_document(text)]
+        stats[name] = TokenStats.measure(chunks, counter)
+        start = time.perf_counter()
+        embedding_engine.embed_texts([chunk.text for chunk in chunks])
+        rows[name] = f"{stats[name]}, encoded in {time.perf_counter() - start:.2f}s"
+
+    benchmark_report(
+        f"chunked {len(documents)} notes for a limit of {counter.max_tokens} tokens", rows
+    )
+    assert stats["tokens"].truncated == 0
+    # Token windows are only split at the limit, so they need fewer chunks
+    assert stats["tokens"].chunks < stats["characters"].chunks
@@ -0,0 +1,52 @@
+"""Fixtures for vector store tests."""
+
+import random
+
+import pytest
+
+_WORDS = [
+    "alpha",
+    "beta",
+    "gamma.",
+    "done!",
+    "why?",
+    "#tag",
+    "#work/project",
+    "#1notatag",
+    "![photo](images/photo.png)",
+    "![clip](media/clip.mp4)",
+    "![doc](files/spec.pdf)",
+    "café",
+    "x" * 80,
+    "\t",
+]
+
+
+def _random_note(rng: random.Random) -> str:
+    """Generate a markdown note exercising the chunker's edge cases."""
+    lines = []
+    for _ in range(rng.randint(0, 40)):
+        kind = rng.random()
+        if kind < 0.15:
+            # Headings, with irregular spacing that the chunker normalizes
+            level = "#" * rng.randint(1, 4)
+            spacing = rng.choice(["", " ", "  ", "\t"])
+            title = " ".join(rng.choices(_WORDS, k=rng.randint(0, 4)))
+            lines.append(level + spacing + title + rng.choice(["", " "]))
+        elif kind < 0.25:
+            lines.append(rng.choice(["", " ", "\t", "  \r", "#"]))
+        elif kind < 0.3:
+            # Lines too long to split at sentence or line boundaries
+            lines.append("".join(rng.choices("abc ", k=rng.randint(300, 900))))
+        else:
+            line = " ".join(rng.choices(_WORDS, k=rng.randint(1, 60)))
+            lines.append(line + rng.choice(["", "", "", " ", "\r"]))
+    text = "\n".join(lines)
+    return text + rng.choice(["", "\n"])
+
+
+@pytest.fixture(scope="session")
+def chunking_corpus() -> list[str]:
+    """Create a deterministic corpus of markdown notes."""
+    rng = random.Random(20241016)
+    return [_random_note(rng) for _ in range(500)]
@@ -0,0 +1,97 @@
+"""Tests for search micro-batching."""
+
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from nova.vector_store.batching import SearchBatcher
+from nova.vector_store.executor import BoundedExecutor
+
+
+def _fake_search_many(queries: list[str], limit: int, where: Any = None) -> list[list[dict]]:
+    """Return ``limit`` fake results per query."""
+    return [[{"text": f"{query}-{i}"} for i in range(limit)] for query in queries]
+
+
+def _search_concurrently(batcher: SearchBatcher, requests: list[tuple[str, int]]) -> list[Any]:
+    """Run searches from one thread per request and collect the results."""
+    results: list[Any] = [None] * len(requests)
+
+    def run(index: int, query: str, limit: int) -> None:
+        try:
+            results[index] = batcher.search(query, limit=limit)
+        except Exception as e:
+            results[index] = e
+
+    threads = [
+        threading.Thread(target=run, args=(i, query, limit))
+        for i, (query, limit) in enumerate(requests)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+def test_concurrent_queries_share_a_batch() -> None:
+    """Test that concurrent queries run as one search_many call."""
+    store = MagicMock()
+    store.search_many.side_effect = _fake_search_many
+    batcher = SearchBatcher(store, max_wait=1.0, max_batch=3)
+
+    results = _search_concurrently(batcher, [("a", 1), ("b", 2), ("c", 3)])
+
+    store.search_many.assert_called_once()
+    assert sorted(store.search_many.call_args.args[0]) == ["a", "b", "c"]
+    assert store.search_many.call_args.kwargs["limit"] == 3
+    assert results == [
+        [{"text": "a-0"}],
+        [{"text": "b-0"}, {"text": "b-1"}],
+        [{"text": "c-0"}, {"text": "c-1"}, {"text": "c-2"}],
+    ]
+    assert batcher.get_stats()["avg_batch_size"] == 3
+
+
+def test_batch_errors_reach_every_caller() -> None:
+    """Test that a failing batch raises in every waiting caller."""
+    store = MagicMock()
+    store.search_many.side_effect = RuntimeError("query failed")
+    batcher = SearchBatcher(store, max_wait=1.0, max_batch=2)
+
+    results = _search_concurrently(batcher, [("a", 1), ("b", 1)])
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_invalid_settings() -> None:
+    """Test that invalid batching settings are rejected."""
+    with pytest.raises(ValueError):
+        SearchBatcher(MagicMock(), max_batch=0)
+
+
+def test_batch_size_is_independent_of_workers() -> None:
+    """Test that queued searches do not hold workers, so batches can exceed the pool."""
+    store = MagicMock()
+    store.search_many.side_effect = _fake_search_many
+    pool = BoundedExecutor(max_workers=1, max_queue=0)
+    batcher = SearchBatcher(store, max_wait=1.0, max_batch=10, executor=pool)
+    try:
+        futures = [batcher.submit(f"q{i}", limit=1) for i in range(10)]
+        results = [future.result(timeout=5) for future in futures]
+    finally:
+        pool.shutdown()
+
+    store.search_many.assert_called_once()
+    assert results == [[{"text": f"q{i}-0"}] for i in range(10)]
+
+
+def test_window_closes_after_max_wait() -> None:
+    """Test that a partial batch runs once its window closes."""
+    store = MagicMock()
+    store.search_many.side_effect = _fake_search_many
+    batcher = SearchBatcher(store, max_wait=0.01, max_batch=10)
+
+    assert batcher.search("alone", limit=1) == [{"text": "alone-0"}]
@@ -0,0 +1,68 @@
+"""Tests for the compact chunk store."""
+
+from pathlib import Path
+
+import pytest
+
+from nova.vector_store.chunk_store import ChunkStore
+from nova.vector_store.chunking import Chunk, ChunkingEngine
+
+
+def test_round_trip(chunking_corpus: list[str]) -> None:
+    """Test that chunks read back from the store equal the chunks added."""
+    engine = ChunkingEngine(min_chunk_size=10, max_chunk_size=100)
+    chunks = [
+        chunk
+        for i, text in enumerate(chunking_corpus[:100])
+        for chunk in engine.chunk_document(text, Path(f"notes/{i}.md"))
+    ]
+
+    store = ChunkStore(chunks)
+
+    assert len(store) == len(chunks)
+    assert list(store) == chunks
+    assert store[-1] == chunks[-1]
+    assert store.chunk_ids() == [chunk.chunk_id for chunk in chunks]
+    assert [chunk.to_metadata() for chunk in store] == [chunk.to_metadata() for chunk in chunks]
+
+
+def test_shared_values_are_stored_once() -> None:
+    """Test that sources, metadata and tag sets are shared between chunks."""
+    source = Path("notes/a.md")
+    text = "\n".join(f"# Section {i}\nBody #work #idea/next" for i in range(3))
+    store = ChunkStore(ChunkingEngine().chunk_document(text, source))
+
+    first, *rest = store
+    for chunk in rest:
+        assert chunk.source is first.source
+        assert chunk.document is first.document
+        assert chunk.tags == first.tags
+        assert chunk.tags is not first.tags
+        assert chunk.tags[0] is first.tags[0]
+
+
+def test_custom_chunk_ids() -> None:
+    """Test that IDs that are not 32-character hex strings are kept as is."""
+    ids = ["custom", "A" * 32, "g" * 32, "0" * 31]
+    store = ChunkStore(Chunk(text="Text", chunk_id=chunk_id) for chunk_id in ids)
+    assert store.chunk_ids() == ids
+
+
+def test_attachments() -> None:
+    """Test that attachments survive the store."""
+    chunk = Chunk(text="Image")
+    chunk.add_attachment("image", "photo.png")
+    chunk.add_attachment("pdf", "doc.pdf")
+    assert ChunkStore([chunk])[0].attachments == chunk.attachments
+
+
+def test_index_out_of_range() -> None:
+    """Test that positions outside the store are rejected."""
+    with pytest.raises(IndexError):
+        ChunkStore()[0]
+
+
+def test_deep_heading_level() -> None:
+    """Test that heading levels beyond a byte are stored."""
+    chunk = Chunk(text="Text", heading_text="Deep", heading_level=300)
+    assert ChunkStore([chunk])[0].heading_level == 300
@@ -1,6 +1,7 @@
 """Tests for the chunking engine."""
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -207,3 +208,53 @@ Final text with #tag3"""
     assert len(chunks[0].tags) == 3
     assert len(chunks[0].attachments) == 1
     assert "code block" in chunks[0].text
+
+
+def test_chunk_ids_are_deterministic():
+    """Test that chunk IDs are stable across runs and unique within a document."""
+    text = "# Title\nSame paragraph\n\n## Section\nSame paragraph"
+    engine = ChunkingEngine(min_chunk_size=1, max_chunk_size=20)
+    first = engine.chunk_document(text, source=Path("notes/a.md"))
+    second = ChunkingEngine(min_chunk_size=1, max_chunk_size=20).chunk_document(
+        text, source=Path("notes/a.md")
+    )
+    other = engine.chunk_document(text, source=Path("notes/b.md"))
+
+    ids = [chunk.chunk_id for chunk in first]
+    assert ids == [chunk.chunk_id for chunk in second]
+    assert len(set(ids)) == len(ids)
+    assert not set(ids) & {chunk.chunk_id for chunk in other}
+
+
+def test_document_metadata_is_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a document is stat'ed once and its metadata shared by its chunks."""
+    source = tmp_path / "note.md"
+    text = "\n".join(f"# Section {i}\nContent of section {i}" for i in range(5))
+    source.write_text(text)
+
+    stats: list[Path] = []
+    original_stat = Path.stat
+
+    def counting_stat(self: Path, *args: Any, **kwargs: Any) -> Any:
+        stats.append(self)
+        return original_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    chunks = ChunkingEngine().chunk_document(text, source=source)
+    metadata = [chunk.to_metadata() for chunk in chunks for _ in range(2)]
+
+    assert len(chunks) == 5
+    assert stats == [source]
+    assert all(chunk.document is chunks[0].document for chunk in chunks)
+    assert {m["document_size"] for m in metadata} == {len(text)}
+    assert {m["document_type"] for m in metadata} == {"md"}
+    assert {m["document_id"] for m in metadata} == {str(source)}
+
+
+def test_metadata_without_source() -> None:
+    """Test that a chunk without a source describes itself."""
+    chunk = Chunk(text="Loose text")
+    metadata = chunk.to_metadata()
+    assert metadata["document_id"] == chunk.chunk_id
+    assert metadata["document_type"] == "unknown"
+    assert metadata["document_size"] == len("Loose text")
@@ -0,0 +1,46 @@
+"""Tests that the single-pass chunker matches the engine it replaced."""
+
+from pathlib import Path
+
+import pytest
+
+from nova.vector_store.chunking import ChunkingEngine
+
+from .legacy_chunking import LegacyChunkingEngine
+
+
+def _describe(chunks: list) -> list[tuple]:
+    """Get the observable fields of chunks."""
+    return [
+        (c.text, c.heading_text, c.heading_level, c.tags, c.attachments, c.chunk_id) for c in chunks
+    ]
+
+
+@pytest.mark.parametrize("sizes", [(50, 512), (10, 50), (0, 30), (5, 100)])
+def test_matches_legacy_engine(chunking_corpus: list[str], sizes: tuple[int, int]) -> None:
+    """Test that every note of the corpus is chunked exactly as before."""
+    engine = ChunkingEngine(*sizes)
+    legacy = LegacyChunkingEngine(*sizes)
+    source = Path("notes/corpus.md")
+
+    for text in chunking_corpus:
+        assert _describe(engine.chunk_document(text, source)) == _describe(
+            legacy.chunk_document(text, source)
+        )
+
+
+def test_chunk_offsets(chunking_corpus: list[str]) -> None:
+    """Test that chunk offsets locate the chunks in the document."""
+    engine = ChunkingEngine()
+    text = "# Title\nFirst line\nSecond line\n\n## Next   \nBody #tag"
+    chunks = engine.chunk_document(text)
+
+    assert [text[c.start : c.end] for c in chunks] == [
+        "# Title\nFirst line\nSecond line",
+        "## Next   \nBody #tag",
+    ]
+    assert chunks[1].text == "## Next\nBody #tag"
+
+    for note in chunking_corpus:
+        for chunk in engine.chunk_document(note):
+            assert 0 <= chunk.start <= chunk.end <= len(note)
@@ -2,7 +2,7 @@
 
 import numpy as np
 
-from nova.vector_store.embedding import EmbeddingEngine
+from nova.vector_store.embedding import EmbeddingEngine, length_batches
 
 
 def test_embed_text_basic() -> None:
@@ -41,3 +41,30 @@ def test_embed_text_empty() -> None:
     assert isinstance(result.vector, np.ndarray)
     assert result.vector.dtype == np.float32
     assert result.vector.shape == (384,)
+
+
+def test_length_batches() -> None:
+    """Test that batches group texts by length within the token budget."""
+    lengths = [10, 120, 5, 128, 60, 60, 7, 300]
+    batches = length_batches(lengths, token_budget=256, max_batch_size=3)
+
+    assert sorted(index for batch in batches for index in batch) == list(range(len(lengths)))
+    order = [lengths[index] for batch in batches for index in batch]
+    assert order == sorted(lengths, reverse=True)
+    for batch in batches:
+        assert len(batch) <= 3
+        # Only a single text may exceed the budget
+        assert len(batch) == 1 or len(batch) * lengths[batch[0]] <= 256
+    assert batches[0] == [7]
+
+
+def test_embed_texts_keeps_order() -> None:
+    """Test that texts batched by length are returned in their original order."""
+    engine = EmbeddingEngine(token_budget=64)
+    texts = ["Short.", "A much longer text " * 20, "Medium length text here.", "Tiny"]
+
+    results = engine.embed_texts(texts)
+
+    assert [result.text for result in results] == texts
+    for text, result in zip(texts, results, strict=True):
+        np.testing.assert_allclose(result.vector, engine.embed_text(text).vector, atol=1e-5)
@@ -0,0 +1,48 @@
+"""Tests for the persistent embedding cache."""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from nova.vector_store.embedding import EmbeddingEngine
+from nova.vector_store.embedding_cache import EmbeddingCache
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    """Test that stored vectors are returned per model."""
+    cache = EmbeddingCache(tmp_path, "model-a")
+    vector = np.arange(4, dtype=np.float32)
+    cache.put_many(["hello"], [vector])
+
+    cached = EmbeddingCache(tmp_path, "model-a").get_many(["hello", "missing"])
+    assert cached[1] is None
+    np.testing.assert_array_equal(cached[0], vector)
+    assert EmbeddingCache(tmp_path, "model-b").get_many(["hello"]) == [None]
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_engine_only_encodes_misses(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the engine encodes each uncached text once."""
+    engine = EmbeddingEngine(cache=EmbeddingCache(tmp_path, EmbeddingEngine.MODEL_NAME))
+    encoded: list[str] = []
+    encode = engine.model.encode
+
+    def counting_encode(texts: list[str], **kwargs: Any) -> Any:
+        encoded.extend(texts)
+        return encode(texts, **kwargs)
+
+    monkeypatch.setattr(engine.model, "encode", counting_encode)
+
+    first = engine.embed_texts(["boilerplate", "note one", "boilerplate"])
+    assert encoded == ["boilerplate", "note one"]
+    np.testing.assert_array_equal(first[0].vector, first[2].vector)
+
+    second = engine.embed_texts(["note one", "note two"])
+    assert encoded == ["boilerplate", "note one", "note two"]
+    np.testing.assert_array_equal(first[1].vector, second[0].vector)
+    assert engine.embed_text("boilerplate").vector.shape == first[0].vector.shape
+    assert len(encoded) == 3
@@ -0,0 +1,42 @@
+"""Tests for the bounded executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from nova.vector_store.executor import BoundedExecutor, ExecutorSaturatedError
+
+
+def test_bounded_executor_rejects_when_full() -> None:
+    """Test that work beyond the worker and queue limits is rejected."""
+    pool = BoundedExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = pool.submit(release.wait)
+        queued = pool.submit(lambda: "queued")
+        with pytest.raises(ExecutorSaturatedError):
+            pool.submit(lambda: "rejected")
+        assert pool.get_stats()["rejected"] == 1
+
+        release.set()
+        assert running.result(timeout=5)
+        assert queued.result(timeout=5) == "queued"
+        assert pool.submit(lambda: "accepted").result(timeout=5) == "accepted"
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_bounded_executor_run() -> None:
+    """Test that run awaits the result without blocking the event loop."""
+    pool = BoundedExecutor(max_workers=2, max_queue=0)
+
+    async def main() -> list[int]:
+        return list(await asyncio.gather(pool.run(pow, 2, 3), pool.run(pow, 3, 2)))
+
+    try:
+        assert asyncio.run(main()) == [8, 9]
+        assert pool.get_stats()["pending"] == 0
+    finally:
+        pool.shutdown()
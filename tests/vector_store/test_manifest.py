@@ -0,0 +1,135 @@
+"""Tests for the incremental index manifest."""
+
+import os
+from pathlib import Path
+
+from nova.vector_store.manifest import IndexManifest, ManifestEntry, ManifestUpdate
+
+
+def _index(update: ManifestUpdate, path: Path, chunk_ids: list[str]) -> bool:
+    """Run a file through the update the way the ingest pipeline does."""
+    if not update.should_read(path):
+        return False
+    if not update.should_index(path.read_text(), path):
+        return False
+    update.track_chunks(path, chunk_ids)
+    update.record_batch(len(chunk_ids))
+    return True
+
+
+def test_manifest_round_trip(tmp_path: Path) -> None:
+    """Test that entries survive a save and reload."""
+    manifest = IndexManifest(tmp_path)
+    manifest.put("a.md", ManifestEntry(content_hash="abc", mtime=1.0, size=3, chunk_ids=["1"]))
+    manifest.save()
+
+    reloaded = IndexManifest(tmp_path)
+    assert reloaded.sources() == {"a.md"}
+    assert reloaded.get("a.md") == ManifestEntry("abc", 1.0, 3, ["1"])
+
+    reloaded.clear()
+    assert not (tmp_path / IndexManifest.FILENAME).exists()
+    assert len(IndexManifest(tmp_path)) == 0
+
+
+def test_manifest_ignores_corrupt_file(tmp_path: Path) -> None:
+    """Test that an unreadable manifest starts empty."""
+    (tmp_path / IndexManifest.FILENAME).write_text("{not json")
+    assert len(IndexManifest(tmp_path)) == 0
+
+
+def test_incremental_update(tmp_path: Path) -> None:
+    """Test that only changed, added and removed files are reported."""
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    unchanged = notes / "unchanged.md"
+    unchanged.write_text("same")
+    changed = notes / "changed.md"
+    changed.write_text("before")
+    removed = notes / "removed.md"
+    removed.write_text("gone soon")
+
+    manifest = IndexManifest(tmp_path)
+    update = ManifestUpdate(manifest)
+    for path, ids in ((unchanged, ["u1"]), (changed, ["c1", "c2"]), (removed, ["r1"])):
+        assert _index(update, path, ids)
+    assert update.finish() == []
+
+    changed.write_text("after, and longer")
+    removed.unlink()
+    added = notes / "added.md"
+    added.write_text("new")
+
+    update = ManifestUpdate(manifest, incremental=True)
+    assert not _index(update, unchanged, ["u1"])
+    assert _index(update, changed, ["c1", "c3"])
+    assert _index(update, added, ["a1"])
+    stale = update.finish()
+
+    assert sorted(stale) == ["c2", "r1"]
+    assert update.skipped == 1
+    assert manifest.get(os.path.abspath(changed)).chunk_ids == ["c1", "c3"]
+    assert os.path.abspath(removed) not in manifest.sources()
+
+
+def test_touched_file_is_skipped_by_hash(tmp_path: Path) -> None:
+    """Test that a file with a new mtime but the same content is not re-indexed."""
+    note = tmp_path / "note.md"
+    note.write_text("content")
+    manifest = IndexManifest(tmp_path)
+    update = ManifestUpdate(manifest)
+    _index(update, note, ["n1"])
+    update.finish()
+
+    os.utime(note, (1, 1))
+    update = ManifestUpdate(manifest, incremental=True)
+    assert update.should_read(note)
+    assert not update.should_index(note.read_text(), note)
+    assert update.finish() == []
+
+    # The refreshed stat lets the next run skip the read entirely
+    assert not ManifestUpdate(manifest, incremental=True).should_read(note)
+
+
+def test_failed_batch_forces_reindex(tmp_path: Path) -> None:
+    """Test that files in a failed batch are re-indexed on the next run."""
+    note = tmp_path / "note.md"
+    note.write_text("content")
+    manifest = IndexManifest(tmp_path)
+
+    update = ManifestUpdate(manifest, incremental=True)
+    assert update.should_index(note.read_text(), note)
+    update.track_chunks(note, ["n1"])
+    update.record_batch(1, failed=True)
+    assert update.finish() == []
+
+    update = ManifestUpdate(manifest, incremental=True)
+    assert update.should_read(note)
+    assert update.should_index(note.read_text(), note)
+
+
+def test_directories_share_a_store(tmp_path: Path) -> None:
+    """Test that indexing one directory never removes files of another."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for directory in (first, second):
+        directory.mkdir()
+        (directory / "note.md").write_text(f"note in {directory.name}")
+    manifest = IndexManifest(tmp_path / "store")
+
+    update = ManifestUpdate(manifest, root=first)
+    assert _index(update, first / "note.md", ["f1"])
+    assert update.finish() == []
+
+    # Neither a full nor an incremental run of the second directory prunes the first
+    for incremental in (False, True):
+        update = ManifestUpdate(manifest, incremental=incremental, root=second)
+        _index(update, second / "note.md", ["s1"])
+        assert update.finish() == []
+    assert len(manifest) == 2
+
+    # A full run only prunes when asked to
+    (first / "note.md").unlink()
+    assert ManifestUpdate(manifest, root=first).finish() == []
+    assert ManifestUpdate(manifest, root=first, prune=True).finish() == ["f1"]
+    assert manifest.sources() == {os.path.abspath(second / "note.md")}
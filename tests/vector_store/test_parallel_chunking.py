@@ -0,0 +1,40 @@
+"""Tests for parallel chunking."""
+
+from pathlib import Path
+
+import pytest
+
+from nova.vector_store.chunking import Chunk, ChunkingEngine
+from nova.vector_store.parallel_chunking import ParallelChunker
+
+
+def test_chunk_tuple_round_trip() -> None:
+    """Test that chunks survive conversion to and from their tuple form."""
+    source = Path("notes/a.md")
+    chunk = ChunkingEngine().chunk_document("# Title\nBody #tag ![p](p.png)", source)[0]
+    assert Chunk.from_tuple(chunk.to_tuple(), source, chunk.document) == chunk
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_serial_chunking(chunking_corpus: list[str], workers: int) -> None:
+    """Test that parallel chunking yields the serial chunks in input order."""
+    engine = ChunkingEngine(min_chunk_size=10, max_chunk_size=100)
+    documents = [(text, Path(f"notes/{i}.md")) for i, text in enumerate(chunking_corpus[:50])]
+
+    results = list(ParallelChunker(engine, workers=workers).chunk_many(documents))
+
+    assert [result.source for result in results] == [source for _, source in documents]
+    assert all(result.error is None for result in results)
+    assert [result.chunks for result in results] == [
+        engine.chunk_document(text, source) for text, source in documents
+    ]
+
+
+def test_failures_are_reported() -> None:
+    """Test that a failing document is reported without stopping the others."""
+    documents = [("First note", Path("a.md")), (42, Path("b.md")), ("Third", Path("c.md"))]
+
+    results = list(ParallelChunker(workers=2).chunk_many(documents))  # type: ignore[arg-type]
+
+    assert [result.error is None for result in results] == [True, False, True]
+    assert results[2].chunks[0].text == "Third"
@@ -0,0 +1,78 @@
+"""Tests for the streaming ingestion pipeline."""
+
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from nova.vector_store.pipeline import bounded_stage
+
+
+def test_bounded_stage_preserves_order() -> None:
+    """Test that items pass through a stage in order."""
+    assert list(bounded_stage(range(100), maxsize=4)) == list(range(100))
+
+
+def test_bounded_stage_chained() -> None:
+    """Test that stages can be chained."""
+    doubled = (i * 2 for i in bounded_stage(range(10), maxsize=2, name="first"))
+    assert list(bounded_stage(doubled, maxsize=3, name="second")) == [i * 2 for i in range(10)]
+
+
+def test_bounded_stage_bounds_buffer() -> None:
+    """Test that the producer never runs more than maxsize items ahead."""
+    produced = 0
+    lock = threading.Lock()
+
+    def producer() -> Iterator[int]:
+        nonlocal produced
+        for i in range(50):
+            with lock:
+                produced += 1
+            yield i
+
+    consumed = 0
+    for _ in bounded_stage(producer(), maxsize=5):
+        consumed += 1
+        with lock:
+            # Queue holds at most 5 items, plus one blocked in put()
+            assert produced - consumed <= 6
+    assert consumed == 50
+
+
+def test_bounded_stage_propagates_errors() -> None:
+    """Test that producer exceptions are raised in the consumer."""
+
+    def producer() -> Iterator[int]:
+        yield 1
+        raise RuntimeError("read failed")
+
+    stage = bounded_stage(producer())
+    assert next(stage) == 1
+    with pytest.raises(RuntimeError, match="read failed"):
+        next(stage)
+
+
+def test_bounded_stage_close_stops_producer() -> None:
+    """Test that closing the stage early stops and closes the producer."""
+    closed = threading.Event()
+
+    def producer() -> Iterator[int]:
+        try:
+            i = 0
+            while True:
+                yield i
+                i += 1
+        finally:
+            closed.set()
+
+    stage = bounded_stage(producer(), maxsize=2)
+    assert next(stage) == 0
+    stage.close()
+    assert closed.wait(timeout=5)
+
+
+def test_bounded_stage_invalid_size() -> None:
+    """Test that a non-positive queue size is rejected."""
+    with pytest.raises(ValueError):
+        list(bounded_stage([1], maxsize=0))
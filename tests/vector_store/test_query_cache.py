@@ -0,0 +1,27 @@
+"""Tests for the search query caches."""
+
+import pytest
+
+from nova.vector_store.query_cache import LRUCache
+
+
+def test_lru_eviction_and_stats() -> None:
+    """Test that the least recently used entry is evicted."""
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 2, "misses": 1}
+
+
+def test_lru_disabled() -> None:
+    """Test that a zero-sized cache stores nothing."""
+    cache: LRUCache[str, int] = LRUCache(0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    with pytest.raises(ValueError):
+        LRUCache(-1)
@@ -9,6 +9,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from nova.vector_store.chunking import Chunk
 from nova.vector_store.store import HealthData, VectorStore
 
 
@@ -95,3 +96,24 @@ def test_vector_store_health(temp_vector_dir: Path) -> None:
         assert health["repository"]["size_stats"]["max_size"] > 0
         assert health["repository"]["size_stats"]["avg_size"] > 0
         assert health["repository"]["size_stats"]["total_size"] > 0
+
+
+def test_health_stats_follow_deletes_and_full_scan(temp_vector_dir: Path) -> None:
+    """Test that maintained statistics track deletes and are repaired by a full scan."""
+    store = VectorStore(str(temp_vector_dir))
+    chunks = [Chunk(text=f"Note {i}", source=Path(f"notes/n{i}.md")) for i in range(4)]
+    for i, chunk in enumerate(chunks):
+        chunk.tags = [f"tag{i % 2}"]
+    store.add_chunks(chunks)
+    store.delete_chunks([chunks[0].chunk_id])
+
+    repository = store.check_health()["repository"]
+    assert repository["total_chunks"] == 3
+    assert repository["unique_sources"] == 3
+    assert repository["tags"]["total"] == 3
+
+    # Drifted statistics are rebuilt from the collection on request
+    store._stats.record([(chunks[1].chunk_id, "x", {"document_id": "bogus"})])
+    assert store.check_health()["repository"]["tags"]["total"] == 2
+    assert store.check_health(full_scan=True)["repository"]["tags"]["total"] == 3
+    assert store.check_health()["repository"]["tags"]["list"] == ["tag0", "tag1"]
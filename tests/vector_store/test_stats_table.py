@@ -0,0 +1,58 @@
+"""Tests for the incrementally maintained statistics table."""
+
+import json
+from pathlib import Path
+
+from nova.vector_store.stats_table import ChunkStatsTable
+
+
+def _metadata(source: str, doc_type: str, tags: list[str], date: str = "") -> dict:
+    """Build stored chunk metadata."""
+    return {
+        "document_id": source,
+        "document_type": doc_type,
+        "tags": json.dumps(tags),
+        "attachments": "{'type': 'image', 'path': 'a.png'}",
+        "date": date,
+    }
+
+
+def test_record_replace_and_remove(tmp_path: Path) -> None:
+    """Test that counters follow inserts, replacements and deletions."""
+    table = ChunkStatsTable(tmp_path)
+    table.record(
+        [
+            ("c1", "x" * 100, _metadata("a.md", "md", ["python", "code"], "2024-01-01")),
+            ("c2", "x" * 300, _metadata("a.md", "md", ["python"], "2024-03-01")),
+            ("c3", "x" * 50, _metadata("b.pdf", "pdf", [])),
+        ]
+    )
+    stats = table.repository_stats()
+    assert stats["total_chunks"] == 3
+    assert stats["unique_sources"] == 2
+    assert stats["file_types"] == {"md": 2, "pdf": 1}
+    assert stats["tags"] == {"total": 3, "unique": 2, "list": ["code", "python"]}
+    assert stats["attachment_types"] == {"image": 3}
+    assert stats["date_range"] == {"earliest": "2024-01-01", "latest": "2024-03-01"}
+    assert stats["size_stats"]["min_size"] == 50
+    assert stats["size_histogram"] == {"<=128": 2, "<=512": 1}
+
+    # Re-recording a chunk replaces its previous contribution
+    table.record([("c1", "x" * 10, _metadata("a.md", "md", ["rust"]))])
+    table.remove(["c3", "unknown"])
+
+    stats = ChunkStatsTable(tmp_path).repository_stats()
+    assert stats["total_chunks"] == 2
+    assert stats["file_types"] == {"md": 2}
+    assert stats["tags"] == {"total": 2, "unique": 2, "list": ["python", "rust"]}
+    assert stats["size_stats"]["total_size"] == 310
+
+
+def test_comma_separated_tags() -> None:
+    """Test that tags stored as comma-separated strings are counted."""
+    table = ChunkStatsTable()
+    table.record([("c1", "text", {"document_id": "a.md", "tags": "one, two"})])
+
+    assert table.repository_stats()["tags"]["list"] == ["one", "two"]
+    table.clear()
+    assert table.count() == 0
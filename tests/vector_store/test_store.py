@@ -0,0 +1,137 @@
+"""Tests for vector store ingestion."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from nova.vector_store.chunking import Chunk
+from nova.vector_store.stats_table import ChunkStatsTable
+from nova.vector_store.store import VectorStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Generator[VectorStore, None, None]:
+    """Create a vector store in a temporary directory."""
+    yield VectorStore(str(tmp_path / "vectors"))
+
+
+def _make_chunks(count: int) -> list[Chunk]:
+    """Create test chunks from a few fake source files."""
+    return [
+        Chunk(text=f"Sample text number {i}", source=Path(f"notes/note_{i % 3}.md"))
+        for i in range(count)
+    ]
+
+
+def test_add_chunks_batches(store: VectorStore) -> None:
+    """Test that chunks are embedded and inserted in batches."""
+    seen: list[int] = []
+    timings = store.add_chunks(
+        _make_chunks(25), batch_size=10, on_batch=lambda t: seen.append(t["batch"])
+    )
+
+    assert [t["size"] for t in timings] == [10, 10, 5]
+    assert seen == [1, 2, 3]
+    for timing in timings:
+        assert "error" not in timing
+        assert timing["total_time"] >= timing["embed_time"] + timing["insert_time"]
+    assert store._collection.count() == 25
+
+
+def test_add_chunks_accepts_iterator(store: VectorStore) -> None:
+    """Test that chunks can be consumed lazily from a generator."""
+    timings = store.add_chunks((chunk for chunk in _make_chunks(7)), batch_size=3)
+
+    assert sum(t["size"] for t in timings) == 7
+    assert store._collection.count() == 7
+
+
+def test_add_chunks_empty(store: VectorStore) -> None:
+    """Test that adding no chunks produces no batches."""
+    assert store.add_chunks([]) == []
+
+
+def test_add_chunks_invalid_batch_size(store: VectorStore) -> None:
+    """Test that a non-positive batch size is rejected."""
+    with pytest.raises(ValueError):
+        store.add_chunks(_make_chunks(1), batch_size=0)
+
+
+def test_add_chunks_skips_unchanged(store: VectorStore) -> None:
+    """Test that re-adding stored chunks upserts without re-embedding them."""
+    chunks = _make_chunks(5)
+    store.add_chunks(chunks)
+    changed = Chunk(text="Edited text", source=chunks[0].source, chunk_id=chunks[0].chunk_id)
+
+    timings = store.add_chunks([changed, *chunks[1:]])
+
+    assert timings[0]["skipped"] == 4
+    assert store._collection.count() == 5
+    stored = store._collection.get(ids=[changed.chunk_id])
+    assert stored["documents"] == ["Edited text"]
+
+
+def test_rebuild_uses_embedding_cache(store: VectorStore) -> None:
+    """Test that re-adding cleared chunks is served from the embedding cache."""
+    chunks = _make_chunks(4)
+    store.add_chunks(chunks)
+    store.clear()
+    assert store.embedding_cache is not None
+    misses = store.embedding_cache.misses
+
+    store.add_chunks(chunks)
+
+    assert store.embedding_cache.misses == misses
+    assert store._collection.count() == 4
+
+
+def test_search_cache_invalidated_by_writes(store: VectorStore) -> None:
+    """Test that repeated searches are cached until the collection changes."""
+    store.add_chunks(_make_chunks(3))
+    first = store.search("Sample text", limit=2)
+    assert store.search("Sample text", limit=2) == first
+    stats = store.get_cache_stats()
+    assert stats["results"]["hits"] == 1
+    assert stats["query_embeddings"]["misses"] == 1
+
+    store.add_chunks([Chunk(text="Sample text", source=Path("notes/new.md"))])
+    results = store.search("Sample text", limit=2)
+
+    assert results[0]["text"] == "Sample text"
+    stats = store.get_cache_stats()
+    assert stats["results"]["hits"] == 1
+    assert stats["query_embeddings"]["hits"] == 1
+
+
+def test_search_many_matches_search(store: VectorStore) -> None:
+    """Test that a multi-query search returns the same results as single searches."""
+    store.add_chunks(_make_chunks(6))
+    queries = ["Sample text number 1", "Sample text number 4", "Sample text number 1"]
+
+    batched = store.search_many(queries, limit=2)
+    store._search_results.clear()
+
+    assert batched == [store.search(query, limit=2) for query in queries]
+
+
+def test_search_does_not_persist_queries(store: VectorStore) -> None:
+    """Test that query embeddings are kept out of the persistent cache."""
+    store.add_chunks(_make_chunks(3))
+    assert store.embedding_cache is not None
+    assert store.embedding_cache.cache_dir.is_relative_to(store.base_path)
+    cached = len(store.embedding_cache)
+
+    store.search("A query nobody will repeat")
+
+    assert len(store.embedding_cache) == cached
+
+
+def test_stats_table_is_opened_lazily(store: VectorStore) -> None:
+    """Test that constructing a store does not create the statistics database."""
+    stats_path = store.base_path / ChunkStatsTable.FILENAME
+    assert not stats_path.exists()
+
+    store.add_chunks(_make_chunks(1))
+
+    assert stats_path.exists()
@@ -0,0 +1,124 @@
+"""Tests for token-aware chunking."""
+
+import pickle
+import re
+from itertools import pairwise
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nova.vector_store.chunking import ChunkingEngine
+from nova.vector_store.parallel_chunking import ParallelChunker
+from nova.vector_store.token_chunking import TokenChunkingEngine, TokenCounter, TokenStats
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+class WordTokenizer:
+    """Tokenizer stand-in with one token per word or punctuation mark."""
+
+    def __call__(
+        self, text: str | list[str], return_offsets_mapping: bool = False, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Encode one text or a batch of texts."""
+        if isinstance(text, list):
+            return {"input_ids": [self(t)["input_ids"] for t in text]}
+        offsets = [match.span() for match in _TOKEN_PATTERN.finditer(text)]
+        encoding: dict[str, Any] = {"input_ids": list(range(len(offsets)))}
+        if return_offsets_mapping:
+            encoding["offset_mapping"] = offsets
+        return encoding
+
+
+@pytest.fixture
+def counter() -> TokenCounter:
+    """Create a token counter with a limit of 20 tokens."""
+    return TokenCounter(WordTokenizer(), max_tokens=20)
+
+
+def _sentences(count: int) -> str:
+    return " ".join(f"Sentence number {i} has a few words." for i in range(count))
+
+
+def test_short_sections_are_kept_whole(counter: TokenCounter) -> None:
+    """Test that sections within the limit match character chunking."""
+    text = "# Title\nShort body #tag\n## Sub\nMore text"
+    chunks = TokenChunkingEngine(counter).chunk_document(text)
+    assert chunks == ChunkingEngine().chunk_document(text)
+
+
+def test_windows_fit_the_limit(counter: TokenCounter) -> None:
+    """Test that long sections are split into windows within the token limit."""
+    text = "# Title\n" + _sentences(20)
+    chunks = TokenChunkingEngine(counter).chunk_document(text)
+
+    counts = counter.count([chunk.text for chunk in chunks])
+    assert len(chunks) > 1
+    assert max(counts) <= counter.max_tokens
+    # Windows end at sentences and cover the section without overlap
+    assert all(chunk.text.endswith(".") for chunk in chunks)
+    assert sum(counts) == counter.count([text])[0]
+    assert all(chunk.heading_text == "Title" for chunk in chunks)
+    for chunk in chunks:
+        assert text[chunk.start : chunk.end] == chunk.text
+
+
+def test_overlap(counter: TokenCounter) -> None:
+    """Test that consecutive windows share the overlap."""
+    text = " ".join(f"word{i}" for i in range(100))
+    chunks = TokenChunkingEngine(counter, overlap=5).chunk_document(text)
+
+    words = [chunk.text.split() for chunk in chunks]
+    assert all(len(w) <= counter.max_tokens for w in words)
+    for previous, current in pairwise(words):
+        assert previous[-5:] == current[:5]
+    assert words[-1][-1] == "word99"
+
+
+def test_invalid_overlap(counter: TokenCounter) -> None:
+    """Test that overlaps of half the limit or more are rejected."""
+    with pytest.raises(ValueError):
+        TokenChunkingEngine(counter, overlap=10)
+
+
+def test_long_words_are_cut(counter: TokenCounter) -> None:
+    """Test that text without word boundaries is still split."""
+    text = "-" * 50
+    chunks = TokenChunkingEngine(counter).chunk_document(text)
+    assert [len(chunk.text) for chunk in chunks] == [20, 20, 10]
+
+
+def test_stats(counter: TokenCounter) -> None:
+    """Test that truncation and fill ratio are measured against the limit."""
+    text = "# Title\n" + _sentences(20)
+    stats = TokenStats.measure(ChunkingEngine().chunk_document(text), counter)
+    assert stats.truncated > 0
+    assert stats.truncated_tokens == stats.tokens - stats.chunks * counter.max_tokens
+
+    stats = TokenStats.measure(TokenChunkingEngine(counter).chunk_document(text), counter)
+    assert stats.truncated == 0
+    assert 0.5 < stats.fill_ratio <= 1
+
+
+def test_combined_stats(counter: TokenCounter) -> None:
+    """Test that statistics measured in batches combine to those of all chunks."""
+    chunks = ChunkingEngine().chunk_document("# Title\n" + _sentences(20))
+    combined = TokenStats.combine(
+        TokenStats.measure(chunks[i : i + 2], counter) for i in range(0, len(chunks), 2)
+    )
+    whole = TokenStats.measure(chunks, counter)
+    assert combined == TokenStats(**{**vars(whole), "fill_ratio": pytest.approx(whole.fill_ratio)})
+
+
+def test_parallel_chunking(counter: TokenCounter) -> None:
+    """Test that the engine is shipped to worker processes."""
+    engine = TokenChunkingEngine(counter, overlap=2)
+    documents = [(_sentences(i), Path(f"notes/{i}.md")) for i in range(1, 10)]
+
+    results = list(ParallelChunker(engine, workers=2).chunk_many(documents))
+
+    assert pickle.loads(pickle.dumps(engine)).max_tokens == counter.max_tokens
+    assert [result.chunks for result in results] == [
+        engine.chunk_document(text, source) for text, source in documents
+    ]